@@ -7,14 +7,20 @@ from pathlib import Path
 
 from library_analyzer.cli._run_annotations import _run_annotations
 from library_analyzer.cli._run_api import _run_api_command
-from library_analyzer.cli._run_migrate import _run_migrate_command
+from library_analyzer.cli._run_convert import _run_convert_command
+from library_analyzer.cli._run_migrate import _run_migrate_chain_command, _run_migrate_command
+from library_analyzer.cli._run_migrate_benchmark import _run_migrate_benchmark_command
 from library_analyzer.cli._run_usages import _run_usages_command
 from library_analyzer.processing.api.docstring_parsing import DocstringStyle
+from library_analyzer.processing.migration.benchmark import SyntheticAPIConfig
 
 _API_COMMAND = "api"
 _USAGES_COMMAND = "usages"
 _ANNOTATIONS_COMMAND = "annotations"
 _MIGRATE_COMMAND = "migrate"
+_MIGRATE_CHAIN_COMMAND = "migrate-chain"
+_MIGRATE_BENCHMARK_COMMAND = "migrate-benchmark"
+_CONVERT_COMMAND = "convert"
 
 
 def cli() -> None:
@@ -23,13 +29,82 @@ def cli() -> None:
         logging.basicConfig(level=logging.INFO)
 
     if args.command == _API_COMMAND:
-        _run_api_command(args.package, args.src, args.out, args.docstyle)
+        _run_api_command(
+            args.package,
+            args.src,
+            args.out,
+            args.docstyle,
+            profile_file_path=args.profile,
+            formatted_code=args.formatted_code,
+            n_processes=args.processes,
+            compact=args.compact,
+            compress=args.compress,
+        )
     elif args.command == _USAGES_COMMAND:
-        _run_usages_command(args.package, args.client, args.out, args.processes, args.batchsize)
+        _run_usages_command(
+            args.package,
+            args.client,
+            args.out,
+            args.processes,
+            args.batchsize,
+            compact=args.compact,
+            compress=args.compress,
+        )
     elif args.command == _ANNOTATIONS_COMMAND:
-        _run_annotations(args.api, args.usages, args.out)
+        _run_annotations(
+            args.api,
+            args.usages,
+            args.out,
+            args.processes,
+            previous_usages_file_path=args.previous_usages,
+            previous_annotations_file_path=args.previous_annotations,
+            previous_api_file_path=args.previous_api,
+            compact=args.compact,
+            compress=args.compress,
+        )
     elif args.command == _MIGRATE_COMMAND:
-        _run_migrate_command(args.apiv1, args.annotations, args.apiv2, args.out)
+        _run_migrate_command(
+            args.apiv1,
+            args.annotations,
+            args.apiv2,
+            args.out,
+            args.processes,
+            profile_file_path=args.profile,
+            optimal_assignment=args.optimal_assignment,
+            similarity_cache_file_path=args.similarity_cache,
+        )
+    elif args.command == _MIGRATE_CHAIN_COMMAND:
+        _run_migrate_chain_command(
+            args.apis,
+            args.annotations,
+            args.out,
+            args.processes,
+            profile_file_path=args.profile,
+            optimal_assignment=args.optimal_assignment,
+            similarity_cache_file_path=args.similarity_cache,
+        )
+    elif args.command == _MIGRATE_BENCHMARK_COMMAND:
+        _run_migrate_benchmark_command(
+            args.out,
+            SyntheticAPIConfig(
+                modules=args.modules,
+                classes=args.classes,
+                methods_per_class=args.methods_per_class,
+                functions=args.functions,
+                parameters_per_function=args.parameters_per_function,
+                docstring_words=args.docstring_words,
+                rename_rate=args.rename_rate,
+                move_rate=args.move_rate,
+                delete_rate=args.delete_rate,
+                annotation_rate=args.annotation_rate,
+                seed=args.seed,
+            ),
+            args.processes,
+            args.optimal_assignment,
+            args.repetitions,
+        )
+    elif args.command == _CONVERT_COMMAND:
+        _run_convert_command(args.input, args.out, args.compact, args.compress)
 
 
 def _get_args() -> argparse.Namespace:
@@ -42,6 +117,9 @@ def _get_args() -> argparse.Namespace:
     _add_usages_subparser(subparsers)
     _add_annotations_subparser(subparsers)
     _add_migrate_subparser(subparsers)
+    _add_migrate_chain_subparser(subparsers)
+    _add_migrate_benchmark_subparser(subparsers)
+    _add_convert_subparser(subparsers)
 
     return parser.parse_args()
 
@@ -73,6 +151,26 @@ def _add_api_subparser(subparsers: _SubParsersAction) -> None:
         required=False,
         default=DocstringStyle.PLAINTEXT.name,
     )
+    api_parser.add_argument(
+        "--profile",
+        help="File to write the wall time, call counts and peak memory of each phase and module to (JSON).",
+        type=Path,
+        required=False,
+        default=None,
+    )
+    api_parser.add_argument(
+        "--formatted-code",
+        help="Also store the code of classes and functions formatted with black. Speeds up the 'migrate' command.",
+        action="store_true",
+    )
+    api_parser.add_argument(
+        "--processes",
+        help="How many processes should be spawned to format the code with --formatted-code.",
+        type=int,
+        required=False,
+        default=1,
+    )
+    _add_json_output_options(api_parser)
 
 
 def _add_usages_subparser(subparsers: _SubParsersAction) -> None:
@@ -105,6 +203,7 @@ def _add_usages_subparser(subparsers: _SubParsersAction) -> None:
         required=False,
         default=100,
     )
+    _add_json_output_options(usages_parser)
     usages_parser.add_argument("-o", "--out", help="Output directory.", type=Path, required=True)
 
 
@@ -124,6 +223,35 @@ def _add_annotations_subparser(subparsers: _SubParsersAction) -> None:
         type=Path,
         required=True,
     )
+    generate_parser.add_argument(
+        "--processes",
+        help="How many processes should be spawned to run the annotation generators.",
+        type=int,
+        required=False,
+        default=1,
+    )
+    generate_parser.add_argument(
+        "--previous-usages",
+        help=(
+            "File created by the 'usages' command for a previous run. Together with --previous-annotations, only the"
+            " annotations whose usages changed are regenerated. Cannot be combined with --processes."
+        ),
+        type=Path,
+        required=False,
+    )
+    generate_parser.add_argument(
+        "--previous-annotations",
+        help="File created by the 'annotations' command from the previous usages.",
+        type=Path,
+        required=False,
+    )
+    generate_parser.add_argument(
+        "--previous-api",
+        help="File created by the 'api' command for the previous run. Only needed if the API changed since then.",
+        type=Path,
+        required=False,
+    )
+    _add_json_output_options(generate_parser)
     generate_parser.add_argument("-o", "--out", help="Output directory.", type=Path, required=True)
 
 
@@ -153,4 +281,162 @@ def _add_migrate_subparser(subparsers: _SubParsersAction) -> None:
         type=Path,
         required=True,
     )
+    _add_migrate_options(generate_parser)
+    generate_parser.add_argument("-o", "--out", help="Output directory.", type=Path, required=True)
+
+
+def _add_migrate_chain_subparser(subparsers: _SubParsersAction) -> None:
+    generate_parser = subparsers.add_parser(
+        _MIGRATE_CHAIN_COMMAND,
+        help="Migrate Annotations across several versions, e.g. from 1.0 over 1.1 to 1.2.",
+    )
+    generate_parser.add_argument(
+        "--apis",
+        help=(
+            "Files created by the 'api' command, from the oldest to the newest version. Each file is loaded only once."
+            " For each pair of consecutive versions, the migrated annotations and the mappings are written. Only the"
+            " reliably migrated annotations are migrated further."
+        ),
+        type=Path,
+        nargs="+",
+        required=True,
+    )
+    generate_parser.add_argument(
+        "-a",
+        "--annotations",
+        help="File that includes all annotations of the oldest version.",
+        type=Path,
+        required=True,
+    )
+    _add_migrate_options(generate_parser)
     generate_parser.add_argument("-o", "--out", help="Output directory.", type=Path, required=True)
+
+
+def _add_migrate_benchmark_subparser(subparsers: _SubParsersAction) -> None:
+    benchmark_parser = subparsers.add_parser(
+        _MIGRATE_BENCHMARK_COMMAND,
+        help="Measure the migration between two synthetic API versions. The same options measure the same migration.",
+    )
+    default_config = SyntheticAPIConfig()
+    for option, help_text in [
+        ("--modules", "How many modules the API has."),
+        ("--classes", "How many classes the API has."),
+        ("--methods-per-class", "How many methods each class has."),
+        ("--functions", "How many global functions the API has."),
+        ("--parameters-per-function", "How many parameters each function and method has."),
+        ("--docstring-words", "How many words each docstring has."),
+        ("--seed", "The seed of the random generator."),
+    ]:
+        benchmark_parser.add_argument(
+            option,
+            help=help_text,
+            type=int,
+            required=False,
+            default=getattr(default_config, option[2:].replace("-", "_")),
+        )
+    for option, help_text in [
+        ("--rename-rate", "The share of classes and global functions that are renamed in the new version."),
+        ("--move-rate", "The share of classes and global functions that are moved to another module."),
+        ("--delete-rate", "The share of classes and global functions that are deleted in the new version."),
+        ("--annotation-rate", "The share of classes, functions, and parameters that are annotated."),
+    ]:
+        benchmark_parser.add_argument(
+            option,
+            help=help_text,
+            type=float,
+            required=False,
+            default=getattr(default_config, option[2:].replace("-", "_")),
+        )
+    benchmark_parser.add_argument(
+        "--repetitions",
+        help="How often the migration is measured.",
+        type=int,
+        required=False,
+        default=1,
+    )
+    benchmark_parser.add_argument(
+        "--processes",
+        help="How many processes should be spawned to compute the similarities of API elements.",
+        type=int,
+        required=False,
+        default=1,
+    )
+    benchmark_parser.add_argument(
+        "--optimal-assignment",
+        help="Map the API elements by an optimal assignment instead of merging mappings greedily.",
+        action="store_true",
+    )
+    benchmark_parser.add_argument(
+        "-o",
+        "--out",
+        help="File to write the wall time and peak memory of each phase of each repetition to (JSON).",
+        type=Path,
+        required=True,
+    )
+
+
+def _add_convert_subparser(subparsers: _SubParsersAction) -> None:
+    convert_parser = subparsers.add_parser(
+        _CONVERT_COMMAND,
+        help=(
+            "Convert a JSON file created by another command to a binary artifact, which is smaller and faster to read,"
+            " or a binary artifact back to a JSON file."
+        ),
+    )
+    convert_parser.add_argument(
+        "-i",
+        "--input",
+        help="JSON file or binary artifact to convert. Binary artifacts are converted to JSON and vice versa.",
+        type=Path,
+        required=True,
+    )
+    _add_json_output_options(convert_parser)
+    convert_parser.add_argument("-o", "--out", help="Output file.", type=Path, required=True)
+
+
+def _add_json_output_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--compact",
+        help="Write the JSON output without indentation. Smaller and faster to write.",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--compress",
+        help="Compress the JSON output with gzip. The other commands read compressed files, too.",
+        action="store_true",
+    )
+
+
+def _add_migrate_options(generate_parser: argparse.ArgumentParser) -> None:
+    generate_parser.add_argument(
+        "--processes",
+        help="How many processes should be spawned to compute the similarities of API elements.",
+        type=int,
+        required=False,
+        default=4,
+    )
+    generate_parser.add_argument(
+        "--optimal-assignment",
+        help=(
+            "Map each API element to the element of the other version that maximizes the total similarity instead of"
+            " merging mappings greedily. Faster on large APIs and independent of the order of the elements."
+        ),
+        action="store_true",
+    )
+    generate_parser.add_argument(
+        "--similarity-cache",
+        help=(
+            "Database to store the similarities of API elements and their formatted code in. Later runs on the same"
+            " APIs reuse them. The hit rate of the similarities is reported in verbose mode."
+        ),
+        type=Path,
+        required=False,
+        default=None,
+    )
+    generate_parser.add_argument(
+        "--profile",
+        help="File to write the wall time, call counts and peak memory of each phase to (JSON).",
+        type=Path,
+        required=False,
+        default=None,
+    )
@@ -0,0 +1,30 @@
+from pathlib import Path
+from typing import TypeVar
+
+from library_analyzer.processing.annotations.model import AnnotationStore
+from library_analyzer.processing.api.model import API
+from library_analyzer.processing.usages.model import UsageCountStore
+from library_analyzer.utils import is_binary_artifact
+
+_Artifact = TypeVar("_Artifact", API, AnnotationStore, UsageCountStore)
+
+
+def _read_artifact(artifact_type: type[_Artifact], path: Path) -> _Artifact:
+    """
+    Read an artifact from a JSON file or from a binary artifact created by the 'convert' command.
+
+    Parameters
+    ----------
+    artifact_type : type[_Artifact]
+        The class of the artifact, e.g. API.
+    path : Path
+        The file to read from.
+
+    Returns
+    -------
+    artifact : _Artifact
+        The artifact.
+    """
+    if is_binary_artifact(path):
+        return artifact_type.from_binary_file(path)
+    return artifact_type.from_json_file(path)
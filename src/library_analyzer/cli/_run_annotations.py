@@ -1,16 +1,32 @@
 from pathlib import Path
 
-from library_analyzer.processing.annotations import generate_annotations
+from library_analyzer.cli._read_artifact import _read_artifact
+from library_analyzer.processing.annotations import generate_annotations, regenerate_annotations
+from library_analyzer.processing.annotations.model import AnnotationStore
 from library_analyzer.processing.api.model import API
 from library_analyzer.processing.usages.model import UsageCountStore
 
 
-def _run_annotations(api_file_path: Path, usages_file_path: Path, annotations_file_path: Path) -> None:
+def _run_annotations(
+    api_file_path: Path,
+    usages_file_path: Path,
+    annotations_file_path: Path,
+    n_processes: int = 1,
+    *,
+    previous_usages_file_path: Path | None = None,
+    previous_annotations_file_path: Path | None = None,
+    previous_api_file_path: Path | None = None,
+    compact: bool = False,
+    compress: bool = False,
+) -> None:
     """
     Generate an annotation file from the given API and UsageStore files, and write it to the given output file.
 
     Annotations that are generated are: remove, constant, required, optional, enum and boundary.
 
+    If the previous usages and the annotations generated from them are given, only the annotations whose inputs
+    changed are regenerated. The result is the same. The regeneration always runs in a single process.
+
     Parameters
     ----------
     api_file_path : Path
@@ -19,8 +35,36 @@ def _run_annotations(api_file_path: Path, usages_file_path: Path, annotations_fi
         UsageStore file Path
     annotations_file_path : Path
         Output file Path.
+    n_processes : int
+        How many processes run the annotation generators. Must be 1 if the previous usages are given.
+    previous_usages_file_path : Path | None
+        UsageStore file Path of the previous run
+    previous_annotations_file_path : Path | None
+        Annotation file Path of the previous run
+    previous_api_file_path : Path | None
+        API file Path of the previous run, if the API changed since then
+    compact : bool
+        Whether the annotations are written without indentation.
+    compress : bool
+        Whether the annotations are compressed with gzip.
     """
-    api = API.from_json_file(api_file_path)
-    usages = UsageCountStore.from_json_file(usages_file_path)
-    annotations = generate_annotations(api, usages)
-    annotations.to_json_file(annotations_file_path)
+    if (previous_usages_file_path is None) != (previous_annotations_file_path is None):
+        raise ValueError("The previous usages and the previous annotations must be given together.")
+    if previous_api_file_path is not None and previous_usages_file_path is None:
+        raise ValueError("The previous API can only be given together with the previous usages and annotations.")
+    if previous_usages_file_path is not None and n_processes != 1:
+        raise ValueError("The annotations are regenerated in a single process, so several processes cannot be used.")
+
+    api = _read_artifact(API, api_file_path)
+    usages = _read_artifact(UsageCountStore, usages_file_path)
+    if previous_usages_file_path is not None and previous_annotations_file_path is not None:
+        annotations = regenerate_annotations(
+            api,
+            usages,
+            _read_artifact(UsageCountStore, previous_usages_file_path),
+            _read_artifact(AnnotationStore, previous_annotations_file_path),
+            _read_artifact(API, previous_api_file_path) if previous_api_file_path is not None else None,
+        )
+    else:
+        annotations = generate_annotations(api, usages, n_processes)
+    annotations.to_json_file(annotations_file_path, compact, compress)
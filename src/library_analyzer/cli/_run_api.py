@@ -1,9 +1,11 @@
+import logging
 from pathlib import Path
 
-from library_analyzer.processing.api import get_api
+from library_analyzer.processing.api import format_api_code, get_api
 from library_analyzer.processing.api.docstring_parsing import DocstringStyle
 from library_analyzer.processing.api.purity_analysis import get_purity_results
 from library_analyzer.processing.dependencies import get_dependencies
+from library_analyzer.utils import Profiler, profile
 
 
 def _run_api_command(
@@ -11,6 +13,12 @@ def _run_api_command(
     src_dir_path: Path,
     out_dir_path: Path,
     docstring_style: DocstringStyle,
+    *,
+    profile_file_path: Path | None = None,
+    formatted_code: bool = False,
+    n_processes: int = 1,
+    compact: bool = False,
+    compress: bool = False,
 ) -> None:
     """
     List the API of a package.
@@ -25,17 +33,81 @@ def _run_api_command(
         The path to the output directory.
     docstring_style : DocstringStyle
         The style of docstrings that is used in the library.
+    profile_file_path : Path | None
+        If given, the phases of the command are profiled and the profile is written to this file.
+    formatted_code : bool
+        Whether the code of classes and functions is also stored formatted with black, so later commands do not format
+        it again.
+    n_processes : int
+        How many processes format the code of classes and functions.
+    compact : bool
+        Whether the API is written without indentation.
+    compress : bool
+        Whether the API is compressed with gzip. The file gets the extension '.json.gz' then.
     """
-    api = get_api(package, src_dir_path, docstring_style)
-    out_file_api = out_dir_path.joinpath(f"{package}__api.json")
-    api.to_json_file(out_file_api)
+    if profile_file_path is None:
+        _analyze_api(
+            package,
+            src_dir_path,
+            out_dir_path,
+            docstring_style,
+            formatted_code=formatted_code,
+            n_processes=n_processes,
+            compact=compact,
+            compress=compress,
+        )
+        return
 
-    api_dependencies = get_dependencies(api)
+    with Profiler() as profiler:
+        _analyze_api(
+            package,
+            src_dir_path,
+            out_dir_path,
+            docstring_style,
+            formatted_code=formatted_code,
+            n_processes=n_processes,
+            compact=compact,
+            compress=compress,
+        )
+    profiler.to_json_file(profile_file_path)
+
+    for phase, statistics in profiler.phases.items():
+        logging.info("Phase %s: %d calls, %.2fs", phase, statistics.calls, statistics.wall_time)
+    for phase in profiler.modules:
+        for module, statistics in profiler.slowest_modules(phase):
+            logging.info("Slowest modules of phase %s: %s (%.2fs)", phase, module, statistics.wall_time)
+
+
+def _analyze_api(
+    package: str,
+    src_dir_path: Path,
+    out_dir_path: Path,
+    docstring_style: DocstringStyle,
+    *,
+    formatted_code: bool,
+    n_processes: int,
+    compact: bool,
+    compress: bool,
+) -> None:
+    with profile("get_api"):
+        api = get_api(package, src_dir_path, docstring_style)
+    if formatted_code:
+        with profile("format_code"):
+            format_api_code([api], processes=n_processes)
+    out_file_api = out_dir_path.joinpath(f"{package}__api.json{'.gz' if compress else ''}")
+    with profile("write_json", out_file_api.name):
+        api.to_json_file(out_file_api, compact, compress)
+
+    with profile("get_dependencies"):
+        api_dependencies = get_dependencies(api)
     out_file_api_dependencies = out_dir_path.joinpath(f"{package}__api_dependencies.json")
-    api_dependencies.to_json_file(out_file_api_dependencies)
+    with profile("write_json", out_file_api_dependencies.name):
+        api_dependencies.to_json_file(out_file_api_dependencies)
 
-    api_purity = get_purity_results(src_dir_path)
+    with profile("get_purity_results"):
+        api_purity = get_purity_results(src_dir_path)
     out_file_api_purity = out_dir_path.joinpath(f"{package}__api_purity.json")
-    api_purity.to_json_file(
-        out_file_api_purity,
-    )  # Shorten is set to True by default, therefore the results will only contain the count of each reason.
+    with profile("write_json", out_file_api_purity.name):
+        api_purity.to_json_file(
+            out_file_api_purity,
+        )  # Shorten is set to True by default, therefore the results will only contain the count of each reason.
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from library_analyzer.utils import (
+    is_binary_artifact,
+    read_binary_artifact,
+    read_json_file,
+    write_binary_artifact,
+    write_json_file,
+)
+
+
+def _run_convert_command(
+    in_file_path: Path,
+    out_file_path: Path,
+    compact: bool = False,
+    compress: bool = False,
+) -> None:
+    """
+    Convert a JSON file created by another command to a binary artifact, or a binary artifact back to a JSON file.
+
+    The content stays the same, so any file created by another command can be converted, e.g. API, usage, annotation
+    or purity files. All commands that read API, usage, or annotation files also read binary artifacts.
+
+    Parameters
+    ----------
+    in_file_path : Path
+        The JSON file or binary artifact to convert.
+    out_file_path : Path
+        The file to write the binary artifact or JSON file to.
+    compact : bool
+        Whether the JSON file is written without indentation.
+    compress : bool
+        Whether the JSON file is compressed with gzip.
+    """
+    if is_binary_artifact(in_file_path):
+        write_json_file(out_file_path, read_binary_artifact(in_file_path), compact, compress)
+        return
+
+    if compact or compress:
+        raise ValueError("Only JSON files can be written compact or compressed.")
+    write_binary_artifact(out_file_path, read_json_file(in_file_path))
@@ -1,7 +1,11 @@
+import logging
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from library_analyzer.cli._read_artifact import _read_artifact
 from library_analyzer.processing.annotations.model import AnnotationStore
+from library_analyzer.processing.api import format_api_code
 from library_analyzer.processing.api.model import API
 from library_analyzer.processing.migration import Migration
 from library_analyzer.processing.migration.model import (
@@ -9,10 +13,12 @@ from library_analyzer.processing.migration.model import (
     APIMapping,
     InheritanceDiffer,
     Mapping,
+    SimilarityStore,
     SimpleDiffer,
     StrictDiffer,
     UnchangedDiffer,
 )
+from library_analyzer.utils import Profiler, ensure_file_exists, profile
 
 
 def _run_migrate_command(
@@ -20,11 +26,204 @@ def _run_migrate_command(
     annotations_file_path: Path,
     apiv2_file_path: Path,
     out_dir_path: Path,
+    n_processes: int = 1,
+    *,
+    profile_file_path: Path | None = None,
+    optimal_assignment: bool = False,
+    similarity_cache_file_path: Path | None = None,
 ) -> None:
-    apiv1 = API.from_json_file(apiv1_file_path)
-    apiv2 = API.from_json_file(apiv2_file_path)
-    annotationsv1 = AnnotationStore.from_json_file(annotations_file_path)
+    _run_with_similarity_store(
+        lambda similarity_store: _migrate(
+            apiv1_file_path,
+            annotations_file_path,
+            apiv2_file_path,
+            out_dir_path,
+            n_processes=n_processes,
+            optimal_assignment=optimal_assignment,
+            similarity_store=similarity_store,
+        ),
+        profile_file_path,
+        similarity_cache_file_path,
+    )
+
+
+def _run_migrate_chain_command(
+    api_file_paths: list[Path],
+    annotations_file_path: Path,
+    out_dir_path: Path,
+    n_processes: int = 1,
+    *,
+    profile_file_path: Path | None = None,
+    optimal_assignment: bool = False,
+    similarity_cache_file_path: Path | None = None,
+) -> None:
+    """
+    Migrate annotations across a chain of versions, e.g. from 1.0 over 1.1 to 1.2.
+
+    Each API file is loaded and its code is formatted only once. The features that the SimpleDiffer extracts from a
+    version are reused for the migration out of it. The annotations that are migrated reliably are migrated further,
+    the others are written for the version they were migrated to. For each migration, the mappings are written as a
+    table as well.
+
+    Parameters
+    ----------
+    api_file_paths : list[Path]
+        the API files of the versions, from the oldest to the newest one
+    annotations_file_path : Path
+        the annotations of the oldest version
+    out_dir_path : Path
+        the directory to write the migrated annotations and the mappings to
+    n_processes : int
+        how many processes compute the similarities of API elements
+    profile_file_path : Path | None
+        if given, the phases of the migration are profiled and the profile is written to this file
+    optimal_assignment : bool
+        whether the API elements are mapped by an optimal assignment instead of merging mappings greedily
+    similarity_cache_file_path : Path | None
+        if given, the similarities and the formatted code are stored in and reused from this database
+    """
+    if len(api_file_paths) < 2:
+        raise ValueError("A chain of migrations needs at least two API files.")
+    _run_with_similarity_store(
+        lambda similarity_store: _migrate_chain(
+            api_file_paths,
+            annotations_file_path,
+            out_dir_path,
+            n_processes=n_processes,
+            optimal_assignment=optimal_assignment,
+            similarity_store=similarity_store,
+        ),
+        profile_file_path,
+        similarity_cache_file_path,
+    )
+
+
+def _run_with_similarity_store(
+    migrate: Callable[[SimilarityStore | None], None],
+    profile_file_path: Path | None,
+    similarity_cache_file_path: Path | None,
+) -> None:
+    similarity_store = SimilarityStore(similarity_cache_file_path) if similarity_cache_file_path is not None else None
+    if profile_file_path is None:
+        migrate(similarity_store)
+    else:
+        with Profiler() as profiler:
+            migrate(similarity_store)
+        profiler.to_json_file(profile_file_path)
+        _log_profile(profiler)
+
+    if similarity_store is not None:
+        similarity_store.close()
+        statistics = similarity_store.statistics
+        logging.info(
+            "Similarity cache: %d of %d similarities found (%.1f%%)",
+            statistics.similarity_hits,
+            statistics.similarity_hits + statistics.similarity_misses,
+            statistics.similarity_hit_rate * 100,
+        )
+
+
+def _log_profile(profiler: Profiler) -> None:
+    for phase, statistics in profiler.phases.items():
+        logging.info(
+            "Phase %s: %d calls, %.2fs, peak memory %s bytes",
+            phase,
+            statistics.calls,
+            statistics.wall_time,
+            statistics.peak_memory,
+        )
+
+
+def _migrate(
+    apiv1_file_path: Path,
+    annotations_file_path: Path,
+    apiv2_file_path: Path,
+    out_dir_path: Path,
+    *,
+    n_processes: int,
+    optimal_assignment: bool,
+    similarity_store: SimilarityStore | None,
+) -> None:
+    apiv1 = _read_artifact(API, apiv1_file_path)
+    apiv2 = _read_artifact(API, apiv2_file_path)
+    annotationsv1 = _read_artifact(AnnotationStore, annotations_file_path)
+    _format_code([apiv1, apiv2], n_processes, similarity_store)
 
+    mappings, _ = _map_apis(
+        apiv1,
+        apiv2,
+        n_processes=n_processes,
+        optimal_assignment=optimal_assignment,
+        similarity_store=similarity_store,
+    )
+
+    migration = Migration(annotationsv1, mappings)
+    with profile("migrate_annotations"):
+        migration.migrate_annotations()
+    migration.print(apiv1, apiv2)
+    _write_migrated_annotations(migration, apiv2, out_dir_path)
+
+
+def _migrate_chain(
+    api_file_paths: list[Path],
+    annotations_file_path: Path,
+    out_dir_path: Path,
+    *,
+    n_processes: int,
+    optimal_assignment: bool,
+    similarity_store: SimilarityStore | None,
+) -> None:
+    annotations = _read_artifact(AnnotationStore, annotations_file_path)
+    apiv1 = _read_artifact(API, api_file_paths[0])
+    _format_code([apiv1], n_processes, similarity_store)
+    simple_differ: SimpleDiffer | None = None
+
+    for apiv2_file_path in api_file_paths[1:]:
+        apiv2 = _read_artifact(API, apiv2_file_path)
+        _format_code([apiv2], n_processes, similarity_store)
+        logging.info("Migrating annotations from version %s to version %s", apiv1.version, apiv2.version)
+
+        mappings, simple_differ = _map_apis(
+            apiv1,
+            apiv2,
+            n_processes=n_processes,
+            optimal_assignment=optimal_assignment,
+            similarity_store=similarity_store,
+            previous_simple_differ=simple_differ,
+        )
+
+        migration = Migration(annotations, mappings)
+        with profile("migrate_annotations"):
+            migration.migrate_annotations()
+        mappings_file = out_dir_path / f"mappingsv{apiv1.version}_v{apiv2.version}.md"
+        ensure_file_exists(mappings_file)
+        with mappings_file.open("w", encoding="utf-8") as file:
+            migration.print(apiv1, apiv2, file=file)
+        _write_migrated_annotations(migration, apiv2, out_dir_path)
+
+        annotations = migration.migrated_annotation_store
+        apiv1 = apiv2
+
+
+def _format_code(apis: list[API], n_processes: int, similarity_store: SimilarityStore | None) -> None:
+    with profile("format_code"):
+        formatted_count = format_api_code(
+            apis,
+            processes=n_processes,
+            cache_file_path=similarity_store.path if similarity_store is not None else None,
+        )
+    logging.info("Formatted %d distinct code blocks", formatted_count)
+
+
+def _map_apis(
+    apiv1: API,
+    apiv2: API,
+    *,
+    n_processes: int,
+    optimal_assignment: bool,
+    similarity_store: SimilarityStore | None,
+    previous_simple_differ: SimpleDiffer | None = None,
+) -> tuple[list[Mapping], SimpleDiffer | None]:
     threshold_of_similarity_for_creation_of_mappings = 0.61
     threshold_of_similarity_between_mappings = 0.23
 
@@ -35,37 +234,53 @@ def _run_migrate_command(
         unchanged_differ,
         threshold_of_similarity_for_creation_of_mappings,
         threshold_of_similarity_between_mappings,
+        processes=n_processes,
+        optimal_assignment=optimal_assignment,
     )
-    unchanged_mappings: list[Mapping] = api_mapping.map_api()
+    with profile("map_api", type(unchanged_differ).__name__):
+        unchanged_mappings: list[Mapping] = api_mapping.map_api()
     previous_mappings = unchanged_mappings
     previous_base_differ: AbstractDiffer | None = unchanged_differ
 
     differ_init_list: list[tuple[type[AbstractDiffer], dict[str, Any]]] = [
-        (SimpleDiffer, {}),
+        (SimpleDiffer, {"similarity_store": similarity_store}),
         (StrictDiffer, {"unchanged_mappings": unchanged_mappings}),
         (InheritanceDiffer, {}),
     ]
 
+    simple_differ: SimpleDiffer | None = None
     for differ_init in differ_init_list:
         differ_class, additional_parameters = differ_init
         differ = differ_class(previous_base_differ, previous_mappings, apiv1, apiv2, **additional_parameters)
+        if isinstance(differ, SimpleDiffer):
+            simple_differ = differ
+            if previous_simple_differ is not None:
+                simple_differ.reuse_features(previous_simple_differ)
         api_mapping = APIMapping(
             apiv1,
             apiv2,
             differ,
             threshold_of_similarity_for_creation_of_mappings,
             threshold_of_similarity_between_mappings,
+            processes=n_processes,
+            optimal_assignment=optimal_assignment,
         )
-        mappings = api_mapping.map_api()
+        with profile("map_api", differ_class.__name__):
+            mappings = api_mapping.map_api()
+        if api_mapping.pruned_pairs > 0:
+            logging.info(
+                "%s skipped %d pairs whose similarity could not reach the threshold",
+                differ_class.__name__,
+                api_mapping.pruned_pairs,
+            )
 
         previous_mappings = mappings
         previous_base_differ = differ if differ.is_base_differ() else differ.previous_base_differ
+    return previous_mappings, simple_differ
 
-    if previous_mappings is not None:
-        migration = Migration(annotationsv1, previous_mappings)
-        migration.migrate_annotations()
-        migration.print(apiv1, apiv2)
-        migrated_annotations_file = out_dir_path / f"migrated_annotationsv{apiv2.version}.json"
-        unsure_migrated_annotations_file = out_dir_path / f"unsure_migrated_annotationsv{apiv2.version}.json"
-        migration.migrated_annotation_store.to_json_file(migrated_annotations_file)
-        migration.unsure_migrated_annotation_store.to_json_file(unsure_migrated_annotations_file)
+
+def _write_migrated_annotations(migration: Migration, apiv2: API, out_dir_path: Path) -> None:
+    migrated_annotations_file = out_dir_path / f"migrated_annotationsv{apiv2.version}.json"
+    unsure_migrated_annotations_file = out_dir_path / f"unsure_migrated_annotationsv{apiv2.version}.json"
+    migration.migrated_annotation_store.to_json_file(migrated_annotations_file)
+    migration.unsure_migrated_annotation_store.to_json_file(unsure_migrated_annotations_file)
@@ -0,0 +1,125 @@
+import contextlib
+import json
+import logging
+import os
+import platform
+import tempfile
+import time
+from dataclasses import asdict, fields
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from library_analyzer.cli._run_migrate import _run_migrate_command
+from library_analyzer.processing.annotations.model import AnnotationStore
+from library_analyzer.processing.api.model import API
+from library_analyzer.processing.migration.benchmark import SyntheticAPIConfig, generate_synthetic_migration
+from library_analyzer.utils import ensure_file_exists
+
+
+def _run_migrate_benchmark_command(
+    out_file_path: Path,
+    config: SyntheticAPIConfig,
+    n_processes: int = 1,
+    optimal_assignment: bool = False,
+    repetitions: int = 1,
+) -> None:
+    """
+    Measure the migration of annotations between two synthetic API versions.
+
+    The APIs and annotations are generated from the configuration, so the same configuration measures the same
+    migration on every commit. Each repetition runs the 'migrate' command with profiling and records the wall time and
+    peak memory of each phase, e.g. of each differ, the merging of mappings, and the handling of duplicates. The results
+    are written as JSON.
+
+    Parameters
+    ----------
+    out_file_path : Path
+        the file to write the results to
+    config : SyntheticAPIConfig
+        the size of the APIs and how they differ
+    n_processes : int
+        how many processes compute the similarities of API elements
+    optimal_assignment : bool
+        whether the API elements are mapped by an optimal assignment instead of merging mappings greedily
+    repetitions : int
+        how often the migration is measured
+    """
+    if repetitions < 1:
+        raise ValueError("The migration must be measured at least once.")
+
+    apiv1, annotationsv1, apiv2 = generate_synthetic_migration(config)
+    result: dict[str, Any] = {
+        "config": asdict(config),
+        "environment": {
+            "library_analyzer": _get_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "processes": n_processes,
+            "optimal_assignment": optimal_assignment,
+        },
+        "apis": {"apiv1": _count_elements(apiv1), "apiv2": _count_elements(apiv2)},
+        "annotations": {"apiv1": _count_annotations(annotationsv1)},
+        "runs": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_path = Path(tmp_dir)
+        apiv1_file_path = tmp_path / "apiv1.json"
+        apiv2_file_path = tmp_path / "apiv2.json"
+        annotations_file_path = tmp_path / "annotations.json"
+        apiv1.to_json_file(apiv1_file_path)
+        apiv2.to_json_file(apiv2_file_path)
+        annotationsv1.to_json_file(annotations_file_path)
+
+        for repetition in range(repetitions):
+            out_dir_path = tmp_path / f"out{repetition}"
+            profile_file_path = tmp_path / f"profile{repetition}.json"
+            start_time = time.perf_counter()
+            # The table of mappings is not of interest here.
+            with Path(os.devnull).open("w") as devnull, contextlib.redirect_stdout(devnull):
+                _run_migrate_command(
+                    apiv1_file_path,
+                    annotations_file_path,
+                    apiv2_file_path,
+                    out_dir_path,
+                    n_processes,
+                    profile_file_path=profile_file_path,
+                    optimal_assignment=optimal_assignment,
+                )
+            wall_time = time.perf_counter() - start_time
+            with profile_file_path.open(encoding="utf-8") as profile_file:
+                profile = json.load(profile_file)
+            result["runs"].append({"wall_time": wall_time, "phases": profile["phases"], "modules": profile["modules"]})
+            logging.info("Run %d of %d: %.2fs", repetition + 1, repetitions, wall_time)
+
+        result["annotations"]["migrated"] = _count_annotations(
+            AnnotationStore.from_json_file(out_dir_path / f"migrated_annotationsv{apiv2.version}.json"),
+        )
+        result["annotations"]["unsure"] = _count_annotations(
+            AnnotationStore.from_json_file(out_dir_path / f"unsure_migrated_annotationsv{apiv2.version}.json"),
+        )
+
+    ensure_file_exists(out_file_path)
+    with out_file_path.open("w", encoding="utf-8") as out_file:
+        json.dump(result, out_file, indent=2)
+
+
+def _get_version() -> str | None:
+    try:
+        return version("library-analyzer")
+    except PackageNotFoundError:
+        return None
+
+
+def _count_elements(api: API) -> dict[str, int]:
+    return {
+        "classes": api.class_count(),
+        "functions": api.function_count(),
+        "parameters": api.parameter_count(),
+    }
+
+
+def _count_annotations(annotations: AnnotationStore) -> int:
+    return sum(len(getattr(annotations, field.name)) for field in fields(annotations) if field.init)
@@ -9,6 +9,9 @@ def _run_usages_command(
     out_dir_path: Path,
     n_processes: int,
     batch_size: int,
+    *,
+    compact: bool = False,
+    compress: bool = False,
 ) -> None:
     """
     Find usages of API elements.
@@ -25,7 +28,11 @@ def _run_usages_command(
         The number of processes to use.
     batch_size : int
         The batch size to use.
+    compact : bool
+        Whether the usages are written without indentation.
+    compress : bool
+        Whether the usages are compressed with gzip. The file gets the extension '.json.gz' then.
     """
     usages = find_usages(package, client_dir_path, n_processes, batch_size)
-    out_file_usage_count = out_dir_path.joinpath(f"{package}__usage_counts.json")
-    usages.to_json_file(out_file_usage_count)
+    out_file_usage_count = out_dir_path.joinpath(f"{package}__usage_counts.json{'.gz' if compress else ''}")
+    usages.to_json_file(out_file_usage_count, compact, compress)
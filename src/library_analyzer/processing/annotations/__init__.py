@@ -2,5 +2,6 @@
 
 from ._generate_annotations import generate_annotations
 from ._generate_dependency_annotations import _generate_dependency_annotations
+from ._regenerate_annotations import regenerate_annotations
 
-__all__ = ["generate_annotations", "_generate_dependency_annotations"]
+__all__ = ["generate_annotations", "regenerate_annotations", "_generate_dependency_annotations"]
@@ -1,7 +1,15 @@
+from collections.abc import Callable
+from collections.abc import Set as AbstractSet
+from multiprocessing import Pool
+from typing import Any
+
 from library_analyzer.processing.annotations._generate_boundary_annotations import (
     _generate_boundary_annotations,
 )
-from library_analyzer.processing.annotations._generate_dependency_annotations import _generate_dependency_annotations
+from library_analyzer.processing.annotations._generate_dependency_annotations import (
+    _extract_dependencies,
+    _generate_dependency_annotations,
+)
 from library_analyzer.processing.annotations._generate_enum_annotations import (
     _generate_enum_annotations,
 )
@@ -14,18 +22,130 @@ from library_analyzer.processing.annotations._generate_value_annotations import
 from library_analyzer.processing.annotations._usages_preprocessor import (
     _preprocess_usages,
 )
-from library_analyzer.processing.annotations.model import AnnotationStore
+from library_analyzer.processing.annotations.model import AnnotationStore, ValueAnnotation
+from library_analyzer.processing.api import Action, Condition
 from library_analyzer.processing.api.model import API
 from library_analyzer.processing.usages.model import UsageCountStore
 
 
-def generate_annotations(api: API, usages: UsageCountStore) -> AnnotationStore:
-    _preprocess_usages(usages, api)
+def generate_annotations(api: API, usages: UsageCountStore, processes: int = 1) -> AnnotationStore:
+    """
+    Generate annotations for the API based on how it is used.
+
+    The generators run as stages that get their inputs explicitly and return the annotations they create:
+
+    * remove and value annotations need the API and the preprocessed usages,
+    * enum and boundary annotations need the API and the IDs of the parameters with a constant annotation,
+    * the dependencies are extracted from the documentation of each function on its own.
+
+    With several processes, independent stages run concurrently and the extraction of dependencies is split into
+    shards of functions. The annotations of the stages are merged in a fixed order, so the result does not depend on
+    the number of processes.
+
+    Parameters
+    ----------
+    api : API
+        the API to annotate
+    usages : UsageCountStore
+        how often the API elements are used
+    processes : int
+        how many processes run the stages
+
+    Returns
+    -------
+    annotations : AnnotationStore
+        the generated annotations
+    """
+    usages = _preprocess_usages(usages, api)
+
+    if processes <= 1:
+        remove_annotations = _remove_stage(api, usages)
+        value_annotations = _value_stage(api, usages)
+        constant_parameter_ids = _get_constant_parameter_ids(value_annotations)
+        enum_annotations = _enum_stage(api, constant_parameter_ids)
+        boundary_annotations = _boundary_stage(api, constant_parameter_ids)
+        extracted_dependencies = _extract_dependencies(api.functions.values())
+    else:
+        function_ids = list(api.functions)
+        # Several shards per process balance the load, since functions differ in the length of their documentation.
+        shard_count = max(1, min(processes * 4, len(function_ids)))
+        shards = [function_ids[shard_index::shard_count] for shard_index in range(shard_count)]
+        with Pool(processes=processes, initializer=_initialize_stage_worker, initargs=[api, usages]) as pool:
+            # The cheap stages are submitted first, so they do not wait for the extraction of dependencies
+            remove_result = pool.apply_async(_run_usage_stage_in_worker, [_remove_stage])
+            value_result = pool.apply_async(_run_usage_stage_in_worker, [_value_stage])
+            dependency_results = pool.map_async(_extract_dependencies_in_worker, shards)
+
+            value_annotations = value_result.get()
+            constant_parameter_ids = _get_constant_parameter_ids(value_annotations)
+            enum_result = pool.apply_async(_run_type_stage_in_worker, [_enum_stage, constant_parameter_ids])
+            boundary_result = pool.apply_async(_run_type_stage_in_worker, [_boundary_stage, constant_parameter_ids])
+
+            remove_annotations = remove_result.get()
+            enum_annotations = enum_result.get()
+            boundary_annotations = boundary_result.get()
+            extracted_dependencies = {
+                parameter_id: dependencies
+                for shard_dependencies in dependency_results.get()
+                for parameter_id, dependencies in shard_dependencies.items()
+            }
 
+    annotations = AnnotationStore()
+    for stage_annotations in [remove_annotations, value_annotations, enum_annotations, boundary_annotations]:
+        annotations.merge_other_into_self(stage_annotations)
+    # Dependency annotations of one parameter can be extended by the dependencies of other functions, so they are
+    # created in the order of the functions
+    _generate_dependency_annotations(api, annotations, extracted_dependencies)
+    return annotations
+
+
+def _remove_stage(api: API, usages: UsageCountStore) -> AnnotationStore:
     annotations = AnnotationStore()
     _generate_remove_annotations(api, usages, annotations)
+    return annotations
+
+
+def _value_stage(api: API, usages: UsageCountStore) -> AnnotationStore:
+    annotations = AnnotationStore()
     _generate_value_annotations(api, usages, annotations)
-    _generate_enum_annotations(api, annotations)
-    _generate_boundary_annotations(api, annotations)
-    _generate_dependency_annotations(api, annotations)
     return annotations
+
+
+def _enum_stage(api: API, constant_parameter_ids: AbstractSet[str]) -> AnnotationStore:
+    annotations = AnnotationStore()
+    _generate_enum_annotations(api, constant_parameter_ids, annotations)
+    return annotations
+
+
+def _boundary_stage(api: API, constant_parameter_ids: AbstractSet[str]) -> AnnotationStore:
+    annotations = AnnotationStore()
+    _generate_boundary_annotations(api, constant_parameter_ids, annotations)
+    return annotations
+
+
+def _get_constant_parameter_ids(value_annotations: AnnotationStore) -> set[str]:
+    return set(value_annotations.get_value_annotation_targets(ValueAnnotation.Variant.CONSTANT))
+
+
+_worker_state: dict[str, Any] = {}
+
+
+def _initialize_stage_worker(api: API, usages: UsageCountStore) -> None:
+    _worker_state["api"] = api
+    _worker_state["usages"] = usages
+
+
+def _run_usage_stage_in_worker(stage: Callable[[API, UsageCountStore], AnnotationStore]) -> AnnotationStore:
+    return stage(_worker_state["api"], _worker_state["usages"])
+
+
+def _run_type_stage_in_worker(
+    stage: Callable[[API, AbstractSet[str]], AnnotationStore],
+    constant_parameter_ids: AbstractSet[str],
+) -> AnnotationStore:
+    return stage(_worker_state["api"], constant_parameter_ids)
+
+
+def _extract_dependencies_in_worker(function_ids: list[str]) -> dict[str, list[tuple[str, Condition, Action]]]:
+    functions = _worker_state["api"].functions
+    return _extract_dependencies(functions[function_id] for function_id in function_ids)
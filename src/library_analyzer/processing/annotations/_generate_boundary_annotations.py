@@ -1,16 +1,22 @@
+from collections.abc import Set as AbstractSet
+
 from library_analyzer.processing.annotations.model import (
     AnnotationStore,
     BoundaryAnnotation,
     EnumReviewResult,
     Interval,
-    ValueAnnotation,
 )
 from library_analyzer.processing.api.model import API, BoundaryType, UnionType
 
 from ._constants import autogen_author
 
 
-def _generate_boundary_annotations(api: API, annotations: AnnotationStore) -> None:
+def _generate_boundary_annotations(
+    api: API,
+    constant_parameter_ids: AbstractSet[str],
+    annotations: AnnotationStore,
+    parameter_ids: AbstractSet[str] | None = None,
+) -> None:
     """
     Annotates all parameters which are a boundary.
 
@@ -18,16 +24,19 @@ def _generate_boundary_annotations(api: API, annotations: AnnotationStore) -> No
     ----------
     api: API
         Description of the API
+    constant_parameter_ids: AbstractSet[str]
+        IDs of the parameters with a constant annotation, which get no boundary annotation
     annotations: AnnotationStore
         AnnotationStore, that holds all annotations.
+    parameter_ids: AbstractSet[str] | None
+        If given, only the parameters with these IDs are examined.
     """
     for _, parameter in api.parameters().items():
+        if parameter_ids is not None and parameter.id not in parameter_ids:
+            continue
+
         # Don't add boundary annotation to constant parameters
-        if parameter.id in {
-            annotation.target
-            for annotation in annotations.valueAnnotations
-            if annotation.variant == ValueAnnotation.Variant.CONSTANT
-        }:
+        if parameter.id in constant_parameter_ids:
             continue
 
         parameter_type = parameter.type
@@ -78,4 +87,4 @@ def _generate_boundary_annotations(api: API, annotations: AnnotationStore) -> No
                 interval=interval,
                 reviewResult=EnumReviewResult.NONE,
             )
-            annotations.boundaryAnnotations.append(boundary)
+            annotations.add_annotation(boundary)
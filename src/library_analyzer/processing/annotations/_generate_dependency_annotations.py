@@ -1,3 +1,6 @@
+from collections.abc import Iterable
+from collections.abc import Set as AbstractSet
+
 from library_analyzer.processing.annotations._constants import autogen_author
 from library_analyzer.processing.annotations.model import AnnotationStore, DependencyAnnotation, EnumReviewResult
 from library_analyzer.processing.api import (
@@ -173,25 +176,25 @@ def _add_properties_to_existing_dependency(
         Contains parameter_ids that represent dependencies to other parameters
 
     """
-    for annotation in annotations.dependencyAnnotations:
-        if annotation.target == target:
-            if is_depending_on is not None:
-                annotation.is_depending_on = is_depending_on
-                annotation.condition = cond if (cond is not None) else Condition()
-                annotation.action = act if (act is not None) else Action()
-                annotation.comment = (
-                    f"I turned this in a dependency because the phrase '{annotation.condition.condition}' was found."
-                )
-                break
-            else:
-                if param_id not in annotation.has_dependent_parameter:
-                    annotation.has_dependent_parameter.append(param_id)
-                break
+    existing_annotations = annotations.get_annotations_for_target(DependencyAnnotation, target)
+    if len(existing_annotations) == 0:
+        return
+
+    annotation = existing_annotations[0]
+    if is_depending_on is not None:
+        annotation.is_depending_on = is_depending_on
+        annotation.condition = cond if (cond is not None) else Condition()
+        annotation.action = act if (act is not None) else Action()
+        annotation.comment = (
+            f"I turned this in a dependency because the phrase '{annotation.condition.condition}' was found."
+        )
+    elif param_id not in annotation.has_dependent_parameter:
+        annotation.has_dependent_parameter.append(param_id)
 
 
 def _add_depending_on_dependencies(
     param_id: str,
-    dependency_targets: list[str],
+    dependency_targets: AbstractSet[str],
     is_depending_on: list[str],
     annotations: AnnotationStore,
 ) -> None:
@@ -203,7 +206,7 @@ def _add_depending_on_dependencies(
         Depender of the is_depending_on paramter
 
     dependency_targets
-        List of dependency annotation targets that have already been created
+        Targets of the dependency annotations that have already been created
 
     is_depending_on
         List of depending_on parameters for which a dependency is to be created
@@ -223,7 +226,37 @@ def _add_depending_on_dependencies(
             _add_properties_to_existing_dependency(dependee_id, annotations, param_id=param_id)
 
 
-def _generate_dependency_annotations(api: API, annotations: AnnotationStore) -> None:
+def _extract_dependencies(functions: Iterable[Function]) -> dict[str, list[tuple[str, Condition, Action]]]:
+    """Extract the dependencies from the documentation of the parameters of the given functions.
+
+    This is the expensive part of generating dependency annotations. Since each parameter is examined on its own, the
+    functions can be split into shards that are examined in parallel.
+
+    Parameters
+    ----------
+    functions
+        Functions whose parameters are examined
+
+    Returns
+    -------
+    dependencies
+        The dependencies of each parameter that has any, by parameter ID
+
+    """
+    dependencies = {}
+    for func in functions:
+        for param in func.parameters:
+            param_dependencies = extract_param_dependencies(param.qname, param.docstring.description)
+            if param_dependencies:
+                dependencies[param.id] = param_dependencies
+    return dependencies
+
+
+def _generate_dependency_annotations(
+    api: API,
+    annotations: AnnotationStore,
+    extracted_dependencies: dict[str, list[tuple[str, Condition, Action]]] | None = None,
+) -> None:
     """Generate the dependency annotations for the found dependencies.
 
     Parameters
@@ -234,16 +267,23 @@ def _generate_dependency_annotations(api: API, annotations: AnnotationStore) ->
     annotations
         AnnotationStore to which all dependency annotations will be added
 
+    extracted_dependencies
+        Dependencies of the parameters as returned by `_extract_dependencies`. If None, they are extracted from all
+        functions of the API.
+
     """
     init_func: Function | None
 
     functions = api.functions
+    dependency_targets = annotations.get_targets(DependencyAnnotation)
+    if extracted_dependencies is None:
+        extracted_dependencies = _extract_dependencies(functions.values())
 
     for func in functions.values():
         parameters = func.parameters
 
         for param in parameters:
-            dependencies = extract_param_dependencies(param.qname, param.docstring.description)
+            dependencies = extracted_dependencies.get(param.id, [])
 
             if dependencies:
                 for _, condition, action in dependencies:
@@ -282,8 +322,6 @@ def _generate_dependency_annotations(api: API, annotations: AnnotationStore) ->
                         has_dependent_parameter_id = _search_for_parameter(action.depender, parameters, init_func)
                         _add_dependency_parameter(has_dependent_parameter_id, has_dependent_parameter)
 
-                    dependency_targets = [annotation.target for annotation in annotations.dependencyAnnotations]
-
                     if is_depending_on or has_dependent_parameter:
                         if param.id not in dependency_targets:
                             annotation = _create_dependency_annotation(
@@ -293,7 +331,6 @@ def _generate_dependency_annotations(api: API, annotations: AnnotationStore) ->
                                 is_depending_on=is_depending_on,
                             )
                             annotations.add_annotation(annotation)
-                            dependency_targets.append(param.id)
 
                             _add_depending_on_dependencies(param.id, dependency_targets, is_depending_on, annotations)
 
@@ -1,31 +1,37 @@
 import re
+from collections.abc import Set as AbstractSet
 
 from library_analyzer.processing.annotations.model import (
     AnnotationStore,
     EnumAnnotation,
     EnumPair,
     EnumReviewResult,
-    ValueAnnotation,
 )
 from library_analyzer.processing.api.model import API, EnumType
 
 from ._constants import autogen_author
 
 
-def _generate_enum_annotations(api: API, annotations: AnnotationStore) -> None:
+def _generate_enum_annotations(
+    api: API,
+    constant_parameter_ids: AbstractSet[str],
+    annotations: AnnotationStore,
+    parameter_ids: AbstractSet[str] | None = None,
+) -> None:
     """
     Return all parameters that are never used.
 
     :param api: API object for usages
+    :param constant_parameter_ids: IDs of the parameters with a constant annotation, which get no enum annotation
     :param annotations: AnnotationStore object.
+    :param parameter_ids: If given, only the parameters with these IDs are examined.
     """
     for _, parameter in api.parameters().items():
+        if parameter_ids is not None and parameter.id not in parameter_ids:
+            continue
+
         # Don't add enum annotation to constant parameters
-        if parameter.id in {
-            annotation.target
-            for annotation in annotations.valueAnnotations
-            if annotation.variant == ValueAnnotation.Variant.CONSTANT
-        }:
+        if parameter.id in constant_parameter_ids:
             continue
 
         parameter_type = parameter.type
@@ -40,7 +46,7 @@ def _generate_enum_annotations(api: API, annotations: AnnotationStore) -> None:
 
         if len(pairs) > 0:
             enum_name = _enum_name(parameter.name)
-            annotations.enumAnnotations.append(
+            annotations.add_annotation(
                 EnumAnnotation(
                     target=parameter.id,
                     authors=[autogen_author],
@@ -1,3 +1,5 @@
+from collections.abc import Set as AbstractSet
+
 from library_analyzer.processing.annotations.model import (
     AnnotationStore,
     EnumReviewResult,
@@ -9,7 +11,12 @@ from library_analyzer.processing.usages.model import UsageCountStore
 from ._constants import autogen_author
 
 
-def _generate_remove_annotations(api: API, usages: UsageCountStore, annotations: AnnotationStore) -> None:
+def _generate_remove_annotations(
+    api: API,
+    usages: UsageCountStore,
+    annotations: AnnotationStore,
+    element_ids: AbstractSet[str] | None = None,
+) -> None:
     """
     Collect all functions and classes that are never used.
 
@@ -21,11 +28,16 @@ def _generate_remove_annotations(api: API, usages: UsageCountStore, annotations:
         UsageStore object
     annotations: AnnotationStore
         AnnotationStore, that holds all annotations.
+    element_ids: AbstractSet[str] | None
+        If given, only the classes and functions with these IDs are examined.
     """
     for class_ in api.classes.values():
+        if element_ids is not None and class_.id not in element_ids:
+            continue
+
         n_class_usages = usages.n_class_usages(class_.id)
         if n_class_usages == 0:
-            annotations.removeAnnotations.append(
+            annotations.add_annotation(
                 RemoveAnnotation(
                     target=class_.id,
                     authors=[autogen_author],
@@ -36,9 +48,12 @@ def _generate_remove_annotations(api: API, usages: UsageCountStore, annotations:
             )
 
     for function in api.functions.values():
+        if element_ids is not None and function.id not in element_ids:
+            continue
+
         n_function_usages = usages.n_function_usages(function.id)
         if n_function_usages == 0:
-            annotations.removeAnnotations.append(
+            annotations.add_annotation(
                 RemoveAnnotation(
                     target=function.id,
                     authors=[autogen_author],
@@ -1,5 +1,7 @@
+from collections.abc import Set as AbstractSet
 from typing import Any
 
+import numpy as np
 from scipy.stats import binom
 
 from library_analyzer.processing.annotations.model import (
@@ -18,21 +20,103 @@ from library_analyzer.utils import pluralize
 from ._constants import autogen_author
 
 
-def _generate_value_annotations(api: API, usages: UsageCountStore, annotations: AnnotationStore) -> None:
-    for parameter in api.parameters().values():
+def _generate_value_annotations(
+    api: API,
+    usages: UsageCountStore,
+    annotations: AnnotationStore,
+    parameter_ids: AbstractSet[str] | None = None,
+) -> None:
+    parameters = [
+        parameter
+        for parameter in api.parameters().values()
         # Don't create annotations for variadic parameters
-        if parameter.assigned_by in (
-            ParameterAssignment.POSITIONAL_VARARG,
-            ParameterAssignment.NAMED_VARARG,
-        ):
-            continue
+        if parameter.assigned_by not in (ParameterAssignment.POSITIONAL_VARARG, ParameterAssignment.NAMED_VARARG)
+        and (parameter_ids is None or parameter.id in parameter_ids)
+    ]
+    most_common_values = {parameter.id: usages.most_common_parameter_values(parameter.id) for parameter in parameters}
+    p_values = _compute_p_values(usages, most_common_values)
 
-        parameter_values = usages.most_common_parameter_values(parameter.id)
+    for parameter in parameters:
+        parameter_values = most_common_values[parameter.id]
 
         if len(parameter_values) == 1:
             _generate_constant_annotation(parameter, parameter_values[0], annotations)
         elif len(parameter_values) > 1:
-            _generate_required_or_optional_annotation(parameter, usages, annotations)
+            _generate_required_or_optional_annotation(
+                parameter,
+                parameter_values,
+                usages,
+                p_values,
+                annotations,
+            )
+
+
+def _compute_p_values(
+    usages: UsageCountStore,
+    most_common_values: dict[str, list[str]],
+) -> dict[str, float]:
+    """
+    Compute the p-values of the parameters that are optional if their most common value is significant.
+
+    The counts of all parameters are collected first, so the binomial tests are evaluated by a single vectorized call.
+
+    Parameters
+    ----------
+    usages: UsageCountStore
+        How often each parameter is set to each value
+    most_common_values: dict[str, list[str]]
+        The values of each parameter sorted by their count in descending order
+
+    Returns
+    -------
+    p_values: dict[str, float]
+        The p-value of each parameter whose most common value is a literal.
+    """
+    parameter_ids = []
+    most_common_value_counts = []
+    second_most_common_value_counts = []
+    for parameter_id, values in most_common_values.items():
+        if len(values) > 1 and _is_stringified_literal(values[0]):
+            parameter_ids.append(parameter_id)
+            most_common_value_counts.append(usages.n_value_usages(parameter_id, values[0]))
+            second_most_common_value_counts.append(usages.n_value_usages(parameter_id, values[1]))
+
+    p_values = _binomial_test_p_values(
+        np.array(most_common_value_counts, dtype=np.int64),
+        np.array(second_most_common_value_counts, dtype=np.int64),
+    )
+    return dict(zip(parameter_ids, p_values.tolist(), strict=True))
+
+
+def _binomial_test_p_values(
+    most_common_value_counts: np.ndarray,
+    second_most_common_value_counts: np.ndarray,
+) -> np.ndarray:
+    """
+    Compute the p-values of the binomial tests of many parameters at once.
+
+    Our null hypothesis is that the user chooses between the most common and second most common value by a fair coin
+    toss. The p-value is the probability that we observe results that are at least as extreme as the values we
+    observed, assuming the null hypothesis is true.
+
+    Parameters
+    ----------
+    most_common_value_counts: np.ndarray
+        How often the most common value of each parameter is used
+    second_most_common_value_counts: np.ndarray
+        How often the second most common value of each parameter is used
+
+    Returns
+    -------
+    p_values: np.ndarray
+        The p-value of each parameter.
+    """
+    # Precaution to ensure proper order of the counts
+    larger_counts = np.maximum(most_common_value_counts, second_most_common_value_counts)
+    totals = most_common_value_counts + second_most_common_value_counts
+
+    # The survival function at k - 1 is the probability to observe k or more successes
+    return 2 * binom.sf(larger_counts - 1, totals, 0.5)
 
 
 def _generate_constant_annotation(
@@ -54,7 +138,7 @@ def _generate_constant_annotation(
     """
     # Always set to original default value
     if sole_stringified_value == parameter.default_value:
-        annotations.valueAnnotations.append(
+        annotations.add_annotation(
             OmittedAnnotation(
                 target=parameter.id,
                 authors=[autogen_author],
@@ -68,7 +152,7 @@ def _generate_constant_annotation(
 
     default_value_type, default_value = _get_type_and_value_for_stringified_value(sole_stringified_value)
     if default_value_type is not None:
-        annotations.valueAnnotations.append(
+        annotations.add_annotation(
             ConstantAnnotation(
                 target=parameter.id,
                 authors=[autogen_author],
@@ -81,7 +165,7 @@ def _generate_constant_annotation(
             ),
         )
     else:
-        annotations.valueAnnotations.append(
+        annotations.add_annotation(
             RequiredAnnotation(
                 target=parameter.id,
                 authors=[autogen_author],
@@ -95,16 +179,17 @@ def _generate_constant_annotation(
 
 def _generate_required_or_optional_annotation(
     parameter: Parameter,
+    most_common_values: list[str],
     usages: UsageCountStore,
+    p_values: dict[str, float],
     annotations: AnnotationStore,
 ) -> None:
-    most_common_values = usages.most_common_parameter_values(parameter.id)
     if len(most_common_values) < 2:
         return
 
     # If the most common value is not a stringified literal, make parameter required
     if not _is_stringified_literal(most_common_values[0]):
-        annotations.valueAnnotations.append(
+        annotations.add_annotation(
             RequiredAnnotation(
                 target=parameter.id,
                 authors=[autogen_author],
@@ -126,9 +211,10 @@ def _generate_required_or_optional_annotation(
         most_common_value_count,
         most_common_values[1],
         second_most_common_value_count,
+        p_values[parameter.id],
     )
     if should_be_required:
-        annotations.valueAnnotations.append(
+        annotations.add_annotation(
             RequiredAnnotation(
                 target=parameter.id,
                 authors=[autogen_author],
@@ -143,7 +229,7 @@ def _generate_required_or_optional_annotation(
             default_value,
         ) = _get_type_and_value_for_stringified_value(most_common_values[0])
         if default_value_type is not None:  # Just for mypy, always true
-            annotations.valueAnnotations.append(
+            annotations.add_annotation(
                 OptionalAnnotation(
                     target=parameter.id,
                     authors=[autogen_author],
@@ -161,6 +247,7 @@ def _should_be_required(
     most_common_value_count: int,
     second_most_common_value: str,
     second_most_common_value_count: int,
+    p_value: float,
 ) -> tuple[bool, str]:
     """
     Determine whether the parameter should be required or optional.
@@ -175,6 +262,8 @@ def _should_be_required(
         The second most common value
     second_most_common_value_count: int
         How often the second most common value is used
+    p_value: float
+        The p-value of the binomial test of both counts, as computed by `_binomial_test_p_values`
 
     Returns
     -------
@@ -191,20 +280,9 @@ def _should_be_required(
             f"{second_most_common_value} are both used {pluralize(most_common_value_count, 'time')}).",
         )
 
-    # Precaution to ensure proper order of most_common_value_count and second_most_common_value_count
-    if second_most_common_value_count > most_common_value_count:
-        most_common_value_count, second_most_common_value_count = (
-            second_most_common_value_count,
-            most_common_value_count,
-        )
-
-    total = most_common_value_count + second_most_common_value_count
-
     # Our null hypothesis is that the user chooses between the most common and second most common value by a fair coin
     # toss. Unless this hypothesis is rejected, we make the parameter required. We reject the hypothesis if the p-value
-    # is less than or equal to 5%. The p-value is the probability that we observe results that are at least as extreme
-    # as the values we observed, assuming the null hypothesis is true.
-    p_value = 2 * sum(binom.pmf(i, total, 0.5) for i in range(most_common_value_count, total + 1))
+    # is less than or equal to 5%.
     significance_level = 0.05
 
     if p_value <= significance_level:
@@ -0,0 +1,167 @@
+from library_analyzer.processing.annotations._generate_boundary_annotations import (
+    _generate_boundary_annotations,
+)
+from library_analyzer.processing.annotations._generate_dependency_annotations import _generate_dependency_annotations
+from library_analyzer.processing.annotations._generate_enum_annotations import (
+    _generate_enum_annotations,
+)
+from library_analyzer.processing.annotations._generate_remove_annotations import (
+    _generate_remove_annotations,
+)
+from library_analyzer.processing.annotations._generate_value_annotations import (
+    _generate_value_annotations,
+)
+from library_analyzer.processing.annotations._usages_preprocessor import (
+    _preprocess_usages,
+)
+from library_analyzer.processing.annotations.model import (
+    AbstractAnnotation,
+    AnnotationStore,
+    BoundaryAnnotation,
+    EnumAnnotation,
+    RemoveAnnotation,
+    ValueAnnotation,
+)
+from library_analyzer.processing.api.model import API
+from library_analyzer.processing.usages.model import UsageCountStore
+from library_analyzer.utils import parent_id
+
+
+def regenerate_annotations(
+    api: API,
+    usages: UsageCountStore,
+    previous_usages: UsageCountStore,
+    previous_annotations: AnnotationStore,
+    previous_api: API | None = None,
+) -> AnnotationStore:
+    """
+    Update generated annotations to new usages by regenerating only the annotations whose inputs changed.
+
+    The remove annotation of a class or function is regenerated if its usage count changed. The value annotation of a
+    parameter is regenerated if the usage counts of the parameter, its values, or its function changed. The enum and
+    boundary annotations, which are derived from the documentation, are regenerated only for parameters that changed in
+    the API or that became or ceased to be constant. The dependency annotations are reused unless a function changed.
+    All other annotations are taken from the previous annotations.
+
+    The result equals the result of `generate_annotations` for the API and the new usages, provided that the previous
+    annotations were generated by `generate_annotations` from the previous API and usages.
+
+    Parameters
+    ----------
+    api : API
+        the API to annotate
+    usages : UsageCountStore
+        the new usages, as written by the 'usages' command
+    previous_usages : UsageCountStore
+        the usages the previous annotations were generated from, as written by the 'usages' command
+    previous_annotations : AnnotationStore
+        the annotations generated from the previous usages
+    previous_api : API | None
+        the API the previous annotations were generated from, if it differs from the given API
+
+    Returns
+    -------
+    annotations : AnnotationStore
+        the generated annotations
+    """
+    # The usages have to be compared before they are preprocessed, which adds the unused elements and default values
+    parameters = api.parameters()
+    changed_class_ids = {
+        class_id
+        for class_id in api.classes
+        if (previous_api is not None and class_id not in previous_api.classes)
+        or usages.n_class_usages(class_id) != previous_usages.n_class_usages(class_id)
+    }
+    changed_function_ids = {
+        function_id
+        for function_id in api.functions
+        if (previous_api is not None and function_id not in previous_api.functions)
+        or usages.n_function_usages(function_id) != previous_usages.n_function_usages(function_id)
+    }
+    changed_element_ids = changed_class_ids | changed_function_ids
+    previous_parameters = previous_api.parameters() if previous_api is not None else parameters
+    changed_parameter_ids = {
+        parameter_id
+        for parameter_id, parameter in parameters.items()
+        if previous_parameters.get(parameter_id) != parameter
+    }
+    parameter_ids_with_changed_usages = changed_parameter_ids | {
+        parameter_id
+        for parameter_id in parameters
+        if parent_id(parameter_id) in changed_function_ids
+        or usages.n_parameter_usages(parameter_id) != previous_usages.n_parameter_usages(parameter_id)
+        # The order of the values decides between values that are used equally often
+        or _get_value_counts(usages, parameter_id) != _get_value_counts(previous_usages, parameter_id)
+    }
+
+    usages = _preprocess_usages(usages, api)
+    regenerated_annotations = AnnotationStore()
+    _generate_remove_annotations(api, usages, regenerated_annotations, changed_element_ids)
+    _generate_value_annotations(api, usages, regenerated_annotations, parameter_ids_with_changed_usages)
+
+    annotations = AnnotationStore()
+    for element_id in [*api.classes, *api.functions]:
+        _copy_annotations(
+            RemoveAnnotation,
+            element_id,
+            regenerated_annotations if element_id in changed_element_ids else previous_annotations,
+            annotations,
+        )
+    for parameter_id in parameters:
+        _copy_annotations(
+            ValueAnnotation,
+            parameter_id,
+            regenerated_annotations if parameter_id in parameter_ids_with_changed_usages else previous_annotations,
+            annotations,
+        )
+
+    constant_parameter_ids = annotations.get_value_annotation_targets(ValueAnnotation.Variant.CONSTANT)
+    previous_constant_parameter_ids = previous_annotations.get_value_annotation_targets(
+        ValueAnnotation.Variant.CONSTANT,
+    )
+    parameter_ids_with_changed_types = changed_parameter_ids | {
+        parameter_id
+        for parameter_id in parameters
+        if (parameter_id in constant_parameter_ids) != (parameter_id in previous_constant_parameter_ids)
+    }
+    _generate_enum_annotations(api, constant_parameter_ids, regenerated_annotations, parameter_ids_with_changed_types)
+    _generate_boundary_annotations(
+        api,
+        constant_parameter_ids,
+        regenerated_annotations,
+        parameter_ids_with_changed_types,
+    )
+    annotation_types: list[type[AbstractAnnotation]] = [EnumAnnotation, BoundaryAnnotation]
+    for annotation_type in annotation_types:
+        for parameter_id in parameters:
+            _copy_annotations(
+                annotation_type,
+                parameter_id,
+                regenerated_annotations if parameter_id in parameter_ids_with_changed_types else previous_annotations,
+                annotations,
+            )
+
+    # A dependency annotation can combine the documentation of several functions, so they are reused only as a whole
+    if previous_api is None or list(previous_api.functions.items()) == list(api.functions.items()):
+        for dependency_annotation in previous_annotations.dependencyAnnotations:
+            annotations.add_annotation(dependency_annotation)
+    else:
+        _generate_dependency_annotations(api, annotations)
+
+    return annotations
+
+
+def _get_value_counts(usages: UsageCountStore, parameter_id: str) -> list[tuple[str, int]]:
+    if parameter_id not in usages.value_usages:
+        return []
+    return list(usages.value_usages[parameter_id].items())
+
+
+def _copy_annotations(
+    annotation_type: type[AbstractAnnotation],
+    target: str,
+    source: AnnotationStore,
+    destination: AnnotationStore,
+) -> None:
+    for annotation in source.get_annotations_for_target(annotation_type, target):
+        destination.add_annotation(annotation)
@@ -1,39 +1,24 @@
+from collections import Counter
+
 from library_analyzer.processing.api.model import API
 from library_analyzer.processing.usages.model import UsageCountStore
 from library_analyzer.utils import parent_id
 
 
-def _preprocess_usages(usages: UsageCountStore, api: API) -> None:
-    _add_unused_api_elements(usages, api)
-    _add_implicit_usages_of_default_value(usages, api)
-
-
-def _add_unused_api_elements(usages: UsageCountStore, api: API) -> None:
-    """
-    Add unused API elements to the UsageStore.
-
-    When a class, function or parameter is not used, it is not content of the UsageStore, so we need to add it.
-
-    :param usages: Usage store
-    :param api: Description of the API
+def _preprocess_usages(usages: UsageCountStore, api: API) -> UsageCountStore:
     """
-    for class_id in api.classes:
-        usages.add_class_usages(class_id, 0)
-
-    for function in api.functions.values():
-        usages.add_function_usages(function.id, 0)
-
-        for parameter in function.parameters:
-            usages.add_parameter_usages(parameter.id, 0)
-            usages.init_value(parameter.id)
+    Derive the usages the annotation generators work with from the usages found in client code.
 
+    The given usages are not changed, so they can be preprocessed again, e.g. for another run of the generators. The
+    derived usages additionally contain
 
-def _add_implicit_usages_of_default_value(usages: UsageCountStore, api: API) -> None:
-    """
-    Add the implicit usages of a parameters default value.
+    * the unused API elements: When a class, function or parameter is not used, it is not content of the UsageStore,
+      so we need to add it.
+    * the implicit usages of the default value of a parameter: When a function is called and a parameter is used with
+      its default value, that usage of a value is not part of the UsageStore, so we need to add it.
 
-    When a function is called and a parameter is used with its default value, that usage of a value is not part of the
-    UsageStore, so  we need to add it.
+    The unused API elements are added in a single pass over the API, which also builds an index of the function and
+    the default value of each parameter. The implicit usages of default values are then computed from this index.
 
     Parameters
     ----------
@@ -41,18 +26,50 @@ def _add_implicit_usages_of_default_value(usages: UsageCountStore, api: API) ->
         Usage store
     api : API
         Description of the API
+
+    Returns
+    -------
+    preprocessed_usages : UsageCountStore
+        The usages including the unused API elements and the implicit usages of default values.
     """
-    for parameter_id, parameter_usage_count in list(usages.parameter_usages.items()):
-        default_value = api.get_default_value(parameter_id)
+    preprocessed_usages = _copy_usages(usages)
+
+    for class_id in api.classes:
+        preprocessed_usages.add_class_usages(class_id, 0)
+
+    # The function ID and default value of each parameter, like API.get_default_value
+    default_values: dict[str, tuple[str, str | None]] = {}
+    for function in api.functions.values():
+        preprocessed_usages.add_function_usages(function.id, 0)
+
+        for parameter in function.parameters:
+            preprocessed_usages.add_parameter_usages(parameter.id, 0)
+            preprocessed_usages.init_value(parameter.id)
+            if parameter.id not in default_values and parent_id(parameter.id) == function.id:
+                default_values[parameter.id] = (function.id, parameter.default_value)
+
+    for parameter_id, (function_id, default_value) in default_values.items():
         if default_value is None:
             continue
 
-        function_id = parent_id(parameter_id)
-        function_usage_count = usages.n_function_usages(function_id)
-
+        function_usage_count = preprocessed_usages.n_function_usages(function_id)
+        parameter_usage_count = preprocessed_usages.n_parameter_usages(parameter_id)
         n_locations_of_implicit_usages_of_default_value = function_usage_count - parameter_usage_count
-        usages.add_value_usages(
+        preprocessed_usages.add_value_usages(
             parameter_id,
             default_value,
             n_locations_of_implicit_usages_of_default_value,
         )
+
+    return preprocessed_usages
+
+
+def _copy_usages(usages: UsageCountStore) -> UsageCountStore:
+    copied_usages = UsageCountStore()
+    copied_usages.class_usages = Counter(usages.class_usages)
+    copied_usages.function_usages = Counter(usages.function_usages)
+    copied_usages.parameter_usages = Counter(usages.parameter_usages)
+    copied_usages.value_usages = {
+        parameter_id: Counter(value_usages) for parameter_id, value_usages in usages.value_usages.items()
+    }
+    return copied_usages
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
-from library_analyzer.utils import ensure_file_exists
+from library_analyzer.utils import (
+    LazyJsonObject,
+    read_binary_artifact,
+    read_json_file,
+    write_binary_artifact,
+    write_json_file,
+)
 
 from ._annotations import (
     ANNOTATION_SCHEMA_VERSION,
@@ -26,32 +32,139 @@ from ._annotations import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Set as AbstractSet
     from pathlib import Path
 
+_Annotation = TypeVar("_Annotation", bound=AbstractAnnotation)
+
+# The list of the store that holds each type of annotation
+_ANNOTATION_LIST_NAMES: list[tuple[type[AbstractAnnotation], str]] = [
+    (BoundaryAnnotation, "boundaryAnnotations"),
+    (CalledAfterAnnotation, "calledAfterAnnotations"),
+    (CompleteAnnotation, "completeAnnotations"),
+    (DependencyAnnotation, "dependencyAnnotations"),
+    (DescriptionAnnotation, "descriptionAnnotations"),
+    (EnumAnnotation, "enumAnnotations"),
+    (ExpertAnnotation, "expertAnnotations"),
+    (GroupAnnotation, "groupAnnotations"),
+    (MoveAnnotation, "moveAnnotations"),
+    (PureAnnotation, "pureAnnotations"),
+    (RemoveAnnotation, "removeAnnotations"),
+    (RenameAnnotation, "renameAnnotations"),
+    (TodoAnnotation, "todoAnnotations"),
+    (ValueAnnotation, "valueAnnotations"),
+]
+
+
+class _AnnotationListView(Sequence[_Annotation]):
+    """A read-only view of a list of annotations in an AnnotationStore."""
+
+    __slots__ = ("_annotations",)
+
+    def __init__(self, annotations: list[_Annotation]) -> None:
+        self._annotations = annotations
+
+    @overload
+    def __getitem__(self, index: int) -> _Annotation: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_Annotation]: ...
+
+    def __getitem__(self, index: int | slice) -> _Annotation | list[_Annotation]:
+        return self._annotations[index]
+
+    def __len__(self) -> int:
+        return len(self._annotations)
+
+    def __iter__(self) -> Iterator[_Annotation]:
+        return iter(self._annotations)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _AnnotationListView):
+            return self._annotations == other._annotations
+        return self._annotations == other
+
+    def __repr__(self) -> str:
+        return repr(self._annotations)
+
+    # Like lists, the views are not hashable, since the lists can change.
+    __hash__ = None  # type: ignore[assignment]
+
+
+class _AnnotationList(Generic[_Annotation]):
+    """
+    A list of annotations of an AnnotationStore.
+
+    Reading it returns a read-only view of the list. Assigning annotations to it replaces the list and rebuilds its
+    index.
+    """
+
+    def __set_name__(self, owner: type[AnnotationStore], name: str) -> None:
+        self._name = name
+
+    def __get__(self, store: AnnotationStore | None, owner: type[AnnotationStore]) -> Sequence[_Annotation]:
+        if store is None:
+            # The dataclass uses this as the default value of the field
+            return ()
+        return _AnnotationListView(store._annotations[self._name])  # type: ignore[arg-type]  # The list only holds annotations of this type.
+
+    def __set__(self, store: AnnotationStore, annotations: Iterable[_Annotation]) -> None:
+        store._annotations[self._name] = list(annotations)
+        store._index(self._name)
+
 
 @dataclass
 class AnnotationStore:
-    boundaryAnnotations: list[BoundaryAnnotation] = field(default_factory=list)  # noqa: N815
-    calledAfterAnnotations: list[CalledAfterAnnotation] = field(default_factory=list)  # noqa: N815
-    completeAnnotations: list[CompleteAnnotation] = field(default_factory=list)  # noqa: N815
-    dependencyAnnotations: list[DependencyAnnotation] = field(default_factory=list)  # noqa: N815
-    descriptionAnnotations: list[DescriptionAnnotation] = field(default_factory=list)  # noqa: N815
-    enumAnnotations: list[EnumAnnotation] = field(default_factory=list)  # noqa: N815
-    expertAnnotations: list[ExpertAnnotation] = field(default_factory=list)  # noqa: N815
-    groupAnnotations: list[GroupAnnotation] = field(default_factory=list)  # noqa: N815
-    moveAnnotations: list[MoveAnnotation] = field(default_factory=list)  # noqa: N815
-    pureAnnotations: list[PureAnnotation] = field(default_factory=list)  # noqa: N815
-    removeAnnotations: list[RemoveAnnotation] = field(default_factory=list)  # noqa: N815
-    renameAnnotations: list[RenameAnnotation] = field(default_factory=list)  # noqa: N815
-    todoAnnotations: list[TodoAnnotation] = field(default_factory=list)  # noqa: N815
-    valueAnnotations: list[ValueAnnotation] = field(default_factory=list)  # noqa: N815
+    """
+    The annotations of an API, grouped by their type.
+
+    The store indexes its annotations by type and target, and its value annotations by variant and target. The lists
+    of annotations are read-only views, so annotations are added with `add_annotation` and removed with
+    `remove_annotations`. Assigning annotations to a list replaces it. Either way, the indexes are kept in sync.
+    """
+
+    _annotations: dict[str, list[AbstractAnnotation]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _annotations_by_target: dict[str, dict[str, list[AbstractAnnotation]]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _value_annotations_by_variant: dict[ValueAnnotation.Variant, dict[str, list[ValueAnnotation]]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    boundaryAnnotations: _AnnotationList[BoundaryAnnotation] = _AnnotationList()  # noqa: N815
+    calledAfterAnnotations: _AnnotationList[CalledAfterAnnotation] = _AnnotationList()  # noqa: N815
+    completeAnnotations: _AnnotationList[CompleteAnnotation] = _AnnotationList()  # noqa: N815
+    dependencyAnnotations: _AnnotationList[DependencyAnnotation] = _AnnotationList()  # noqa: N815
+    descriptionAnnotations: _AnnotationList[DescriptionAnnotation] = _AnnotationList()  # noqa: N815
+    enumAnnotations: _AnnotationList[EnumAnnotation] = _AnnotationList()  # noqa: N815
+    expertAnnotations: _AnnotationList[ExpertAnnotation] = _AnnotationList()  # noqa: N815
+    groupAnnotations: _AnnotationList[GroupAnnotation] = _AnnotationList()  # noqa: N815
+    moveAnnotations: _AnnotationList[MoveAnnotation] = _AnnotationList()  # noqa: N815
+    pureAnnotations: _AnnotationList[PureAnnotation] = _AnnotationList()  # noqa: N815
+    removeAnnotations: _AnnotationList[RemoveAnnotation] = _AnnotationList()  # noqa: N815
+    renameAnnotations: _AnnotationList[RenameAnnotation] = _AnnotationList()  # noqa: N815
+    todoAnnotations: _AnnotationList[TodoAnnotation] = _AnnotationList()  # noqa: N815
+    valueAnnotations: _AnnotationList[ValueAnnotation] = _AnnotationList()  # noqa: N815
 
     @staticmethod
     def from_json_file(path: Path) -> AnnotationStore:
-        with path.open(encoding="utf-8") as annotations_file:
-            annotations_json = json.load(annotations_file)
+        return AnnotationStore.from_dict(read_json_file(path))
 
-        return AnnotationStore.from_dict(annotations_json)
+    @staticmethod
+    def from_binary_file(path: Path) -> AnnotationStore:
+        return AnnotationStore.from_dict(read_binary_artifact(path))
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> AnnotationStore:
@@ -132,39 +245,192 @@ class AnnotationStore:
         )
 
     def add_annotation(self, annotation: AbstractAnnotation) -> None:
-        if isinstance(annotation, BoundaryAnnotation):
-            self.boundaryAnnotations.append(annotation)
-        elif isinstance(annotation, CalledAfterAnnotation):
-            self.calledAfterAnnotations.append(annotation)
-        elif isinstance(annotation, CompleteAnnotation):
-            self.completeAnnotations.append(annotation)
-        elif isinstance(annotation, DependencyAnnotation):
-            self.dependencyAnnotations.append(annotation)
-        elif isinstance(annotation, DescriptionAnnotation):
-            self.descriptionAnnotations.append(annotation)
-        elif isinstance(annotation, EnumAnnotation):
-            self.enumAnnotations.append(annotation)
-        elif isinstance(annotation, ExpertAnnotation):
-            self.expertAnnotations.append(annotation)
-        elif isinstance(annotation, GroupAnnotation):
-            self.groupAnnotations.append(annotation)
-        elif isinstance(annotation, MoveAnnotation):
-            self.moveAnnotations.append(annotation)
-        elif isinstance(annotation, PureAnnotation):
-            self.pureAnnotations.append(annotation)
-        elif isinstance(annotation, RemoveAnnotation):
-            self.removeAnnotations.append(annotation)
-        elif isinstance(annotation, RenameAnnotation):
-            self.renameAnnotations.append(annotation)
-        elif isinstance(annotation, TodoAnnotation):
-            self.todoAnnotations.append(annotation)
-        elif isinstance(annotation, ValueAnnotation):
-            self.valueAnnotations.append(annotation)
-
-    def to_json_file(self, path: Path) -> None:
-        ensure_file_exists(path)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        list_name = _get_list_name(type(annotation))
+        if list_name is None:
+            return
+
+        self._annotations[list_name].append(annotation)
+        self._annotations_by_target.setdefault(list_name, {}).setdefault(annotation.target, []).append(annotation)
+        if isinstance(annotation, ValueAnnotation):
+            self._value_annotations_by_variant.setdefault(annotation.variant, {}).setdefault(
+                annotation.target,
+                [],
+            ).append(annotation)
+
+    def remove_annotations(self, annotations: Iterable[AbstractAnnotation]) -> None:
+        """
+        Remove the given annotations from the store.
+
+        Annotations are compared by identity, so an annotation that is only equal to an annotation in the store is not
+        removed.
+
+        Parameters
+        ----------
+        annotations: Iterable[AbstractAnnotation]
+            The annotations to remove
+        """
+        removed_by_list_name: dict[str, dict[int, int]] = {}
+        for annotation in annotations:
+            list_name = _get_list_name(type(annotation))
+            if list_name is not None:
+                removed = removed_by_list_name.setdefault(list_name, {})
+                removed[id(annotation)] = removed.get(id(annotation), 0) + 1
+
+        for list_name, removed in removed_by_list_name.items():
+            remaining = []
+            for annotation in self._annotations[list_name]:
+                if removed.get(id(annotation), 0) > 0:
+                    removed[id(annotation)] -= 1
+                else:
+                    remaining.append(annotation)
+            self._annotations[list_name] = remaining
+            self._index(list_name)
+
+    def merge_other_into_self(self, other_annotation_store: AnnotationStore) -> AnnotationStore:
+        """
+        Merge the other annotation store into this one **in-place** and returns this store.
+
+        The annotations of the other store are appended after the annotations of this store, keeping their order.
+
+        Parameters
+        ----------
+        other_annotation_store: AnnotationStore
+            The annotation store to merge into this one.
+
+        Returns
+        -------
+        merged_annotation_store: AnnotationStore
+            This annotation store.
+        """
+        for _, list_name in _ANNOTATION_LIST_NAMES:
+            for annotation in other_annotation_store._annotations[list_name]:
+                self.add_annotation(annotation)
+
+        return self
+
+    def get_annotations_for_target(self, annotation_type: type[_Annotation], target: str) -> list[_Annotation]:
+        """
+        Return the annotations of the given type with the given target in the order they were added.
+
+        Parameters
+        ----------
+        annotation_type: type[_Annotation]
+            The type of the annotations, e.g. DependencyAnnotation
+        target: str
+            The ID of the annotated API element
+
+        Returns
+        -------
+        annotations: list[_Annotation]
+            The annotations of the given type with the given target.
+        """
+        list_name = _get_list_name(annotation_type)
+        if list_name is None:
+            return []
+        annotations = self._annotations_by_target.get(list_name, {}).get(target, [])
+        return [annotation for annotation in annotations if isinstance(annotation, annotation_type)]
+
+    def get_targets(self, annotation_type: type[AbstractAnnotation]) -> AbstractSet[str]:
+        """
+        Return the targets of the annotations of the given type.
+
+        The returned set is a view that reflects later changes to the store.
+
+        Parameters
+        ----------
+        annotation_type: type[AbstractAnnotation]
+            The type of the annotations, e.g. DependencyAnnotation
+
+        Returns
+        -------
+        targets: AbstractSet[str]
+            The IDs of the annotated API elements.
+        """
+        list_name = _get_list_name(annotation_type)
+        if list_name is None:
+            return frozenset()
+        return self._annotations_by_target.setdefault(list_name, {}).keys()
+
+    def get_value_annotation_targets(self, variant: ValueAnnotation.Variant) -> AbstractSet[str]:
+        """
+        Return the targets of the value annotations of the given variant.
+
+        The returned set is a view that reflects later changes to the store.
+
+        Parameters
+        ----------
+        variant: ValueAnnotation.Variant
+            The variant of the value annotations, e.g. ValueAnnotation.Variant.CONSTANT
+
+        Returns
+        -------
+        targets: AbstractSet[str]
+            The IDs of the annotated parameters.
+        """
+        return self._value_annotations_by_variant.setdefault(variant, {}).keys()
+
+    def _index(self, list_name: str) -> None:
+        annotations_by_target: dict[str, list[AbstractAnnotation]] = self._annotations_by_target.setdefault(
+            list_name,
+            {},
+        )
+        annotations_by_target.clear()
+        for annotation in self._annotations[list_name]:
+            annotations_by_target.setdefault(annotation.target, []).append(annotation)
+
+        if list_name == "valueAnnotations":
+            for value_annotations_by_target in self._value_annotations_by_variant.values():
+                value_annotations_by_target.clear()
+            for annotation in self.valueAnnotations:
+                self._value_annotations_by_variant.setdefault(annotation.variant, {}).setdefault(
+                    annotation.target,
+                    [],
+                ).append(annotation)
+
+    def to_json_file(self, path: Path, compact: bool = False, compress: bool = False) -> None:
+        """
+        Write the annotations to a JSON file, one annotation at a time.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        compact : bool
+            Whether to omit the indentation.
+        compress : bool
+            Whether to compress the file with gzip. `from_json_file` reads compressed files, too.
+        """
+        write_json_file(
+            path,
+            LazyJsonObject(
+                [
+                    ("schemaVersion", ANNOTATION_SCHEMA_VERSION),
+                    *(
+                        (list_name, self._to_lazy_json_object(self._annotations[list_name]))
+                        for _, list_name in _ANNOTATION_LIST_NAMES
+                    ),
+                ],
+            ),
+            compact,
+            compress,
+        )
+
+    @staticmethod
+    def _to_lazy_json_object(annotations: list[AbstractAnnotation]) -> LazyJsonObject:
+        # Like in to_dict, the last of several annotations of a target is kept at the position of the first one
+        annotations_by_target = {annotation.target: annotation for annotation in annotations}
+        return LazyJsonObject((target, annotation.to_dict()) for target, annotation in annotations_by_target.items())
+
+    def to_binary_file(self, path: Path) -> None:
+        """
+        Write the annotations to a binary artifact, which is smaller and faster to read than a JSON file.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        """
+        write_binary_artifact(path, self.to_dict())
 
     def to_dict(self) -> dict:
         return {
@@ -190,3 +456,10 @@ class AnnotationStore:
             "todoAnnotations": {annotation.target: annotation.to_dict() for annotation in self.todoAnnotations},
             "valueAnnotations": {annotation.target: annotation.to_dict() for annotation in self.valueAnnotations},
         }
+
+
+def _get_list_name(annotation_type: type[AbstractAnnotation]) -> str | None:
+    for type_, list_name in _ANNOTATION_LIST_NAMES:
+        if issubclass(annotation_type, type_):
+            return list_name
+    return None
@@ -19,6 +19,7 @@ from ._extract_dependencies import (
     ParameterWillBeSetTo,
     extract_param_dependencies,
 )
+from ._format_api_code import format_api_code
 from ._get_api import get_api
 from ._get_instance_attributes import get_instance_attributes
 from ._get_parameter_list import get_parameter_list
@@ -32,6 +33,7 @@ from ._package_metadata import (
 __all__ = [
     "distribution",
     "distribution_version",
+    "format_api_code",
     "get_api",
     "get_instance_attributes",
     "get_parameter_list",
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from dataclasses import replace
+from multiprocessing import Pool
+from typing import TYPE_CHECKING
+
+from black import __version__ as black_version
+
+from library_analyzer.processing.api.model import API, Class, Function, format_code
+from library_analyzer.utils import ensure_file_exists
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS black_formatted_code (
+    code_hash TEXT NOT NULL PRIMARY KEY,
+    formatted_code TEXT NOT NULL
+) WITHOUT ROWID
+"""
+
+
+def format_api_code(apis: Iterable[API], *, processes: int = 1, cache_file_path: Path | None = None) -> int:
+    """
+    Format the code of all classes and functions of the APIs with black and store it in the elements.
+
+    Each distinct code is formatted only once, even if it occurs in several elements or APIs. Afterward,
+    `get_formatted_code` of the elements does not call black anymore, and the formatted code is included when the
+    APIs are written to JSON. Elements that already have formatted code, e.g. because it was read from JSON, are
+    skipped.
+
+    Parameters
+    ----------
+    apis : Iterable[API]
+        the APIs
+    processes : int
+        how many processes format the code
+    cache_file_path : Path | None
+        if given, the formatted code is looked up in and added to this database, keyed by the hash of the code and the
+        version of black
+
+    Returns
+    -------
+    formatted_count : int
+        how many distinct codes were formatted, i.e. not found in the cache
+    """
+    apis = list(apis)
+    codes = sorted(
+        {element.code for api in apis for element in _get_code_elements(api) if element.formatted_code is None},
+    )
+    if len(codes) == 0:
+        return 0
+
+    formatted_codes: dict[str, str] = {}
+    connection = None
+    if cache_file_path is not None:
+        ensure_file_exists(cache_file_path)
+        connection = sqlite3.connect(cache_file_path, timeout=60)
+        connection.execute(_CREATE_TABLE)
+        formatted_codes = _load_formatted_codes(connection, codes)
+
+    missing_codes = [code for code in codes if code not in formatted_codes]
+    if processes > 1 and len(missing_codes) > 1:
+        with Pool(processes) as pool:
+            new_formatted_codes = pool.map(
+                format_code,
+                missing_codes,
+                chunksize=max(1, len(missing_codes) // (processes * 4)),
+            )
+    else:
+        new_formatted_codes = [format_code(code) for code in missing_codes]
+    formatted_codes.update(zip(missing_codes, new_formatted_codes, strict=True))
+
+    if connection is not None:
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO black_formatted_code VALUES (?, ?)",
+                [
+                    (_hash_code(code), formatted_code)
+                    for code, formatted_code in zip(missing_codes, new_formatted_codes, strict=True)
+                ],
+            )
+        connection.close()
+
+    for api in apis:
+        for class_ in api.classes.values():
+            if class_.formatted_code is None:
+                class_.formatted_code = formatted_codes[class_.code]
+        for function in list(api.functions.values()):
+            if function.formatted_code is None:
+                # Functions are immutable, so they are replaced. Their parameters and results stay the same objects.
+                api.add_function(replace(function, formatted_code=formatted_codes[function.code]))
+
+    return len(missing_codes)
+
+
+def _get_code_elements(api: API) -> list[Class | Function]:
+    return [*api.classes.values(), *api.functions.values()]
+
+
+def _hash_code(code: str) -> str:
+    # Another version of black might format the code differently.
+    return hashlib.blake2b(f"{black_version}\0{code}".encode(), digest_size=16).hexdigest()
+
+
+def _load_formatted_codes(connection: sqlite3.Connection, codes: list[str]) -> dict[str, str]:
+    codes_by_hash = {_hash_code(code): code for code in codes}
+    connection.execute("CREATE TEMPORARY TABLE IF NOT EXISTS loaded_hashes (code_hash TEXT NOT NULL PRIMARY KEY)")
+    connection.executemany(
+        "INSERT OR IGNORE INTO loaded_hashes VALUES (?)",
+        [(code_hash,) for code_hash in codes_by_hash],
+    )
+    rows = connection.execute(
+        "SELECT black_formatted_code.code_hash, black_formatted_code.formatted_code FROM black_formatted_code"
+        " JOIN loaded_hashes ON black_formatted_code.code_hash = loaded_hashes.code_hash",
+    ).fetchall()
+    connection.execute("DELETE FROM loaded_hashes")
+    connection.commit()
+    return {codes_by_hash[code_hash]: formatted_code for code_hash, formatted_code in rows}
@@ -13,6 +13,7 @@ from ._api import (
     Parameter,
     ParameterAssignment,
     Result,
+    format_code,
 )
 from ._docstring import (
     AttributeDocstring,
@@ -54,4 +55,5 @@ __all__ = [
     "ResultDocstring",
     "UnionType",
     "create_type",
+    "format_code",
 ]
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, TypeAlias
@@ -10,7 +9,15 @@ from black.brackets import BracketMatchError
 from black.linegen import CannotSplit
 from black.trans import CannotTransform
 
-from library_analyzer.utils import ensure_file_exists, parent_id
+from library_analyzer.utils import (
+    LazyJsonArray,
+    LazyJsonObject,
+    parent_id,
+    read_binary_artifact,
+    read_json_file,
+    write_binary_artifact,
+    write_json_file,
+)
 
 from ._docstring import ClassDocstring, FunctionDocstring, ParameterDocstring, ResultDocstring
 from ._types import AbstractType, create_type
@@ -24,10 +31,11 @@ API_SCHEMA_VERSION = 1
 class API:
     @staticmethod
     def from_json_file(path: Path) -> API:
-        with path.open(encoding="utf-8") as api_file:
-            api_json = json.load(api_file)
+        return API.from_dict(read_json_file(path))
 
-        return API.from_dict(api_json)
+    @staticmethod
+    def from_binary_file(path: Path) -> API:
+        return API.from_dict(read_binary_artifact(path))
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> API:
@@ -155,6 +163,7 @@ class API:
                     docstring=class_.docstring,
                     code=class_.code,
                     instance_attributes=class_.instance_attributes,
+                    formatted_code=class_.formatted_code,
                 )
                 for method in class_.methods:
                     if self.is_public_function(method):
@@ -167,10 +176,61 @@ class API:
 
         return result
 
-    def to_json_file(self, path: Path) -> None:
-        ensure_file_exists(path)
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def to_json_file(self, path: Path, compact: bool = False, compress: bool = False) -> None:
+        """
+        Write the API to a JSON file, one module, class, and function at a time.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        compact : bool
+            Whether to omit the indentation.
+        compress : bool
+            Whether to compress the file with gzip. `from_json_file` reads compressed files, too.
+        """
+        write_json_file(
+            path,
+            LazyJsonObject(
+                [
+                    ("schemaVersion", API_SCHEMA_VERSION),
+                    ("distribution", self.distribution),
+                    ("package", self.package),
+                    ("version", self.version),
+                    (
+                        "modules",
+                        LazyJsonArray(
+                            module.to_dict() for module in sorted(self.modules.values(), key=lambda it: it.id)
+                        ),
+                    ),
+                    (
+                        "classes",
+                        LazyJsonArray(
+                            class_.to_dict() for class_ in sorted(self.classes.values(), key=lambda it: it.id)
+                        ),
+                    ),
+                    (
+                        "functions",
+                        LazyJsonArray(
+                            function.to_dict() for function in sorted(self.functions.values(), key=lambda it: it.id)
+                        ),
+                    ),
+                ],
+            ),
+            compact,
+            compress,
+        )
+
+    def to_binary_file(self, path: Path) -> None:
+        """
+        Write the API to a binary artifact, which is smaller and faster to read than a JSON file.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        """
+        write_binary_artifact(path, self.to_dict())
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -270,6 +330,7 @@ class Class:
     docstring: ClassDocstring
     code: str
     instance_attributes: list[Attribute]
+    formatted_code: str | None = field(default=None, compare=False)
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> Class:
@@ -286,6 +347,7 @@ class Class:
                 Attribute.from_dict(instance_attribute, d["id"])
                 for instance_attribute in d.get("instance_attributes", [])
             ],
+            d.get("formatted_code"),
         )
 
         for method_id in d["methods"]:
@@ -304,7 +366,7 @@ class Class:
         self.methods.append(method_id)
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        result: dict[str, Any] = {
             "id": self.id,
             "name": self.name,
             "qname": self.qname,
@@ -317,6 +379,9 @@ class Class:
             "code": self.code,
             "instance_attributes": [attribute.to_dict() for attribute in self.instance_attributes],
         }
+        if self.formatted_code is not None:
+            result["formatted_code"] = self.formatted_code
+        return result
 
     def get_formatted_code(self, *, cut_documentation: bool = False) -> str:
         formatted_code = _generate_formatted_code(self)
@@ -326,7 +391,25 @@ class Class:
 
 
 def _generate_formatted_code(api_element: Class | Function) -> str:
-    code = api_element.code
+    if api_element.formatted_code is not None:
+        return api_element.formatted_code
+    return format_code(api_element.code)
+
+
+def format_code(code: str) -> str:
+    """
+    Format code with black.
+
+    Parameters
+    ----------
+    code : str
+        the code
+
+    Returns
+    -------
+    formatted_code : str
+        the formatted code or the unchanged code if black cannot format it
+    """
     try:
         code_tmp = format_str(code, mode=FileMode())
     except (CannotSplit, CannotTransform, InvalidInput, BracketMatchError):
@@ -392,6 +475,7 @@ class Function:
     reexported_by: list[str]
     docstring: FunctionDocstring
     code: str
+    formatted_code: str | None = field(default=None, compare=False)
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> Function:
@@ -405,6 +489,7 @@ class Function:
             d.get("reexported_by", []),
             FunctionDocstring(description=d.get("description", "")),
             d.get("code", ""),
+            d.get("formatted_code"),
         )
 
     @property
@@ -412,7 +497,7 @@ class Function:
         return self.qname.rsplit(".", maxsplit=1)[-1]
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        result: dict[str, Any] = {
             "id": self.id,
             "name": self.name,
             "qname": self.qname,
@@ -424,6 +509,9 @@ class Function:
             "description": self.docstring.description,
             "code": self.code,
         }
+        if self.formatted_code is not None:
+            result["formatted_code"] = self.formatted_code
+        return result
 
     def get_formatted_code(self, *, cut_documentation: bool = False) -> str:
         formatted_code = _generate_formatted_code(self)
@@ -13,6 +13,7 @@ from library_analyzer.processing.api.purity_analysis.model import (
     Symbol,
     UnknownProto,
 )
+from library_analyzer.utils import profile
 
 
 class CallGraphBuilder:
@@ -79,7 +80,8 @@ class CallGraphBuilder:
             self._built_call_graph(reason)
 
         # Handle cycles in the call graph.
-        self._handle_cycles()
+        with profile("handle_cycles"):
+            self._handle_cycles()
 
         return self.call_graph_forest
 
@@ -24,7 +24,7 @@ from library_analyzer.processing.api.purity_analysis.model import (
     Scope,
     Symbol,
 )
-from library_analyzer.utils import ASTWalker
+from library_analyzer.utils import ASTWalker, profile
 
 _ComprehensionType = astroid.ListComp | astroid.DictComp | astroid.SetComp | astroid.GeneratorExp
 
@@ -1237,11 +1237,12 @@ def get_module_data(code: str, module_name: str = "", path: str | None = None) -
     """
     module_data_handler = ModuleDataBuilder()
     walker = ASTWalker(module_data_handler)
-    try:
-        module = astroid.parse(code, module_name, path)
-    except astroid.AstroidSyntaxError as e:
-        raise ValueError(f"Invalid syntax in code: {e}") from e
-    walker.walk(module)
+    with profile("get_module_data", module_name):
+        try:
+            module = astroid.parse(code, module_name, path)
+        except astroid.AstroidSyntaxError as e:
+            raise ValueError(f"Invalid syntax in code: {e}") from e
+        walker.walk(module)
 
     scope = module_data_handler.children[0]  # Get the children of the root node, which are the scopes of the module
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
 import astroid
@@ -14,16 +15,21 @@ from library_analyzer.processing.api.purity_analysis.model import (
     APIPurity,
     Builtin,
     BuiltinOpen,
+    CachedModule,
     CallGraphForest,
     CallGraphNode,
     CallOfParameter,
+    ClassScope,
     CombinedCallGraphNode,
     FileRead,
     FileWrite,
+    FunctionScope,
     Import,
     ImportedCallGraphNode,
     Impure,
     ImpurityReason,
+    MemberAccess,
+    ModuleData,
     NativeCall,
     NodeID,
     OpenMode,
@@ -31,14 +37,19 @@ from library_analyzer.processing.api.purity_analysis.model import (
     Parameter,
     ParameterAccess,
     Pure,
+    PurityCache,
     PurityResult,
     Reasons,
+    RecentPurityResults,
     Reference,
+    ReferenceNode,
     StringLiteral,
+    Symbol,
     UnknownCall,
     UnknownClassInit,
     UnknownFunctionCall,
 )
+from library_analyzer.utils import profile
 
 
 class PurityAnalyzer:
@@ -69,6 +80,9 @@ class PurityAnalyzer:
         the value is a dictionary of the purity results of the functions in the module.
         After the analysis of the module, the results are saved in this dictionary.
         All imported modules are saved in this dictionary too for further runtime reduction.
+    resolved_references :
+        The resolved references of the module.
+        The key is the name of the reference node, the value is the list of ReferenceNodes.
 
     Parameters
     ----------
@@ -87,6 +101,10 @@ class PurityAnalyzer:
         The module data of all modules the package.
         If provided, the references are resolved with the package data, else the module data is collected first.
         It is used for the inference of the purity between modules in the package.
+    known_results :
+        The already known purity results of functions in the package.
+        The key is the NodeID of the function.
+        These functions are not analyzed again, their results are used as they are.
     """
 
     def __init__(
@@ -96,11 +114,13 @@ class PurityAnalyzer:
         path: str | None = None,
         results: dict[NodeID, dict[NodeID, PurityResult]] | None = None,
         package_data: PackageData | None = None,
+        *,
+        known_results: dict[NodeID, PurityResult] | None = None,
     ) -> None:
         if code is None and not package_data:
             raise ValueError("The code and package data are None.")
         elif package_data:
-            references = resolve_references(code, module_name, path, package_data)  # type: ignore[arg-type]  # code is not None, so the type is correct.
+            references = resolve_references(code, module_name, path, package_data, known_results)  # type: ignore[arg-type]  # code is not None, so the type is correct.
         else:
             references = resolve_references(code, module_name, path)  # type: ignore[arg-type]  # code is not None, so the type is correct.
         if references.call_graph_forest is None:
@@ -114,8 +134,10 @@ class PurityAnalyzer:
         self.current_purity_results: dict[NodeID, dict[NodeID, PurityResult]] = {self.module_id: {}}
         self.separated_nodes: dict[NodeID, CallGraphNode] = {}
         self.cached_module_results: dict[NodeID, dict[NodeID, PurityResult]] = results if results else {}
+        self.resolved_references: dict[str, list[ReferenceNode]] = references.resolved_references
 
-        self._analyze_purity()
+        with profile("analyze_purity", str(self.module_id)):
+            self._analyze_purity()
 
     @staticmethod
     def _handle_open_like_functions(call: astroid.Call) -> PurityResult:
@@ -405,12 +427,13 @@ class PurityAnalyzer:
             )
 
         # Analyze the purity of the imported module.
-        purity_result_imported_module = infer_purity(
-            code=source_code,
-            module_name=imported_module.name,
-            path=imported_module.path[0],
-            results=self.cached_module_results,
-        )
+        with profile("analyze_imported_module", imported_module.name):
+            purity_result_imported_module = infer_purity(
+                code=source_code,
+                module_name=imported_module.name,
+                path=imported_module.path[0],
+                results=self.cached_module_results,
+            )
 
         # Update the cache with the purity results of the imported module.
         self.cached_module_results.update(purity_result_imported_module)
@@ -613,6 +636,8 @@ def infer_purity(
 
 def get_purity_results(
     src_dir_path: Path,
+    cache: PurityCache | None = None,
+    recent_results: RecentPurityResults | None = None,
 ) -> APIPurity:
     """Get the purity results of a package.
 
@@ -623,16 +648,31 @@ def get_purity_results(
     ----------
     src_dir_path :
         The path of the source directory of the package.
+    cache :
+        The cache of a previous run on the same package, if any.
+        If given, only modules that changed since the previous run are parsed again,
+        and only the functions of changed modules and the functions that (transitively) call into them are analyzed
+        again.
+        The cache is updated with the results of this run.
+    recent_results :
+        The results of recently analyzed packages, if any.
+        If the package (with the same source code) was analyzed recently, a copy of the cached results is returned,
+        else the results of this run are added.
+        If a cache is given, the recent results are not used, since the cache has to be updated by an analysis.
+        The results of this run are still added.
 
     Returns
     -------
     APIPurity
         The purity results of the package.
+        The results are owned by the caller, they are not shared with other analyses.
     """
     modules = list(src_dir_path.glob("**/*.py"))
     module_names: list[str] = []
+    module_sources: list[tuple[str, str, str]] = []
     package_purity = APIPurity()
     package_data = PackageData(src_dir_path.stem)
+    changed_modules: dict[str, CachedModule] = {}
 
     for module in modules:
         posix_path = Path(module).as_posix()
@@ -642,14 +682,35 @@ def get_purity_results(
 
         module_name = __module_name(src_dir_path, Path(module))
         module_names.append(module_name)
-        # Prepare the module data for all modules of the package.
         with module.open("r", encoding="utf-8") as file:
-            code = file.read()
-            package_data.modules.update({module_name: (posix_path, get_module_data(code, module_name, posix_path))})
+            module_sources.append((module_name, posix_path, file.read()))
+
+    # Reuse the results of a recent analysis of the same package.
+    package_hash = None
+    if recent_results is not None:
+        package_hash = RecentPurityResults.hash_package([(path, code) for _, path, code in module_sources])
+        recent_package_purity = recent_results.get(package_hash) if cache is None else None
+        if recent_package_purity is not None:
+            return recent_package_purity
+
+    # Prepare the module data for all modules of the package.
+    for module_name, posix_path, code in module_sources:
+        # Reuse the module data of modules that did not change since the last run.
+        module_data = cache.get_module_data(module_name, posix_path, code) if cache is not None else None
+        if module_data is None:
+            module_data = get_module_data(code, module_name, posix_path)
+            changed_modules[module_name] = CachedModule(posix_path, PurityCache.hash_code(code), module_data)
+        package_data.modules.update({module_name: (posix_path, module_data)})
 
     # Analyze the complete package.
     package_data.combine_modules()
-    package_purity_results = infer_purity(code=None, results=package_purity.purity_results, package_data=package_data)
+    if cache is None:
+        package_purity_results = infer_purity(
+            code=None,
+            package_data=package_data,
+        )
+    else:
+        package_purity_results = _infer_purity_incrementally(package_data, changed_modules, cache)
 
     # Group the results by file name.
     sorted_module_purity_results: dict[NodeID, dict[NodeID, PurityResult]] = {}
@@ -683,9 +744,213 @@ def get_purity_results(
         if module_id.name not in module_names:
             package_purity.purity_results.pop(module_id)
 
+    if recent_results is not None:
+        recent_results.put(package_hash, package_purity)  # type: ignore[arg-type] # package_hash is not None here.
+
     return package_purity
 
 
+def _infer_purity_incrementally(
+    package_data: PackageData,
+    changed_modules: dict[str, CachedModule],
+    cache: PurityCache,
+) -> dict[NodeID, dict[NodeID, PurityResult]]:
+    """Infer the purity of a package by reusing the results of a previous run.
+
+    Only the functions of changed modules, the functions that reference a name defined in a changed module,
+    and the functions that (transitively) call into one of these functions are analyzed again.
+    All other functions keep the result of the previous run.
+    Afterward, the cache is updated with the results of this run.
+
+    Parameters
+    ----------
+    package_data :
+        The module data of all modules the package, the modules must already be combined.
+    changed_modules :
+        The modules that are new or changed since the previous run.
+        The key is the name of the module.
+    cache :
+        The cache of the previous run.
+
+    Returns
+    -------
+    dict[NodeID, dict[NodeID, PurityResult]]
+        The purity results of the package.
+    """
+    if package_data.combined_module is None:
+        raise ValueError("The modules of the package are not combined.")
+
+    removed_modules = {name: cached for name, cached in cache.modules.items() if name not in package_data.modules}
+
+    # Collect all names that are defined (or were defined) in a changed module,
+    # since the references of other modules to these names might be resolved differently now.
+    changed_names: set[str] = set()
+    for module_name, changed_module in changed_modules.items():
+        changed_names.update(_get_defined_names(changed_module.module_data))
+        if module_name in cache.modules:
+            changed_names.update(_get_defined_names(cache.modules[module_name].module_data))
+    for removed_module in removed_modules.values():
+        changed_names.update(_get_defined_names(removed_module.module_data))
+
+    # Find the functions that need to be analyzed again.
+    function_ids: set[NodeID] = set()
+    dirty_ids: set[NodeID] = set()
+    for module_name, (_, module_data) in package_data.modules.items():
+        for function_list in module_data.functions.values():
+            for function in function_list:
+                function_ids.add(function.symbol.id)
+                if (
+                    module_name in changed_modules
+                    or function.symbol.id not in cache.function_results
+                    or not changed_names.isdisjoint(_get_referenced_names(function))
+                ):
+                    dirty_ids.add(function.symbol.id)
+
+    # Classes propagate the results of their constructors to their callers.
+    class_callees: dict[NodeID, set[NodeID]] = {
+        klass.symbol.id: {
+            constructor.symbol.id
+            for constructor in (klass.new_function, klass.init_function, klass.post_init_function)
+            if constructor is not None
+        }
+        for klass in package_data.combined_module.classes.values()
+    }
+    class_ids = set(class_callees)
+    cache.callees.update(class_callees)
+
+    # Add all functions that (transitively) call into a function that is analyzed again.
+    callers = cache.get_callers()
+    stack = list(dirty_ids)
+    while stack:
+        for caller_id in callers.get(stack.pop(), set()):
+            if caller_id not in dirty_ids and (caller_id in function_ids or caller_id in class_ids):
+                dirty_ids.add(caller_id)
+                stack.append(caller_id)
+
+    logging.info(
+        "Purity analysis of %s: changed modules %s, removed modules %s, %d of %d functions are analyzed again",
+        package_data.package_name,
+        sorted(changed_modules),
+        sorted(removed_modules),
+        len(dirty_ids & function_ids),
+        len(function_ids),
+    )
+
+    # The results of imported modules of the package might be outdated now.
+    if changed_modules or removed_modules:
+        for module_id in list(cache.imported_module_results):
+            if module_id.name == package_data.package_name or module_id.name.startswith(
+                f"{package_data.package_name}.",
+            ):
+                del cache.imported_module_results[module_id]
+
+    known_results = {
+        function_id: result for function_id, result in cache.function_results.items() if function_id not in dirty_ids
+    }
+    purity_analyzer = PurityAnalyzer(
+        code=None,
+        results=cache.imported_module_results,
+        package_data=package_data,
+        known_results=known_results,
+    )
+
+    # Update the cache with the results of this run.
+    for module_name in removed_modules:
+        del cache.modules[module_name]
+    cache.modules.update(changed_modules)
+    cache.imported_module_results = purity_analyzer.cached_module_results
+    package_module_id = purity_analyzer.module_id
+    if package_module_id is None:
+        raise ValueError("The module ID is None.")
+    cache.function_results = {
+        node_id: result
+        for node_id, result in purity_analyzer.current_purity_results[package_module_id].items()
+        if node_id in function_ids
+    }
+    cache.callees = {
+        node_id: callee_ids
+        for node_id, callee_ids in cache.callees.items()
+        if node_id not in dirty_ids and (node_id in function_ids or node_id in class_ids)
+    }
+    for reference_list in purity_analyzer.resolved_references.values():
+        for reference in reference_list:
+            cache.callees.setdefault(reference.scope.symbol.id, set()).update(
+                symbol.id
+                for symbol in reference.referenced_symbols
+                if symbol.id in function_ids or symbol.id in class_ids
+            )
+    cache.callees.update(class_callees)
+
+    return purity_analyzer.current_purity_results
+
+
+def _get_defined_names(module_data: ModuleData) -> set[str]:
+    """Get all names that are defined in a module.
+
+    These are the names of all functions, classes, imports, class variables and instance variables.
+
+    Parameters
+    ----------
+    module_data :
+        The module data of the module.
+
+    Returns
+    -------
+    set[str]
+        The names defined in the module.
+    """
+    names = set(module_data.functions) | set(module_data.classes) | set(module_data.imports)
+    for klass in module_data.classes.values():
+        names.update(klass.class_variables)
+        names.update(klass.instance_variables)
+    return names
+
+
+def _get_referenced_names(function: FunctionScope) -> set[str]:
+    """Get all names that are used to resolve the references of a function.
+
+    Parameters
+    ----------
+    function :
+        The function scope.
+
+    Returns
+    -------
+    set[str]
+        The names of all calls, values and targets inside the function,
+        the members and receivers of all member accesses,
+        as well as the names of the function itself and its enclosing classes.
+    """
+    names = {function.symbol.name}
+    names.update(function.call_references)
+    names.update(function.value_references)
+    names.update(function.target_symbols)
+
+    references: list[Reference | Symbol] = [
+        *(reference for reference_list in function.call_references.values() for reference in reference_list),
+        *(reference for reference_list in function.value_references.values() for reference in reference_list),
+        *(symbol for symbol_list in function.target_symbols.values() for symbol in symbol_list),
+    ]
+    for reference in references:
+        member_access = reference.node
+        while isinstance(member_access, MemberAccess):
+            names.add(member_access.member)
+            receiver = member_access.receiver
+            if isinstance(receiver, astroid.Name):
+                names.add(receiver.name)
+            elif isinstance(receiver, astroid.Attribute):
+                names.add(receiver.attrname)
+            member_access = receiver
+
+    parent = function.parent
+    while parent is not None:
+        if isinstance(parent, ClassScope):
+            names.add(parent.symbol.name)
+            names.update(super_class.symbol.name for super_class in parent.super_classes)
+        parent = parent.parent
+    return names
+
+
 def __module_name(root: Path, file: Path) -> str:
     relative_path = file.relative_to(root.parent).as_posix()
     return str(relative_path).replace(".py", "").replace("/", ".")
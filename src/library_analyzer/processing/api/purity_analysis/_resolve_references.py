@@ -13,6 +13,7 @@ from library_analyzer.processing.api.purity_analysis.model import (
     BuiltinOpen,
     ClassScope,
     ClassVariable,
+    FunctionIndex,
     FunctionScope,
     GlobalVariable,
     Import,
@@ -25,6 +26,7 @@ from library_analyzer.processing.api.purity_analysis.model import (
     NonLocalVariableWrite,
     PackageData,
     ParameterKind,
+    PurityResult,
     Reasons,
     Reference,
     ReferenceNode,
@@ -33,6 +35,7 @@ from library_analyzer.processing.api.purity_analysis.model import (
     UnknownProto,
     ValueReference,
 )
+from library_analyzer.utils import profile
 
 _BUILTINS = dir(builtins)
 
@@ -44,6 +47,9 @@ class ReferenceResolver:
     ----------
     functions :
         The functions of the module.
+    function_index :
+        The index of the functions by name and accepted number of arguments.
+        It is built once for the module (or the combined module of the package) and used to resolve calls.
     classes :
         The classes of the module.
     imports :
@@ -65,12 +71,17 @@ class ReferenceResolver:
         The module data of all modules the package.
         If provided, the references are resolved with the package data, else the module data is collected first.
         It is used for the inference of the purity between modules in the package.
+    known_results :
+        The already known purity results of functions, the key is the NodeID of the function.
+        The references of these functions are not resolved again,
+        instead the result is stored in their Reasons, so they are treated as inferred nodes in the call graph.
     """
 
     functions: dict[str, list[FunctionScope]]
+    function_index: FunctionIndex
     classes: dict[str, ClassScope]
     imports: dict[str, Import]
-    module_analysis_result: ModuleAnalysisResult = ModuleAnalysisResult()
+    module_analysis_result: ModuleAnalysisResult
     package_data_is_provided: bool = False
 
     def __init__(
@@ -79,7 +90,12 @@ class ReferenceResolver:
         module_name: str = "",
         path: str | None = None,
         package_data: PackageData | None = None,
+        known_results: dict[NodeID, PurityResult] | None = None,
     ):
+        self.known_results = known_results if known_results else {}
+        # Each resolver has its own result, so the result of a module does not outlive its analysis.
+        self.module_analysis_result = ModuleAnalysisResult()
+
         # Check if the module is part of a package and if the package data is given.
         if package_data and package_data.combined_module:
             self.package_data_is_provided = True
@@ -93,18 +109,22 @@ class ReferenceResolver:
             except ValueError:
                 return  # TODO: add error message to result?
         self.functions = module_data.functions
+        self.function_index = FunctionIndex.from_functions(self.functions)
         self.classes = module_data.classes
         self.imports = module_data.imports
 
         # Resolve the references for the module.
         self.module_analysis_result.classes = self.classes
-        resolved_references, raw_reasons = self._resolve_references()
+        module_name = str(self.module_analysis_result.module_id)
+        with profile("resolve_references", module_name):
+            resolved_references, raw_reasons = self._resolve_references()
         self.module_analysis_result.resolved_references = resolved_references
         self.module_analysis_result.raw_reasons = raw_reasons
-        self.module_analysis_result.call_graph_forest = build_call_graph(
-            self.classes,
-            self.module_analysis_result.raw_reasons,
-        )
+        with profile("build_call_graph", module_name):
+            self.module_analysis_result.call_graph_forest = build_call_graph(
+                self.classes,
+                self.module_analysis_result.raw_reasons,
+            )
 
     @staticmethod
     def is_function_of_class(function: astroid.FunctionDef, klass: ClassScope) -> bool:
@@ -271,9 +291,10 @@ class ReferenceResolver:
 
         # Find functions that are called.
         if call_reference.name in self.functions:
-            function_def = self.functions.get(call_reference.name)
-            function_def = [function_d for function_d in function_def if self.compare_parameters(function_d, call_reference.node)]  # type: ignore[union-attr]
-            function_symbols = [func.symbol for func in function_def if function_def]  # type: ignore[union-attr]
+            # Only functions whose parameters match the arguments of the call are referenced,
+            # see compare_parameters for the rules that are precomputed in the function index.
+            function_def = self.function_index.get_called_functions(call_reference.name, call_reference.node)
+            function_symbols = [func.symbol for func in function_def]
             # "None" is not iterable, but it is checked before
             class_iterator = function.symbol.node
             klass = None
@@ -472,8 +493,10 @@ class ReferenceResolver:
             if not inferred_node_def:
                 pass
             else:
+                # Copy the id as well, so the original import symbol is not altered by resolving a reference.
                 specified_import_def = dataclasses.replace(
                     import_def,
+                    id=dataclasses.replace(import_def.id),  # type: ignore[union-attr] # import def is not None.
                     inferred_node=inferred_node_def,  # type: ignore[type-var] # import def is not None.
                 )
                 specified_import_def.id.name = specified_import_def.id.name + "." + specified_import_def.name  # type: ignore[union-attr] # specified_import_def is not None.
@@ -561,6 +584,7 @@ class ReferenceResolver:
                         # This means that every function or class imported from a module has its own import node.
                         specified_import_def = dataclasses.replace(
                             import_def,
+                            id=dataclasses.replace(import_def.id),
                             name=value_reference.node.member,
                             inferred_node=inferred_node_def,
                         )
@@ -722,6 +746,15 @@ class ReferenceResolver:
         for function_list in self.functions.values():
             # iterate over all functions with the same name
             for function in function_list:
+                # Functions with a known result do not need to be resolved again.
+                if function.symbol.id in self.known_results:
+                    raw_reasons[function.symbol.id] = Reasons(
+                        function.symbol.id,
+                        function,
+                        result=self.known_results[function.symbol.id],
+                    )
+                    continue
+
                 # Collect the reasons while iterating over the functions, so there is no need to iterate over them again.
                 raw_reasons[function.symbol.id] = Reasons(function.symbol.id, function)
 
@@ -871,6 +904,7 @@ def resolve_references(
     module_name: str = "",
     path: str | None = None,
     package_data: PackageData | None = None,
+    known_results: dict[NodeID, PurityResult] | None = None,
 ) -> ModuleAnalysisResult:
     """Resolve all references in a module.
 
@@ -886,10 +920,13 @@ def resolve_references(
         The module data of all modules the package.
         If provided, the references are resolved with the package data, else the module data is collected first.
         It is used for the inference of the purity between modules in the package.
+    known_results :
+        The already known purity results of functions, the key is the NodeID of the function.
+        The references of these functions are not resolved again.
 
     Returns
     -------
     ModuleAnalysisResult
         The result of the reference resolving.
     """
-    return ReferenceResolver(code, module_name, path, package_data).module_analysis_result
+    return ReferenceResolver(code, module_name, path, package_data, known_results).module_analysis_result
@@ -6,6 +6,10 @@ from library_analyzer.processing.api.purity_analysis.model._call_graph import (
     CombinedCallGraphNode,
     ImportedCallGraphNode,
 )
+from library_analyzer.processing.api.purity_analysis.model._function_index import (
+    FunctionIndex,
+    FunctionSignature,
+)
 from library_analyzer.processing.api.purity_analysis.model._module_data import (
     Builtin,
     BuiltinOpen,
@@ -57,6 +61,11 @@ from library_analyzer.processing.api.purity_analysis.model._purity_builtins impo
     BUILTIN_SPECIALS,
     OPEN_MODES,
 )
+from library_analyzer.processing.api.purity_analysis.model._purity_cache import (
+    CachedModule,
+    PurityCache,
+    RecentPurityResults,
+)
 from library_analyzer.processing.api.purity_analysis.model._reference import (
     ModuleAnalysisResult,
     Reasons,
@@ -120,4 +129,9 @@ __all__ = [
     "PackageData",
     "ParameterKind",
     "UnknownProto",
+    "CachedModule",
+    "PurityCache",
+    "RecentPurityResults",
+    "FunctionIndex",
+    "FunctionSignature",
 ]
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import astroid
+
+from library_analyzer.processing.api.purity_analysis.model._module_data import ClassScope, ParameterKind
+
+if TYPE_CHECKING:
+    from library_analyzer.processing.api.purity_analysis.model._module_data import FunctionScope
+
+
+@dataclass(frozen=True)
+class FunctionSignature:
+    """Represents the precomputed call signature of a function.
+
+    The signature describes which calls can reference the function,
+    it is the precomputed equivalent of `ReferenceResolver.compare_parameters`.
+
+    Attributes
+    ----------
+    position :
+        The position of the function in the list of all functions with the same name.
+    function :
+        The function the signature belongs to.
+    min_arity :
+        The minimal number of arguments a call must have.
+    max_arity :
+        The maximal number of arguments a call can have, None if the number is unbounded.
+    keyword_names :
+        The names of all parameters that can be used as keyword arguments in a call.
+        None if all keyword arguments are accepted.
+    """
+
+    position: int
+    function: FunctionScope
+    min_arity: int
+    max_arity: int | None
+    keyword_names: frozenset[str] | None
+
+    @classmethod
+    def from_function(cls, position: int, function: FunctionScope) -> FunctionSignature:
+        """Compute the signature of a function.
+
+        Parameters
+        ----------
+        position :
+            The position of the function in the list of all functions with the same name.
+        function :
+            The function to compute the signature for.
+
+        Returns
+        -------
+        FunctionSignature
+            The signature of the function.
+        """
+        # A function without parameters matches every call.
+        if not function.parameters:
+            return cls(position, function, 0, None, None)
+
+        first_parameter_parent = next(iter(function.parameters.values())).node.parent
+        argument_node = first_parameter_parent if isinstance(first_parameter_parent, astroid.Arguments) else None
+
+        has_star_param = False
+        keyword_param_count = 0
+        positional_param_count = 0
+        for parameter in function.parameters.values():
+            if parameter.kind in (ParameterKind.VAR_POSITIONAL, ParameterKind.VAR_KEYWORD):
+                has_star_param = True
+            if parameter.kind in (ParameterKind.KEYWORD_ONLY, ParameterKind.VAR_KEYWORD):
+                keyword_param_count += 1
+            if parameter.kind in (ParameterKind.POSITIONAL_ONLY, ParameterKind.POSITIONAL_OR_KEYWORD) and not (
+                isinstance(function.parent, ClassScope) and parameter.name in ("self", "cls")
+            ):
+                positional_param_count += 1
+
+        min_arity = 0
+        max_arity = None
+        if not has_star_param:
+            max_arity = positional_param_count + keyword_param_count
+            if argument_node and not argument_node.defaults:
+                min_arity = max_arity
+
+        # Keyword arguments are only restricted if the function has no keyword parameters.
+        keyword_names = frozenset(function.parameters) if keyword_param_count == 0 else None
+
+        return cls(position, function, min_arity, max_arity, keyword_names)
+
+    def accepts_keywords(self, keyword_names: list[str | None]) -> bool:
+        """Check if the function accepts all given keyword arguments.
+
+        Parameters
+        ----------
+        keyword_names :
+            The names of the keyword arguments of a call.
+
+        Returns
+        -------
+        bool
+            True if all keyword arguments are accepted, False otherwise.
+        """
+        if self.keyword_names is None:
+            return True
+        return all(name in self.keyword_names for name in keyword_names)
+
+
+@dataclass
+class FunctionIndex:
+    """Index of functions by name and accepted number of arguments.
+
+    The index is used to find all functions that can be referenced by a call,
+    without comparing the arguments of the call to the parameters of every function with the same name.
+
+    Attributes
+    ----------
+    by_arity :
+        The signatures of all functions with a bounded number of arguments.
+        The key is the name of the function, the value maps each accepted number of arguments to the signatures.
+    unbounded :
+        The signatures of all functions with an unbounded number of arguments.
+        The key is the name of the function.
+    """
+
+    by_arity: dict[str, dict[int, list[FunctionSignature]]] = field(default_factory=dict)
+    unbounded: dict[str, list[FunctionSignature]] = field(default_factory=dict)
+
+    @classmethod
+    def from_functions(cls, functions: dict[str, list[FunctionScope]]) -> FunctionIndex:
+        """Build the index for the given functions.
+
+        Parameters
+        ----------
+        functions :
+            The functions to index, the key is the name of the functions.
+
+        Returns
+        -------
+        FunctionIndex
+            The index of the functions.
+        """
+        index = cls()
+        for name, function_list in functions.items():
+            for position, function in enumerate(function_list):
+                signature = FunctionSignature.from_function(position, function)
+                if signature.max_arity is None:
+                    index.unbounded.setdefault(name, []).append(signature)
+                else:
+                    arity_index = index.by_arity.setdefault(name, {})
+                    for arity in range(signature.min_arity, signature.max_arity + 1):
+                        arity_index.setdefault(arity, []).append(signature)
+        return index
+
+    def get_called_functions(self, name: str, call: astroid.Call) -> list[FunctionScope]:
+        """Get all functions with the given name that match the arguments of the call.
+
+        Parameters
+        ----------
+        name :
+            The name of the called function.
+        call :
+            The call node.
+
+        Returns
+        -------
+        list[FunctionScope]
+            The matching functions in the order they were defined.
+        """
+        arity = len(call.args) + len(call.keywords)
+        candidates = self.unbounded.get(name, []) + self.by_arity.get(name, {}).get(arity, [])
+        if not candidates:
+            return []
+
+        keyword_names = [keyword.arg for keyword in call.keywords]
+        candidates.sort(key=lambda signature: signature.position)
+        return [
+            signature.function
+            for signature in candidates
+            if not keyword_names or signature.accepts_keywords(keyword_names)
+        ]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
-import typing
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from typing import TYPE_CHECKING, Any
 
@@ -16,7 +16,7 @@ from library_analyzer.processing.api.purity_analysis.model._module_data import (
     Symbol,
     UnknownSymbol,
 )
-from library_analyzer.utils import ensure_file_exists
+from library_analyzer.utils import ensure_file_exists, write_binary_artifact
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -637,10 +637,12 @@ class UnknownClassInit(Expression):
         return f"{self.__class__.__name__}.{self.name}"
 
 
+@dataclass
 class APIPurity:
     """Class for API purity.
 
     The API purity is used to represent the purity result of an API.
+    Each instance owns its results, so the results of different analyses are independent of each other.
 
     Attributes
     ----------
@@ -650,13 +652,54 @@ class APIPurity:
         the value is a dictionary of the purity results of the functions in the module.
     """
 
-    purity_results: typing.ClassVar[dict[NodeID, dict[NodeID, PurityResult]]] = {}
+    purity_results: dict[NodeID, dict[NodeID, PurityResult]] = field(default_factory=dict)
+
+    def clear(self) -> None:
+        """Remove all purity results."""
+        self.purity_results.clear()
+
+    def copy(self) -> APIPurity:
+        """Get a copy of the purity results that can be changed without changing these results.
+
+        The impurity reasons are shared, since they are not changed after the analysis.
+
+        Returns
+        -------
+        APIPurity
+            The copy of the purity results.
+        """
+        return APIPurity(
+            purity_results={
+                module_id: {
+                    function_id: (
+                        replace(result, reasons=result.reasons.copy())
+                        if isinstance(result, Impure)
+                        else copy.copy(result)
+                    )
+                    for function_id, result in module_results.items()
+                }
+                for module_id, module_results in self.purity_results.items()
+            },
+        )
 
     def to_json_file(self, path: Path, shorten: bool = True) -> None:
         ensure_file_exists(path)
         with path.open("w") as f:
             json.dump(self.to_dict(shorten), f, indent=2)
 
+    def to_binary_file(self, path: Path, shorten: bool = True) -> None:
+        """
+        Write the purity results to a binary artifact, which is smaller and faster to read than a JSON file.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        shorten : bool
+            Whether only the count of each reason is written, like in `to_json_file`.
+        """
+        write_binary_artifact(path, self.to_dict(shorten))
+
     def to_dict(self, shorten: bool = False) -> dict[str, Any]:
         return {
             module_name.__str__(): {
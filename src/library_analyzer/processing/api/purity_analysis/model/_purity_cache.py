@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from library_analyzer.processing.api.purity_analysis.model._module_data import ModuleData, NodeID
+    from library_analyzer.processing.api.purity_analysis.model._purity import APIPurity, PurityResult
+
+
+@dataclass
+class CachedModule:
+    """Represents the cached data of a single module of a package.
+
+    Attributes
+    ----------
+    path :
+        The path to the module.
+    code_hash :
+        The hash of the source code the module data was collected from.
+    module_data :
+        The ModuleData of the module.
+    """
+
+    path: str
+    code_hash: str
+    module_data: ModuleData
+
+
+@dataclass
+class PurityCache:
+    """Cache for the incremental purity analysis of a package.
+
+    The cache is filled by `get_purity_results` and is meant to be passed to later calls for the same package.
+    Modules whose source code did not change since the last run are not parsed again.
+    Only functions of changed modules and functions which (transitively) call into them are analyzed again,
+    all other functions keep their cached purity result.
+
+    Attributes
+    ----------
+    modules :
+        The cached data of all modules of the package.
+        The key is the name of the module.
+    function_results :
+        The purity results of all functions of the package from the last run.
+        The key is the NodeID of the function.
+    callees :
+        The resolved references of all functions and classes of the package from the last run.
+        The key is the NodeID of the function (or class), the value is the set of NodeIDs it references.
+    imported_module_results :
+        The purity results of all imported modules which were analyzed during the last run.
+    """
+
+    modules: dict[str, CachedModule] = field(default_factory=dict)
+    function_results: dict[NodeID, PurityResult] = field(default_factory=dict)
+    callees: dict[NodeID, set[NodeID]] = field(default_factory=dict)
+    imported_module_results: dict[NodeID, dict[NodeID, PurityResult]] = field(default_factory=dict)
+
+    @staticmethod
+    def hash_code(code: str) -> str:
+        """Hash the source code of a module.
+
+        Parameters
+        ----------
+        code :
+            The source code of the module.
+
+        Returns
+        -------
+        str
+            The hash of the source code.
+        """
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get_module_data(self, module_name: str, path: str, code: str) -> ModuleData | None:
+        """Get the cached ModuleData of a module if the module did not change.
+
+        Parameters
+        ----------
+        module_name :
+            The name of the module.
+        path :
+            The path to the module.
+        code :
+            The current source code of the module.
+
+        Returns
+        -------
+        ModuleData | None
+            The cached ModuleData or None if the module is not cached or changed since it was cached.
+        """
+        cached_module = self.modules.get(module_name)
+        if cached_module is None or cached_module.path != path or cached_module.code_hash != self.hash_code(code):
+            return None
+        return cached_module.module_data
+
+    def get_callers(self) -> dict[NodeID, set[NodeID]]:
+        """Get the reverse dependency index of the package.
+
+        Returns
+        -------
+        dict[NodeID, set[NodeID]]
+            The NodeIDs of all functions (and classes) that reference a function (or class).
+            The key is the NodeID of the referenced function (or class).
+        """
+        callers: dict[NodeID, set[NodeID]] = {}
+        for caller_id, callee_ids in self.callees.items():
+            for callee_id in callee_ids:
+                callers.setdefault(callee_id, set()).add(caller_id)
+        return callers
+
+
+@dataclass
+class RecentPurityResults:
+    """Bounded LRU cache of the purity results of recently analyzed packages.
+
+    The cache is passed explicitly to `get_purity_results`, the results are not cached otherwise.
+    A package is identified by the paths and the source code of its modules and by the mode of the analysis,
+    so a package is analyzed again if any of its modules changed.
+    The cache keeps its own copy of the results and hands out copies, so callers can change the results freely.
+    If the cache is full, the least recently used results are removed.
+
+    Attributes
+    ----------
+    max_size :
+        The maximal number of packages whose results are kept.
+    results :
+        The results of the recently analyzed packages, the least recently used first.
+        The key is the hash of the package.
+    """
+
+    max_size: int = 16
+    results: OrderedDict[str, APIPurity] = field(default_factory=OrderedDict)
+
+    def __post_init__(self) -> None:
+        if self.max_size < 1:
+            raise ValueError(f"The maximal size must be at least 1, but is {self.max_size}.")
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    @staticmethod
+    def hash_package(modules: list[tuple[str, str]]) -> str:
+        """Hash the modules of a package.
+
+        Parameters
+        ----------
+        modules :
+            The path and the source code of each module of the package.
+
+        Returns
+        -------
+        str
+            The hash of the package.
+        """
+        package_hash = hashlib.sha256()
+        for path, code in sorted(modules):
+            package_hash.update(path.encode("utf-8") + b"\0" + code.encode("utf-8") + b"\0")
+        return package_hash.hexdigest()
+
+    def get(self, package_hash: str) -> APIPurity | None:
+        """Get the results of a package and mark them as recently used.
+
+        Parameters
+        ----------
+        package_hash :
+            The hash of the package.
+
+        Returns
+        -------
+        APIPurity | None
+            A copy of the results of the package or None if they are not cached.
+        """
+        result = self.results.get(package_hash)
+        if result is None:
+            return None
+        self.results.move_to_end(package_hash)
+        return result.copy()
+
+    def put(self, package_hash: str, api_purity: APIPurity) -> None:
+        """Add the results of a package and remove the least recently used results if the cache is full.
+
+        Parameters
+        ----------
+        package_hash :
+            The hash of the package.
+        api_purity :
+            The results of the package.
+            A copy is kept, so they can still be changed by the caller.
+        """
+        self.results[package_hash] = api_purity.copy()
+        self.results.move_to_end(package_hash)
+        while len(self.results) > self.max_size:
+            self.results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        self.results.clear()
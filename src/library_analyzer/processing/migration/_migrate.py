@@ -1,9 +1,22 @@
 from dataclasses import dataclass, field
+from typing import TextIO
 
 from library_analyzer.processing.annotations.model import (
     AbstractAnnotation,
     AnnotationStore,
+    BoundaryAnnotation,
+    CalledAfterAnnotation,
+    DescriptionAnnotation,
+    EnumAnnotation,
     EnumReviewResult,
+    ExpertAnnotation,
+    GroupAnnotation,
+    MoveAnnotation,
+    PureAnnotation,
+    RemoveAnnotation,
+    RenameAnnotation,
+    TodoAnnotation,
+    ValueAnnotation,
 )
 from library_analyzer.processing.api.model import (
     API,
@@ -26,7 +39,8 @@ from library_analyzer.processing.migration.annotations import (
     migrate_todo_annotation,
     migrate_value_annotation,
 )
-from library_analyzer.processing.migration.model import ManyToManyMapping, Mapping
+from library_analyzer.processing.migration.model import ManyToManyMapping, Mapping, MappingIndex
+from library_analyzer.utils import profile
 
 
 @dataclass
@@ -37,17 +51,15 @@ class Migration:
     unsure_similarity: float = 0.75
     migrated_annotation_store: AnnotationStore = field(init=False)
     unsure_migrated_annotation_store: AnnotationStore = field(init=False)
+    mapping_index: MappingIndex = field(init=False)
 
     def __post_init__(self) -> None:
         self.migrated_annotation_store = AnnotationStore()
         self.unsure_migrated_annotation_store = AnnotationStore()
+        self.mapping_index = MappingIndex(self.mappings)
 
     def _get_mapping_from_annotation(self, annotation: AbstractAnnotation) -> Mapping | None:
-        for mapping in self.mappings:
-            for element in mapping.get_apiv1_elements():
-                if not isinstance(element, Attribute | Result) and element.id == annotation.target:
-                    return mapping
-        return None
+        return self.mapping_index.get_mapping(annotation.target, (Class, Function, Parameter))
 
     def migrate_annotations(self) -> None:
         for boundary_annotation in self.annotationsv1.boundaryAnnotations:
@@ -59,7 +71,11 @@ class Migration:
         for called_after_annotation in self.annotationsv1.calledAfterAnnotations:
             mapping = self._get_mapping_from_annotation(called_after_annotation)
             if mapping is not None:
-                for annotation in migrate_called_after_annotation(called_after_annotation, mapping, self.mappings):
+                for annotation in migrate_called_after_annotation(
+                    called_after_annotation,
+                    mapping,
+                    self.mapping_index,
+                ):
                     self.add_annotations_based_on_similarity(annotation, mapping)
 
         for description_annotation in self.annotationsv1.descriptionAnnotations:
@@ -83,7 +99,7 @@ class Migration:
         for group_annotation in self.annotationsv1.groupAnnotations:
             mapping = self._get_mapping_from_annotation(group_annotation)
             if mapping is not None:
-                for annotation in migrate_group_annotation(group_annotation, mapping, self.mappings):
+                for annotation in migrate_group_annotation(group_annotation, mapping, self.mapping_index):
                     self.add_annotations_based_on_similarity(annotation, mapping)
 
         for move_annotation in self.annotationsv1.moveAnnotations:
@@ -115,7 +131,8 @@ class Migration:
             if mapping is not None:
                 for annotation in migrate_value_annotation(value_annotation, mapping):
                     self.add_annotations_based_on_similarity(annotation, mapping)
-        self._handle_duplicates()
+        with profile("handle_duplicates"):
+            self._handle_duplicates()
 
     def add_annotations_based_on_similarity(self, annotation: AbstractAnnotation, mapping: Mapping) -> None:
         if isinstance(mapping, ManyToManyMapping):
@@ -183,93 +200,101 @@ class Migration:
 
         return [element for element in api_elements if element not in mapped_api_elements]
 
-    def print(self, apiv1: API, apiv2: API) -> None:
-        print("**Similarity**|**APIV1**|**APIV2**|**comment**\n:-----:|:-----:|:-----:|:----:|")
+    def print(self, apiv1: API, apiv2: API, file: TextIO | None = None) -> None:
+        print("**Similarity**|**APIV1**|**APIV2**|**comment**\n:-----:|:-----:|:-----:|:----:|", file=file)
         table_body = self._get_mappings_for_table()
         table_body.extend(self._get_unmapped_api_elements_for_table(apiv1, apiv2))
-        print("\n".join(table_body))
+        print("\n".join(table_body), file=file)
 
     def _handle_duplicates(self) -> None:
-        for annotation_type in [
-            "boundaryAnnotations",
-            "calledAfterAnnotations",
-            "descriptionAnnotations",
-            "enumAnnotations",
-            "expertAnnotations",
-            "groupAnnotations",
-            "moveAnnotations",
-            "pureAnnotations",
-            "removeAnnotations",
-            "renameAnnotations",
-            "todoAnnotations",
-            "valueAnnotations",
-        ]:
-            migrated_annotations = [
-                annotation
-                for annotation_store in [
-                    self.migrated_annotation_store,
-                    self.unsure_migrated_annotation_store,
+        annotation_stores = [self.migrated_annotation_store, self.unsure_migrated_annotation_store]
+        annotation_types: list[type[AbstractAnnotation]] = [
+            BoundaryAnnotation,
+            CalledAfterAnnotation,
+            DescriptionAnnotation,
+            EnumAnnotation,
+            ExpertAnnotation,
+            GroupAnnotation,
+            MoveAnnotation,
+            PureAnnotation,
+            RemoveAnnotation,
+            RenameAnnotation,
+            TodoAnnotation,
+            ValueAnnotation,
+        ]
+        for annotation_type in annotation_types:
+            targets = dict.fromkeys(
+                target
+                for annotation_store in annotation_stores
+                for target in annotation_store.get_targets(annotation_type)
+            )
+
+            removed_annotations: list[list[AbstractAnnotation]] = [[] for _ in annotation_stores]
+            for target in targets:
+                annotations_with_target: list[AbstractAnnotation] = [
+                    annotation
+                    for annotation_store in annotation_stores
+                    for annotation in annotation_store.get_annotations_for_target(annotation_type, target)
                 ]
-                for annotation in getattr(annotation_store, annotation_type)
-            ]
-            duplicates_dict: dict[str, list[AbstractAnnotation]] = {}
-            for duplicated_annotations in migrated_annotations:
-                if duplicated_annotations.target in duplicates_dict:
-                    duplicates_dict[duplicated_annotations.target].append(duplicated_annotations)
+                if len(annotations_with_target) < 2:
                     continue
-                for annotation in migrated_annotations:
-                    if duplicated_annotations is annotation or annotation.target in duplicates_dict:
-                        continue
-                    if (
-                        isinstance(annotation, type(duplicated_annotations))
-                        and annotation.target == duplicated_annotations.target
-                    ):
-                        duplicates = duplicates_dict.get(annotation.target, [])
-                        duplicates.append(annotation)
-                        duplicates.append(duplicated_annotations)
-                        duplicates_dict[duplicated_annotations.target] = duplicates
-                        break
-
-            for duplicates in duplicates_dict.values():
-                if len(duplicates) > 1:
-                    sorted_duplicates = sorted(duplicates, key=lambda annotation: annotation.reviewResult.name)
-                    different_values = set()
-                    first_annotation_and_value: tuple[AbstractAnnotation, str] | None = None
+                duplicates = self._get_duplicates(annotations_with_target)
+                if len(duplicates) < 2:
+                    continue
+                sorted_duplicates = sorted(duplicates, key=lambda annotation: annotation.reviewResult.name)
+                first_annotation = self._merge_duplicates(sorted_duplicates)
+
+                for annotation_store, removed in zip(annotation_stores, removed_annotations, strict=True):
+                    # Equal annotations have the same target, so only the annotations with this target can be removed
+                    remaining_annotations: list[AbstractAnnotation] = list(
+                        annotation_store.get_annotations_for_target(annotation_type, target),
+                    )
                     for annotation in sorted_duplicates:
-                        annotation_dict = annotation.to_dict()
-                        for key in [
-                            "target",
-                            "authors",
-                            "reviewers",
-                            "comment",
-                            "reviewResult",
-                        ]:
-                            del annotation_dict[key]
-                        annotation_value = str(annotation_dict)
-                        if first_annotation_and_value is None:
-                            first_annotation_and_value = annotation, annotation_value
-                        different_values.add(annotation_value)
-
-                    if first_annotation_and_value is not None:
-                        first_annotation, first_value = first_annotation_and_value
-                        if len(different_values) > 1:
-                            different_values.remove(first_value)
-                            comment = "Conflicting attribute found during migration: " + ", ".join(
-                                sorted(different_values),
-                            )
-                            first_annotation.comment = (
-                                "\n".join([comment, first_annotation.comment])
-                                if len(first_annotation.comment) > 0
-                                else comment
-                            )
-                            first_annotation.reviewResult = EnumReviewResult.UNSURE
-                        for annotation_store in [
-                            self.migrated_annotation_store,
-                            self.unsure_migrated_annotation_store,
-                        ]:
-                            for annotation in sorted_duplicates:
-                                if annotation is first_annotation:
-                                    continue
-                                annotations: list[AbstractAnnotation] = getattr(annotation_store, annotation_type)
-                                if annotation in annotations:
-                                    annotations.remove(annotation)
+                        if annotation is first_annotation:
+                            continue
+                        for index, remaining_annotation in enumerate(remaining_annotations):
+                            if remaining_annotation is annotation or remaining_annotation == annotation:
+                                removed.append(remaining_annotation)
+                                del remaining_annotations[index]
+                                break
+
+            for annotation_store, removed in zip(annotation_stores, removed_annotations, strict=True):
+                if len(removed) > 0:
+                    annotation_store.remove_annotations(removed)
+
+    @staticmethod
+    def _get_duplicates(annotations_with_target: list[AbstractAnnotation]) -> list[AbstractAnnotation]:
+        # The first annotation that has a duplicate of its type, that duplicate and all following annotations
+        for index, annotation in enumerate(annotations_with_target):
+            for duplicate in annotations_with_target:
+                if duplicate is not annotation and isinstance(duplicate, type(annotation)):
+                    return [duplicate, annotation, *annotations_with_target[index + 1 :]]
+        return []
+
+    @staticmethod
+    def _merge_duplicates(sorted_duplicates: list[AbstractAnnotation]) -> AbstractAnnotation:
+        # The first annotation is kept. If the other annotations have different values, it is marked as unsure.
+        first_annotation = sorted_duplicates[0]
+        values: dict[int, str] = {}
+        for annotation in sorted_duplicates:
+            if id(annotation) not in values:
+                annotation_dict = annotation.to_dict()
+                for key in [
+                    "target",
+                    "authors",
+                    "reviewers",
+                    "comment",
+                    "reviewResult",
+                ]:
+                    del annotation_dict[key]
+                values[id(annotation)] = str(annotation_dict)
+        different_values = set(values.values())
+
+        if len(different_values) > 1:
+            different_values.remove(values[id(first_annotation)])
+            comment = "Conflicting attribute found during migration: " + ", ".join(sorted(different_values))
+            first_annotation.comment = (
+                "\n".join([comment, first_annotation.comment]) if len(first_annotation.comment) > 0 else comment
+            )
+            first_annotation.reviewResult = EnumReviewResult.UNSURE
+        return first_annotation
@@ -7,7 +7,7 @@ from library_analyzer.processing.annotations.model import (
     TodoAnnotation,
 )
 from library_analyzer.processing.api.model import Attribute, Function, Result
-from library_analyzer.processing.migration.model import Mapping
+from library_analyzer.processing.migration.model import Mapping, MappingIndex
 
 from ._constants import migration_author
 from ._get_migration_text import get_migration_text
@@ -16,8 +16,9 @@ from ._get_migration_text import get_migration_text
 def migrate_called_after_annotation(
     origin_annotation: CalledAfterAnnotation,
     mapping: Mapping,
-    mappings: list[Mapping],
+    mappings: list[Mapping] | MappingIndex,
 ) -> list[AbstractAnnotation]:
+    mapping_index = mappings if isinstance(mappings, MappingIndex) else MappingIndex(mappings)
     migrated_annotations: list[AbstractAnnotation] = []
     for element in mapping.get_apiv2_elements():
         called_after_annotation = deepcopy(origin_annotation)
@@ -38,7 +39,11 @@ def migrate_called_after_annotation(
                 )
             continue
 
-        called_before_functions = _get_function_called_before_replacements(called_after_annotation, mappings, element)
+        called_before_functions = _get_function_called_before_replacements(
+            called_after_annotation,
+            mapping_index,
+            element,
+        )
         if len(called_before_functions) == 1 and called_before_functions[0] != element:
             migrated_annotations.append(
                 CalledAfterAnnotation(
@@ -71,7 +76,7 @@ def migrate_called_after_annotation(
 
 def _get_function_called_before_replacements(
     called_after_annotation: CalledAfterAnnotation,
-    mappings: list[Mapping],
+    mapping_index: MappingIndex,
     functionv2: Function,
 ) -> list[Function]:
     called_before_idv1 = (
@@ -79,16 +84,9 @@ def _get_function_called_before_replacements(
     )
     called_before_idv2_prefix = "/".join(functionv2.id.split("/")[:-1]) + "/"
     functions_in_same_class: list[Function] = []
-    for mapping in mappings:
-        found_mapped_function_in_same_class = False
-        for element in mapping.get_apiv1_elements():
-            if isinstance(element, Function) and called_before_idv1 == element.id:
-                found_mapped_function_in_same_class = True
-                break
-
-        if found_mapped_function_in_same_class:
-            for replacement in mapping.get_apiv2_elements():
-                if isinstance(replacement, Function) and replacement.id.startswith(called_before_idv2_prefix):
-                    functions_in_same_class.append(replacement)
-            break
+    mapping = mapping_index.get_mapping(called_before_idv1, Function)
+    if mapping is not None:
+        for replacement in mapping.get_apiv2_elements():
+            if isinstance(replacement, Function) and replacement.id.startswith(called_before_idv2_prefix):
+                functions_in_same_class.append(replacement)
     return functions_in_same_class
@@ -7,7 +7,7 @@ from library_analyzer.processing.annotations.model import (
     TodoAnnotation,
 )
 from library_analyzer.processing.api.model import Attribute, Function, Parameter, Result
-from library_analyzer.processing.migration.model import Mapping
+from library_analyzer.processing.migration.model import Mapping, MappingIndex
 
 from ._constants import migration_author
 from ._get_migration_text import get_migration_text
@@ -16,8 +16,9 @@ from ._get_migration_text import get_migration_text
 def migrate_group_annotation(
     origin_annotation: GroupAnnotation,
     mapping: Mapping,
-    mappings: list[Mapping],
+    mappings: list[Mapping] | MappingIndex,
 ) -> list[AbstractAnnotation]:
+    mapping_index = mappings if isinstance(mappings, MappingIndex) else MappingIndex(mappings)
     migrated_annotations: list[AbstractAnnotation] = []
 
     for functionv2 in mapping.get_apiv2_elements():
@@ -39,7 +40,7 @@ def migrate_group_annotation(
                 ),
             )
         else:
-            parameter_replacements = _get_mappings_for_grouped_parameters(group_annotation, mappings, functionv2)
+            parameter_replacements = _get_mappings_for_grouped_parameters(group_annotation, mapping_index, functionv2)
             grouped_parameters: list[Parameter] = []
             name_modifier = ""
 
@@ -103,20 +104,17 @@ def migrate_group_annotation(
 
 def _get_mappings_for_grouped_parameters(
     group_annotation: GroupAnnotation,
-    mappings: list[Mapping],
+    mapping_index: MappingIndex,
     functionv2: Function,
 ) -> list[list[Parameter]]:
     parameter_ids = [group_annotation.target + "/" + parameter_name for parameter_name in group_annotation.parameters]
 
     matched_parameters: list[list[Parameter]] = []
     for parameter_id in parameter_ids:
-        for mapping in mappings:
-            for parameterv1 in mapping.get_apiv1_elements():
-                if isinstance(parameterv1, Parameter) and parameterv1.id == parameter_id:
-                    mapped_parameters: list[Parameter] = []
-                    for parameterv2 in mapping.get_apiv2_elements():
-                        if isinstance(parameterv2, Parameter) and parameterv2.id.startswith(functionv2.id + "/"):
-                            mapped_parameters.append(parameterv2)
-                    matched_parameters.append(mapped_parameters)
-                    break
+        for mapping in mapping_index.get_mappings(parameter_id, Parameter):
+            mapped_parameters: list[Parameter] = []
+            for parameterv2 in mapping.get_apiv2_elements():
+                if isinstance(parameterv2, Parameter) and parameterv2.id.startswith(functionv2.id + "/"):
+                    mapped_parameters.append(parameterv2)
+            matched_parameters.append(mapped_parameters)
     return matched_parameters
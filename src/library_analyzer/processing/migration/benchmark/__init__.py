@@ -0,0 +1,8 @@
+"""Synthetic APIs and annotations to measure the performance of the migration."""
+
+from ._synthetic_migration import SyntheticAPIConfig, generate_synthetic_migration
+
+__all__ = [
+    "SyntheticAPIConfig",
+    "generate_synthetic_migration",
+]
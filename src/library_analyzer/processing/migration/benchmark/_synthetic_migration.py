@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field, replace
+
+from library_analyzer.processing.annotations.model import (
+    AnnotationStore,
+    BoundaryAnnotation,
+    ConstantAnnotation,
+    DescriptionAnnotation,
+    EnumReviewResult,
+    Interval,
+    MoveAnnotation,
+    RemoveAnnotation,
+    RenameAnnotation,
+    TodoAnnotation,
+    ValueAnnotation,
+)
+from library_analyzer.processing.api.model import (
+    API,
+    Class,
+    ClassDocstring,
+    Function,
+    FunctionDocstring,
+    Module,
+    Parameter,
+    ParameterAssignment,
+    ParameterDocstring,
+)
+
+_SYLLABLES = [
+    "ba",
+    "be",
+    "co",
+    "da",
+    "de",
+    "fi",
+    "ga",
+    "ho",
+    "ka",
+    "ke",
+    "li",
+    "lo",
+    "ma",
+    "mi",
+    "na",
+    "no",
+    "pa",
+    "pe",
+    "ra",
+    "ri",
+    "sa",
+    "se",
+    "ta",
+    "ti",
+    "to",
+    "va",
+    "ve",
+    "xi",
+    "za",
+    "zu",
+]
+_AUTHOR = "$autogen$"
+
+
+@dataclass(frozen=True)
+class SyntheticAPIConfig:
+    """
+    The size of a synthetic API and how it changes from the first to the second version.
+
+    Each class and global function of the first version is deleted, renamed, or moved to another module with the
+    given rate. Methods and parameters follow their class or function. All other elements stay the same.
+
+    Attributes
+    ----------
+    modules : int
+        how many modules the API has
+    classes : int
+        how many classes the API has
+    methods_per_class : int
+        how many methods each class has
+    functions : int
+        how many global functions the API has
+    parameters_per_function : int
+        how many parameters each function and method has, not counting `self`
+    docstring_words : int
+        how many words the docstring of each class, function, and parameter has
+    rename_rate : float
+        the share of classes and global functions that are renamed
+    move_rate : float
+        the share of classes and global functions that are moved to another module
+    delete_rate : float
+        the share of classes and global functions that are deleted
+    annotation_rate : float
+        the share of classes, functions, and parameters of the first version that are annotated
+    seed : int
+        the seed of the random generator, the same configuration always creates the same APIs and annotations
+    """
+
+    modules: int = 10
+    classes: int = 100
+    methods_per_class: int = 5
+    functions: int = 100
+    parameters_per_function: int = 3
+    docstring_words: int = 20
+    rename_rate: float = 0.1
+    move_rate: float = 0.05
+    delete_rate: float = 0.05
+    annotation_rate: float = 0.5
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        for name in ["modules", "classes", "methods_per_class", "functions", "parameters_per_function"]:
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must not be negative.")
+        if self.modules == 0 and self.classes + self.functions > 0:
+            raise ValueError("An API with classes or functions needs at least one module.")
+        for name in ["rename_rate", "move_rate", "delete_rate", "annotation_rate"]:
+            if not 0 <= getattr(self, name) <= 1:
+                raise ValueError(f"{name} must be between 0 and 1.")
+        if self.rename_rate + self.move_rate + self.delete_rate > 1:
+            raise ValueError("The rates of renamed, moved, and deleted elements must not sum up to more than 1.")
+
+
+@dataclass(frozen=True)
+class _ParameterSpec:
+    name: str
+    default_value: str | None
+    type_: str
+    description: str
+
+
+@dataclass(frozen=True)
+class _FunctionSpec:
+    name: str
+    parameters: tuple[_ParameterSpec, ...]
+    description: str
+    body: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _ClassSpec:
+    name: str
+    module: int
+    description: str
+    methods: tuple[_FunctionSpec, ...]
+
+
+@dataclass(frozen=True)
+class _GlobalFunctionSpec:
+    module: int
+    function: _FunctionSpec
+
+
+@dataclass
+class _Generator:
+    config: SyntheticAPIConfig
+    rng: random.Random = field(init=False)
+    used_names: set[str] = field(default_factory=set, init=False)
+
+    def __post_init__(self) -> None:
+        self.rng = random.Random(self.config.seed)
+
+    def word(self) -> str:
+        return "".join(self.rng.choice(_SYLLABLES) for _ in range(self.rng.randint(2, 3)))
+
+    def unique_name(self, word_count: int) -> str:
+        while True:
+            name = "_".join(self.word() for _ in range(word_count))
+            if name not in self.used_names:
+                self.used_names.add(name)
+                return name
+
+    def text(self) -> str:
+        return " ".join(self.word() for _ in range(self.config.docstring_words))
+
+    def parameter(self) -> _ParameterSpec:
+        type_ = self.rng.choice(["int", "float", "str", "bool"])
+        default_value = None
+        if self.rng.random() < 0.5:
+            default_value = {"int": "1", "float": "0.5", "str": "'auto'", "bool": "False"}[type_]
+        return _ParameterSpec(self.unique_name(2), default_value, type_, self.text())
+
+    def function(self) -> _FunctionSpec:
+        # Parameters without a default value must come first.
+        parameters = tuple(
+            sorted(
+                (self.parameter() for _ in range(self.config.parameters_per_function)),
+                key=lambda parameter: parameter.default_value is not None,
+            ),
+        )
+        body = tuple(
+            f"{self.word()} = {self.word()}({', '.join(parameter.name for parameter in parameters)})"
+            for _ in range(self.rng.randint(1, 8))
+        )
+        return _FunctionSpec(self.unique_name(2), parameters, self.text(), body)
+
+    def class_(self) -> _ClassSpec:
+        return _ClassSpec(
+            self.unique_name(2).title().replace("_", ""),
+            self.rng.randrange(self.config.modules),
+            self.text(),
+            tuple(self.function() for _ in range(self.config.methods_per_class)),
+        )
+
+    def global_function(self) -> _GlobalFunctionSpec:
+        return _GlobalFunctionSpec(self.rng.randrange(self.config.modules), self.function())
+
+    def change(self, module: int) -> tuple[str | None, int] | None:
+        """Return the suffix that is appended to the name of an element and its new module or None if it is deleted."""
+        draw = self.rng.random()
+        if draw < self.config.delete_rate:
+            return None
+        draw -= self.config.delete_rate
+        if draw < self.config.rename_rate:
+            return self.word(), module
+        draw -= self.config.rename_rate
+        if draw < self.config.move_rate and self.config.modules > 1:
+            return None, (module + self.rng.randrange(1, self.config.modules)) % self.config.modules
+        return None, module
+
+
+def generate_synthetic_migration(config: SyntheticAPIConfig) -> tuple[API, AnnotationStore, API]:
+    """
+    Generate two versions of a synthetic API and annotations for the first version.
+
+    The names, code, and documentation consist of random words, so the similarity of unrelated elements is low and
+    the migration behaves like on a real API. The annotations are a mix of the kinds of annotations that are migrated.
+
+    Parameters
+    ----------
+    config : SyntheticAPIConfig
+        the size of the APIs and how they differ
+
+    Returns
+    -------
+    apis_and_annotations : tuple[API, AnnotationStore, API]
+        the first version, the annotations of the first version, and the second version
+    """
+    generator = _Generator(config)
+    module_names = [generator.unique_name(1) for _ in range(config.modules)]
+    classesv1 = [generator.class_() for _ in range(config.classes)]
+    functionsv1 = [generator.global_function() for _ in range(config.functions)]
+
+    classesv2 = []
+    for class_ in classesv1:
+        change = generator.change(class_.module)
+        if change is not None:
+            suffix, module = change
+            name = class_.name if suffix is None else class_.name + suffix.title()
+            classesv2.append(replace(class_, name=name, module=module))
+    functionsv2 = []
+    for function in functionsv1:
+        change = generator.change(function.module)
+        if change is not None:
+            suffix, module = change
+            name = function.function.name if suffix is None else f"{function.function.name}_{suffix}"
+            functionsv2.append(_GlobalFunctionSpec(module, replace(function.function, name=name)))
+
+    apiv1 = _build_api("1.0.0", module_names, classesv1, functionsv1)
+    apiv2 = _build_api("2.0.0", module_names, classesv2, functionsv2)
+    return apiv1, _generate_annotations(apiv1, generator), apiv2
+
+
+def _build_api(
+    version: str,
+    module_names: list[str],
+    classes: list[_ClassSpec],
+    functions: list[_GlobalFunctionSpec],
+) -> API:
+    api = API("synthetic", "synthetic", version)
+    modules = [Module(f"synthetic/synthetic.{name}", f"synthetic.{name}", [], []) for name in module_names]
+    for module in modules:
+        api.add_module(module)
+
+    for class_spec in classes:
+        module = modules[class_spec.module]
+        class_id = f"{module.id}/{class_spec.name}"
+        class_qname = f"{module.name}.{class_spec.name}"
+        method_codes = [_indent(_function_code(method, is_method=True)) for method in class_spec.methods]
+        class_ = Class(
+            id=class_id,
+            qname=class_qname,
+            decorators=[],
+            superclasses=[],
+            is_public=True,
+            reexported_by=[],
+            docstring=ClassDocstring(description=class_spec.description),
+            code="\n".join([f"class {class_spec.name}:", f'    """{class_spec.description}"""', *method_codes]) + "\n",
+            instance_attributes=[],
+        )
+        for method in class_spec.methods:
+            class_.add_method(f"{class_id}/{method.name}")
+            api.add_function(_build_function(method, class_id, class_qname, is_method=True))
+        api.add_class(class_)
+        module.add_class(class_id)
+
+    for function_spec in functions:
+        module = modules[function_spec.module]
+        function = _build_function(function_spec.function, module.id, module.name, is_method=False)
+        api.add_function(function)
+        module.add_function(function.id)
+    return api
+
+
+def _build_function(spec: _FunctionSpec, parent_id: str, parent_qname: str, *, is_method: bool) -> Function:
+    function_id = f"{parent_id}/{spec.name}"
+    function_qname = f"{parent_qname}.{spec.name}"
+    parameters = []
+    if is_method:
+        parameters.append(
+            Parameter(
+                f"{function_id}/self",
+                "self",
+                f"{function_qname}.self",
+                None,
+                ParameterAssignment.IMPLICIT,
+                is_public=True,
+                docstring=ParameterDocstring(),
+            ),
+        )
+    parameters.extend(
+        Parameter(
+            f"{function_id}/{parameter.name}",
+            parameter.name,
+            f"{function_qname}.{parameter.name}",
+            parameter.default_value,
+            ParameterAssignment.POSITION_OR_NAME,
+            is_public=True,
+            docstring=ParameterDocstring(parameter.type_, parameter.default_value or "", parameter.description),
+        )
+        for parameter in spec.parameters
+    )
+    return Function(
+        id=function_id,
+        qname=function_qname,
+        decorators=[],
+        parameters=parameters,
+        results=[],
+        is_public=True,
+        reexported_by=[],
+        docstring=FunctionDocstring(description=spec.description),
+        code=_function_code(spec, is_method=is_method),
+    )
+
+
+def _function_code(spec: _FunctionSpec, *, is_method: bool) -> str:
+    parameters = ["self"] if is_method else []
+    for parameter in spec.parameters:
+        if parameter.default_value is None:
+            parameters.append(f"{parameter.name}: {parameter.type_}")
+        else:
+            parameters.append(f"{parameter.name}: {parameter.type_} = {parameter.default_value}")
+    lines = [
+        f"def {spec.name}({', '.join(parameters)}):",
+        f'    """{spec.description}"""',
+        *(f"    {line}" for line in spec.body),
+        f"    return {spec.body[-1].split(' = ')[0]}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _indent(code: str) -> str:
+    return "".join(f"    {line}" if line.strip() else line for line in code.splitlines(keepends=True))
+
+
+def _generate_annotations(api: API, generator: _Generator) -> AnnotationStore:
+    annotations = AnnotationStore()
+    rng = generator.rng
+    for class_ in api.classes.values():
+        if rng.random() < generator.config.annotation_rate:
+            annotations.add_annotation(
+                rng.choice(
+                    [
+                        RenameAnnotation(class_.id, [_AUTHOR], [], "", EnumReviewResult.NONE, f"{class_.name}New"),
+                        RemoveAnnotation(class_.id, [_AUTHOR], [], "", EnumReviewResult.NONE),
+                        TodoAnnotation(class_.id, [_AUTHOR], [], "", EnumReviewResult.NONE, generator.text()),
+                    ],
+                ),
+            )
+    for function in api.functions.values():
+        if rng.random() < generator.config.annotation_rate:
+            annotations.add_annotation(
+                rng.choice(
+                    [
+                        RenameAnnotation(function.id, [_AUTHOR], [], "", EnumReviewResult.NONE, f"{function.name}_new"),
+                        RemoveAnnotation(function.id, [_AUTHOR], [], "", EnumReviewResult.NONE),
+                        DescriptionAnnotation(function.id, [_AUTHOR], [], "", EnumReviewResult.NONE, generator.text()),
+                        MoveAnnotation(function.id, [_AUTHOR], [], "", EnumReviewResult.NONE, "synthetic.moved"),
+                    ],
+                ),
+            )
+    for parameter in api.parameters().values():
+        if parameter.name == "self" or rng.random() >= generator.config.annotation_rate:
+            continue
+        choices = [
+            ConstantAnnotation(
+                target=parameter.id,
+                authors=[_AUTHOR],
+                reviewers=[],
+                comment="",
+                reviewResult=EnumReviewResult.NONE,
+                defaultValueType=ValueAnnotation.DefaultValueType.STRING,
+                defaultValue=generator.word(),
+            ),
+            TodoAnnotation(parameter.id, [_AUTHOR], [], "", EnumReviewResult.NONE, generator.text()),
+        ]
+        if parameter.docstring.type in ["int", "float"]:
+            choices.append(
+                BoundaryAnnotation(
+                    parameter.id,
+                    [_AUTHOR],
+                    [],
+                    "",
+                    EnumReviewResult.NONE,
+                    Interval(0, 0, 100, 0, parameter.docstring.type == "int"),
+                ),
+            )
+        annotations.add_annotation(rng.choice(choices))
+    return annotations
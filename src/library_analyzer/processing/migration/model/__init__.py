@@ -1,6 +1,14 @@
 """Model classes to store migration information."""
 
+from ._alignment import weighted_edit_cost
 from ._api_mapping import APIMapping
+from ._candidate_index import (
+    CandidateIndex,
+    LookupComponent,
+    SimilarityFeatures,
+    TokenComponent,
+    levenshtein_tokens,
+)
 from ._differ import AbstractDiffer, SimpleDiffer
 from ._inheritance_differ import InheritanceDiffer
 from ._mapping import (
@@ -11,20 +19,32 @@ from ._mapping import (
     OneToOneMapping,
     merge_mappings,
 )
+from ._mapping_index import MappingIndex
+from ._similarity_store import SimilarityStore, SimilarityStoreStatistics, SimilarityStoreUpdates
 from ._strict_differ import StrictDiffer
 from ._unchanged_differ import UnchangedDiffer
 
 __all__ = [
     "APIMapping",
     "AbstractDiffer",
+    "CandidateIndex",
     "InheritanceDiffer",
+    "LookupComponent",
     "ManyToManyMapping",
     "ManyToOneMapping",
     "Mapping",
+    "MappingIndex",
     "OneToManyMapping",
     "OneToOneMapping",
+    "SimilarityFeatures",
+    "SimilarityStore",
+    "SimilarityStoreStatistics",
+    "SimilarityStoreUpdates",
     "SimpleDiffer",
     "StrictDiffer",
+    "TokenComponent",
     "UnchangedDiffer",
+    "levenshtein_tokens",
     "merge_mappings",
+    "weighted_edit_cost",
 ]
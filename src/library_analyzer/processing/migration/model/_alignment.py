@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+# The operations of an alignment, as stored in the table of the backtrace
+_MATCH = 0
+_INSERT = 1
+_DELETE = 2
+_SUBSTITUTE = 3
+
+
+def weighted_edit_cost(
+    sequencev1: Sequence[Hashable],
+    sequencev2: Sequence[Hashable],
+    cost_function: Callable[[int, int], float],
+) -> tuple[float, int]:
+    """
+    Compute the weighted costs of the edit operations that align two sequences.
+
+    The sequences are aligned with the Levenshtein distance. Each operation of the alignment that is not a match costs
+    `cost_function(index, length)`, where `index` is the 1-based position of the operation in the alignment and `length`
+    the number of operations of the alignment. If there are several alignments with the minimal number of operations,
+    an operation that consumes only an element of the shorter sequence is preferred to one that consumes only an element
+    of the longer sequence, which is preferred to a substitution.
+
+    Only the last row of the distance table is kept, the operations are recorded in one byte per cell and traced back
+    afterward.
+
+    Parameters
+    ----------
+    sequencev1 : Sequence[Hashable]
+        the first sequence
+    sequencev2 : Sequence[Hashable]
+        the second sequence
+    cost_function : Callable[[int, int], float]
+        computes the cost of an operation from its position in the alignment and the length of the alignment
+
+    Returns
+    -------
+    total_costs, length : tuple[float, int]
+        the sum of the costs of all operations that are not matches and the number of operations of the alignment
+    """
+    m = len(sequencev1)
+    n = len(sequencev2)
+    if m == n and sequencev1 == sequencev2:
+        return 0, m
+    if m > n:
+        sequencev1, sequencev2 = sequencev2, sequencev1
+        m, n = n, m
+
+    operations = bytearray(m * n)
+    previous_row = list(range(n + 1))
+    for i in range(1, m + 1):
+        elementv1 = sequencev1[i - 1]
+        row = [i] * (n + 1)
+        offset = (i - 1) * n - 1
+        for j in range(1, n + 1):
+            if elementv1 == sequencev2[j - 1]:
+                row[j] = previous_row[j - 1]
+                operations[offset + j] = _MATCH
+                continue
+            insert = previous_row[j]
+            delete = row[j - 1]
+            substitute = previous_row[j - 1]
+            if insert <= delete and insert <= substitute:
+                row[j] = insert + 1
+                operations[offset + j] = _INSERT
+            elif delete <= substitute:
+                row[j] = delete + 1
+                operations[offset + j] = _DELETE
+            else:
+                row[j] = substitute + 1
+                operations[offset + j] = _SUBSTITUTE
+        previous_row = row
+
+    # Whether each operation of the alignment is a match, from the last operation to the first one
+    matches: list[bool] = []
+    i, j = m, n
+    while i > 0 and j > 0:
+        operation = operations[(i - 1) * n + j - 1]
+        matches.append(operation == _MATCH)
+        if operation != _DELETE:
+            i -= 1
+        if operation != _INSERT:
+            j -= 1
+    matches.extend([False] * (i + j))
+
+    length = len(matches)
+    total_costs = 0.0
+    for index in range(1, length + 1):
+        if not matches[length - index]:
+            total_costs += cost_function(index, length)
+    return total_costs, length
@@ -1,5 +1,10 @@
-from collections.abc import Callable
-from typing import TypeVar
+from collections.abc import Callable, Iterable
+from multiprocessing import Pool
+from typing import Any, TypeVar
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
 
 from library_analyzer.processing.api.model import (
     API,
@@ -9,13 +14,19 @@ from library_analyzer.processing.api.model import (
     Parameter,
     Result,
 )
+from library_analyzer.utils import profile
 
+from ._candidate_index import CandidateIndex, SimilarityFeatures
 from ._differ import AbstractDiffer
 from ._mapping import Mapping, OneToOneMapping, merge_mappings
+from ._similarity_store import SimilarityStoreUpdates
 
 api_element = Attribute | Class | Function | Parameter | Result
 API_ELEMENTS = TypeVar("API_ELEMENTS", Attribute, Class, Function, Parameter, Result)
 
+# Below this number of pairs, starting worker processes takes longer than computing the similarities.
+_MIN_PAIRS_FOR_PROCESSES = 10_000
+
 
 class APIMapping:
     threshold_of_similarity_between_mappings: float
@@ -23,6 +34,11 @@ class APIMapping:
     apiv1: API
     apiv2: API
     differ: AbstractDiffer
+    exhaustive: bool
+    processes: int
+    optimal_assignment: bool
+    # How many pairs the differ did not compare, since their similarity could not reach the threshold.
+    pruned_pairs: int
 
     def __init__(
         self,
@@ -31,32 +47,268 @@ class APIMapping:
         differ: AbstractDiffer,
         threshold_of_similarity_for_creation_of_mappings: float = 0.5,
         threshold_of_similarity_between_mappings: float = 0.05,
+        *,
+        exhaustive: bool = False,
+        processes: int = 1,
+        optimal_assignment: bool = False,
     ) -> None:
         self.apiv1 = apiv1
         self.apiv2 = apiv2
         self.differ = differ
         self.threshold_of_similarity_for_creation_of_mappings = threshold_of_similarity_for_creation_of_mappings
         self.threshold_of_similarity_between_mappings = threshold_of_similarity_between_mappings
+        self.exhaustive = exhaustive
+        self.processes = processes
+        self.optimal_assignment = optimal_assignment
+        self.pruned_pairs = 0
 
     def _get_mappings_for_api_elements(
         self,
         api_elementv1_list: list[API_ELEMENTS],
         api_elementv2_list: list[API_ELEMENTS],
-        compute_similarity: Callable[[API_ELEMENTS, API_ELEMENTS], float],
+        compute_similarity: Callable[[API_ELEMENTS, API_ELEMENTS], float | None],
+    ) -> list[Mapping]:
+        element_mappings: list[Mapping] = []
+        # The features are extracted before the similarities are computed, so that worker processes share them.
+        with profile("extract_features"):
+            self.differ.extract_features(api_elementv1_list, "apiv1")
+            self.differ.extract_features(api_elementv2_list, "apiv2")
+        with profile("compute_similarities"):
+            similarity_rows = self._compute_similarity_rows(api_elementv1_list, api_elementv2_list, compute_similarity)
+        similarity_store = self.differ.get_similarity_store()
+        if similarity_store is not None:
+            similarity_store.flush()
+        if self.optimal_assignment:
+            with profile("assign_elements"):
+                return self._get_mappings_by_assignment(api_elementv1_list, api_elementv2_list, similarity_rows)
+        with profile("merge_mappings"):
+            for api_elementv1, similarity_row in zip(api_elementv1_list, similarity_rows, strict=True):
+                mapping_for_api_elementv1: list[Mapping] = [
+                    OneToOneMapping(similarity, api_elementv1, api_elementv2_list[position])
+                    for position, similarity in similarity_row
+                ]
+                mapping_for_api_elementv1.sort(key=Mapping.get_similarity, reverse=True)
+                new_mapping = self._merge_similar_mappings(mapping_for_api_elementv1)
+                if new_mapping is not None:
+                    self._merge_mappings_with_same_elements(new_mapping, element_mappings)
+        return element_mappings
+
+    def _get_mappings_by_assignment(
+        self,
+        api_elementv1_list: list[API_ELEMENTS],
+        api_elementv2_list: list[API_ELEMENTS],
+        similarity_rows: list[list[tuple[int, float]]],
     ) -> list[Mapping]:
+        """
+        Create the mappings from an assignment of apiv1 to apiv2 elements with the maximal total similarity.
+
+        Each element is assigned to at most one element of the other api. Afterward, an unassigned element is added to
+        the mapping of an assigned pair if its similarity to the element of the pair from the other api is less than
+        the threshold of similarity between mappings below the similarity of the pair. This way, one-to-many and
+        many-to-one mappings are still created for elements that are almost equally similar. Unlike the greedy merge of
+        mappings, the result does not depend on the order of the elements.
+
+        Parameters
+        ----------
+        api_elementv1_list : list[API_ELEMENTS]
+            the apiv1 elements
+        api_elementv2_list : list[API_ELEMENTS]
+            the apiv2 elements
+        similarity_rows : list[list[tuple[int, float]]]
+            for each apiv1 element, the positions of the apiv2 elements that reach the threshold and their similarity
+
+        Returns
+        -------
+        mappings : list[Mapping]
+            the mappings, ordered by the id of their first apiv1 element
+        """
+        assignment = _assign_elements(api_elementv1_list, api_elementv2_list, similarity_rows)
+        similarity_columns: list[list[tuple[int, float]]] = [[] for _ in api_elementv2_list]
+        for positionv1, similarity_row in enumerate(similarity_rows):
+            for positionv2, similarity in similarity_row:
+                similarity_columns[positionv2].append((positionv1, similarity))
+
+        # For each unassigned element, the assigned pair (as the position of its apiv1 element) it is added to, and its
+        # similarity to the element of the pair from the other api
+        added_elementsv1: dict[int, tuple[int, float]] = {}
+        added_elementsv2: dict[int, tuple[int, float]] = {}
+        assigned_positionsv2 = set(assignment.values())
+        mappings_to_merge: dict[int, list[Mapping]] = {}
+        for positionv1, positionv2 in sorted(assignment.items(), key=lambda item: api_elementv1_list[item[0]].id):
+            pair_similarity = dict(similarity_rows[positionv1])[positionv2]
+            mappings_to_merge[positionv1] = [
+                OneToOneMapping(pair_similarity, api_elementv1_list[positionv1], api_elementv2_list[positionv2]),
+            ]
+            for other_positionv2, similarity in similarity_rows[positionv1]:
+                if other_positionv2 not in assigned_positionsv2:
+                    self._add_to_assigned_pair(
+                        added_elementsv2,
+                        other_positionv2,
+                        positionv1,
+                        pair_similarity,
+                        similarity,
+                    )
+            for other_positionv1, similarity in similarity_columns[positionv2]:
+                if other_positionv1 not in assignment:
+                    self._add_to_assigned_pair(
+                        added_elementsv1,
+                        other_positionv1,
+                        positionv1,
+                        pair_similarity,
+                        similarity,
+                    )
+
+        for other_positionv2, (positionv1, similarity) in added_elementsv2.items():
+            mappings_to_merge[positionv1].append(
+                OneToOneMapping(similarity, api_elementv1_list[positionv1], api_elementv2_list[other_positionv2]),
+            )
+        for other_positionv1, (positionv1, similarity) in added_elementsv1.items():
+            mappings_to_merge[positionv1].append(
+                OneToOneMapping(
+                    similarity,
+                    api_elementv1_list[other_positionv1],
+                    api_elementv2_list[assignment[positionv1]],
+                ),
+            )
+
         element_mappings: list[Mapping] = []
-        for api_elementv1 in api_elementv1_list:
-            mapping_for_api_elementv1: list[Mapping] = []
-            for api_elementv2 in api_elementv2_list:
-                similarity = compute_similarity(api_elementv1, api_elementv2)
-                if similarity >= self.threshold_of_similarity_for_creation_of_mappings:
-                    mapping_for_api_elementv1.append(OneToOneMapping(similarity, api_elementv1, api_elementv2))
-            mapping_for_api_elementv1.sort(key=Mapping.get_similarity, reverse=True)
-            new_mapping = self._merge_similar_mappings(mapping_for_api_elementv1)
-            if new_mapping is not None:
-                self._merge_mappings_with_same_elements(new_mapping, element_mappings)
+        for assigned_mapping, *added_mappings in mappings_to_merge.values():
+            # Like in the greedy merge, the most similar mappings are merged first.
+            added_mappings.sort(key=_get_mapping_order)
+            new_mapping = assigned_mapping
+            for added_mapping in added_mappings:
+                new_mapping = merge_mappings(new_mapping, added_mapping)
+            element_mappings.append(new_mapping)
         return element_mappings
 
+    def _add_to_assigned_pair(
+        self,
+        added_elements: dict[int, tuple[int, float]],
+        position: int,
+        positionv1_of_pair: int,
+        pair_similarity: float,
+        similarity: float,
+    ) -> None:
+        if pair_similarity - similarity >= self.threshold_of_similarity_between_mappings:
+            return
+        # An element that is almost as similar to several assigned pairs is added to the pair it is most similar to.
+        # Since the pairs are visited in the order of their ids, the first of them wins ties.
+        if position not in added_elements or added_elements[position][1] < similarity:
+            added_elements[position] = (positionv1_of_pair, similarity)
+
+    def _compute_similarity_rows(
+        self,
+        api_elementv1_list: list[API_ELEMENTS],
+        api_elementv2_list: list[API_ELEMENTS],
+        compute_similarity: Callable[[API_ELEMENTS, API_ELEMENTS], float | None],
+    ) -> list[list[tuple[int, float]]]:
+        """
+        Compute the similarities of all apiv1 elements to the apiv2 elements that reach the threshold.
+
+        If more than one process is allowed and there are enough pairs, the apiv1 elements are split across worker
+        processes. Each worker computes the similarities with its own copy of the differ, so the result is the same as
+        in a single process. The similarities the workers add to the similarity store of the differ and the pairs they
+        prune are collected in this process.
+
+        Parameters
+        ----------
+        api_elementv1_list : list[API_ELEMENTS]
+            the apiv1 elements
+        api_elementv2_list : list[API_ELEMENTS]
+            the apiv2 elements
+        compute_similarity : Callable[[API_ELEMENTS, API_ELEMENTS], float | None]
+            computes the similarity between an apiv1 and an apiv2 element or returns None if it cannot reach the
+            threshold
+
+        Returns
+        -------
+        similarity_rows : list[list[tuple[int, float]]]
+            for each apiv1 element, the positions of the apiv2 elements that reach the threshold and their similarity,
+            in the order of the apiv2 elements
+        """
+        candidate_index = self._create_candidate_index(api_elementv2_list)
+        if self.processes <= 1 or len(api_elementv1_list) * len(api_elementv2_list) < _MIN_PAIRS_FOR_PROCESSES:
+            return [
+                self._compute_similarity_row(api_elementv1, api_elementv2_list, compute_similarity, candidate_index)
+                for api_elementv1 in api_elementv1_list
+            ]
+
+        # Several chunks per process balance the load, since the number of candidates differs between elements.
+        chunk_count = min(self.processes * 4, len(api_elementv1_list))
+        chunk_size = -(-len(api_elementv1_list) // chunk_count)
+        chunks = [
+            (chunk_start, min(chunk_start + chunk_size, len(api_elementv1_list)))
+            for chunk_start in range(0, len(api_elementv1_list), chunk_size)
+        ]
+        with Pool(
+            processes=min(self.processes, len(chunks)),
+            initializer=_initialize_similarity_worker,
+            initargs=[self, api_elementv1_list, api_elementv2_list, compute_similarity, candidate_index],
+        ) as pool:
+            chunk_results = pool.map(_compute_similarity_rows_in_worker, chunks)
+        similarity_store = self.differ.get_similarity_store()
+        for _, similarity_store_updates, pruned_pairs in chunk_results:
+            if similarity_store is not None and similarity_store_updates is not None:
+                similarity_store.apply_updates(similarity_store_updates)
+            self.pruned_pairs += pruned_pairs
+        return [similarity_row for similarity_rows, _, _ in chunk_results for similarity_row in similarity_rows]
+
+    def _compute_similarity_row(
+        self,
+        api_elementv1: API_ELEMENTS,
+        api_elementv2_list: list[API_ELEMENTS],
+        compute_similarity: Callable[[API_ELEMENTS, API_ELEMENTS], float | None],
+        candidate_index: CandidateIndex[API_ELEMENTS] | None,
+    ) -> list[tuple[int, float]]:
+        positions: Iterable[int] = range(len(api_elementv2_list))
+        if candidate_index is not None:
+            featuresv1 = self.differ.get_similarity_features(api_elementv1, "apiv1")
+            if featuresv1 is not None:
+                positions = candidate_index.get_candidate_positions(
+                    featuresv1,
+                    self.threshold_of_similarity_for_creation_of_mappings,
+                )
+
+        similarity_row = []
+        for position in positions:
+            similarity = compute_similarity(api_elementv1, api_elementv2_list[position])
+            if similarity is None:
+                self.pruned_pairs += 1
+            elif similarity >= self.threshold_of_similarity_for_creation_of_mappings:
+                similarity_row.append((position, similarity))
+        return similarity_row
+
+    def _create_candidate_index(
+        self,
+        api_elementv2_list: list[API_ELEMENTS],
+    ) -> CandidateIndex[API_ELEMENTS] | None:
+        """
+        Create the index of the apiv2 elements that finds the elements an apiv1 element has to be compared to.
+
+        With the index, only the apiv2 elements whose similarity can reach the threshold for the creation of mappings
+        are compared. Either way, the result of the mapping is the same.
+
+        Parameters
+        ----------
+        api_elementv2_list : list[API_ELEMENTS]
+            the apiv2 elements
+
+        Returns
+        -------
+        candidate_index : CandidateIndex[API_ELEMENTS] | None
+            the index or None if the differ cannot bound the similarity of the elements or in exhaustive mode
+        """
+        if self.exhaustive or len(api_elementv2_list) == 0:
+            return None
+
+        featuresv2: list[SimilarityFeatures] = []
+        for api_elementv2 in api_elementv2_list:
+            features = self.differ.get_similarity_features(api_elementv2, "apiv2")
+            if features is None:
+                return None
+            featuresv2.append(features)
+        return CandidateIndex.create(api_elementv2_list, featuresv2)
+
     def map_api(self) -> list[Mapping]:
         mappings: list[Mapping] = []
         related_mappings = self.differ.get_related_mappings()
@@ -80,7 +332,7 @@ class APIMapping:
                     new_mapping = self._get_mappings_for_api_elements(
                         [element for element in mapping.get_apiv1_elements() if isinstance(element, Function)],
                         [element for element in mapping.get_apiv2_elements() if isinstance(element, Function)],
-                        self.differ.compute_function_similarity,
+                        self._compute_function_similarity,
                     )
                     mappings.extend(new_mapping)
                 elif isinstance(mapping.get_apiv1_elements()[0], Parameter) and isinstance(
@@ -108,7 +360,7 @@ class APIMapping:
                 self._get_mappings_for_api_elements(
                     list(self.apiv1.functions.values()),
                     list(self.apiv2.functions.values()),
-                    self.differ.compute_function_similarity,
+                    self._compute_function_similarity,
                 ),
             )
             mappings.extend(
@@ -123,6 +375,13 @@ class APIMapping:
         mappings.sort(key=Mapping.get_similarity, reverse=True)
         return mappings
 
+    def _compute_function_similarity(self, functionv1: Function, functionv2: Function) -> float | None:
+        return self.differ.compute_function_similarity_with_threshold(
+            functionv1,
+            functionv2,
+            self.threshold_of_similarity_for_creation_of_mappings,
+        )
+
     def _merge_similar_mappings(self, mappings: list[Mapping]) -> Mapping | None:
         """
         Return the best mapping from this apiv1 element to apiv2 elements.
@@ -179,3 +438,115 @@ class APIMapping:
             mappings.remove(conflicted_mapping)
 
         mappings.append(mapping_to_be_appended)
+
+
+def _get_mapping_order(mapping: Mapping) -> tuple[float, str, str]:
+    return (
+        -mapping.similarity,
+        mapping.get_apiv1_elements()[0].id,
+        mapping.get_apiv2_elements()[0].id,
+    )
+
+
+def _assign_elements(
+    api_elementv1_list: list[API_ELEMENTS],
+    api_elementv2_list: list[API_ELEMENTS],
+    similarity_rows: list[list[tuple[int, float]]],
+) -> dict[int, int]:
+    """
+    Assign apiv1 to apiv2 elements, so that the sum of the similarities of the assigned pairs is maximal.
+
+    Only pairs with a similarity in `similarity_rows` can be assigned. The problem is solved as a minimum weight full
+    matching of a sparse bipartite graph. Each apiv1 element gets its own dummy apiv2 element, so that a full matching
+    exists even if an apiv1 element stays unassigned. The elements are sorted by their ids first, so the assignment does
+    not depend on their order, even if several assignments have the same total similarity.
+
+    Parameters
+    ----------
+    api_elementv1_list : list[API_ELEMENTS]
+        the apiv1 elements
+    api_elementv2_list : list[API_ELEMENTS]
+        the apiv2 elements
+    similarity_rows : list[list[tuple[int, float]]]
+        for each apiv1 element, the positions of the apiv2 elements that can be assigned and their similarity
+
+    Returns
+    -------
+    assignment : dict[int, int]
+        the position of the assigned apiv2 element for the position of each assigned apiv1 element
+    """
+    positionsv1 = [position for position, similarity_row in enumerate(similarity_rows) if len(similarity_row) > 0]
+    positionsv1.sort(key=lambda position: api_elementv1_list[position].id)
+    positionsv2 = sorted(
+        {position for similarity_row in similarity_rows for position, _ in similarity_row},
+        key=lambda position: api_elementv2_list[position].id,
+    )
+    if len(positionsv1) == 0:
+        return {}
+    columns = {position: column for column, position in enumerate(positionsv2)}
+
+    # Similarities are at most 1, so all weights are positive and the weight of an unassigned apiv1 element (2) is
+    # higher than the weight of any pair. Minimizing the sum of the weights maximizes the sum of the similarities.
+    rows: list[int] = []
+    cols: list[int] = []
+    weights: list[float] = []
+    for row, positionv1 in enumerate(positionsv1):
+        for positionv2, similarity in similarity_rows[positionv1]:
+            rows.append(row)
+            cols.append(columns[positionv2])
+            weights.append(2.0 - min(similarity, 1.0))
+        rows.append(row)
+        cols.append(len(positionsv2) + row)
+        weights.append(2.0)
+    biadjacency_matrix = csr_matrix(
+        (np.array(weights), (np.array(rows), np.array(cols))),
+        shape=(len(positionsv1), len(positionsv2) + len(positionsv1)),
+    )
+    matched_rows, matched_cols = min_weight_full_bipartite_matching(biadjacency_matrix)
+    return {
+        positionsv1[row]: positionsv2[col]
+        for row, col in zip(matched_rows, matched_cols, strict=True)
+        if col < len(positionsv2)
+    }
+
+
+_worker_state: dict[str, Any] = {}
+
+
+def _initialize_similarity_worker(
+    api_mapping: APIMapping,
+    api_elementv1_list: list[API_ELEMENTS],
+    api_elementv2_list: list[API_ELEMENTS],
+    compute_similarity: Callable[[API_ELEMENTS, API_ELEMENTS], float | None],
+    candidate_index: CandidateIndex[API_ELEMENTS] | None,
+) -> None:
+    _worker_state["api_mapping"] = api_mapping
+    _worker_state["api_elementv1_list"] = api_elementv1_list
+    _worker_state["api_elementv2_list"] = api_elementv2_list
+    _worker_state["compute_similarity"] = compute_similarity
+    _worker_state["candidate_index"] = candidate_index
+    # The worker only reports the entries it adds itself, the entries of the parent process stay there.
+    similarity_store = api_mapping.differ.get_similarity_store()
+    if similarity_store is not None:
+        similarity_store.take_updates()
+    api_mapping.pruned_pairs = 0
+
+
+def _compute_similarity_rows_in_worker(
+    chunk: tuple[int, int],
+) -> tuple[list[list[tuple[int, float]]], SimilarityStoreUpdates | None, int]:
+    api_mapping: APIMapping = _worker_state["api_mapping"]
+    chunk_start, chunk_end = chunk
+    similarity_rows = [
+        api_mapping._compute_similarity_row(
+            api_elementv1,
+            _worker_state["api_elementv2_list"],
+            _worker_state["compute_similarity"],
+            _worker_state["candidate_index"],
+        )
+        for api_elementv1 in _worker_state["api_elementv1_list"][chunk_start:chunk_end]
+    ]
+    pruned_pairs = api_mapping.pruned_pairs
+    api_mapping.pruned_pairs = 0
+    similarity_store = api_mapping.differ.get_similarity_store()
+    return similarity_rows, similarity_store.take_updates() if similarity_store is not None else None, pruned_pairs
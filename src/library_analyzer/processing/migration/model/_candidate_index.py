@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping, Sequence
+
+API_ELEMENT = TypeVar("API_ELEMENT")
+CATEGORY = TypeVar("CATEGORY", bound="Hashable")
+
+# A small slack that keeps rounding errors in the bounds from excluding pairs that reach the threshold exactly.
+_EPSILON = 1e-9
+
+
+def levenshtein_tokens(sequence: Iterable[Hashable]) -> tuple[Hashable, ...]:
+    """
+    Convert a sequence to the tokens that `Levenshtein.distance` compares.
+
+    The Levenshtein package compares strings by their characters and the elements of other sequences by their hash,
+    strings of length one by their code point.
+
+    Parameters
+    ----------
+    sequence : Iterable[Hashable]
+        a string or a sequence of hashable elements
+
+    Returns
+    -------
+    tokens : tuple[Hashable, ...]
+        the tokens that are equal if and only if `Levenshtein.distance` treats the elements as equal
+    """
+    if isinstance(sequence, str):
+        return tuple(sequence)
+    return tuple(
+        ord(element) if isinstance(element, str) and len(element) == 1 else hash(element) for element in sequence
+    )
+
+
+@dataclass(frozen=True)
+class TokenComponent:
+    """
+    A component of a similarity that is computed from the edit distance between two token sequences.
+
+    The component of two elements is at most the number of tokens they share divided by the length of the longer
+    sequence, since every token that is not shared needs an edit operation.
+
+    Attributes
+    ----------
+    tokens : tuple[Hashable, ...]
+        the tokens that are compared
+    absent : bool
+        whether the component is missing for this element. If it is missing for both elements, it is not part of their
+        similarity.
+    position_weighted : bool
+        whether the edit operations are weighted by their position, the first one with the highest weight, as in
+        `SimpleDiffer.distance_elements_with_cost_function`
+    """
+
+    tokens: tuple[Hashable, ...]
+    absent: bool = False
+    position_weighted: bool = False
+
+
+@dataclass(frozen=True)
+class LookupComponent(Generic[CATEGORY]):
+    """
+    A component of a similarity that is looked up in a table by a category of both elements.
+
+    Attributes
+    ----------
+    category : CATEGORY
+        the category of this element
+    similarities : Mapping[CATEGORY, Mapping[CATEGORY, float]]
+        the component for each pair of categories
+    """
+
+    category: CATEGORY
+    similarities: Mapping[CATEGORY, Mapping[CATEGORY, float]]
+
+
+@dataclass(frozen=True)
+class SimilarityFeatures:
+    """
+    The features of an API element that bound its similarity to other API elements from above.
+
+    The similarity must be the mean of components between 0 and 1. Some components are computed from the edit distance
+    between token sequences, some are looked up by a category, and all other components are bounded by 1.
+
+    Attributes
+    ----------
+    token_components : tuple[TokenComponent, ...]
+        the components that are computed from an edit distance
+    lookup_components : tuple[LookupComponent, ...]
+        the components that are looked up by a category
+    other_components : tuple[bool, ...]
+        for each other component, whether it is present for this element. If it is missing for both elements, it is not
+        part of their similarity, if it is missing for one of them, it is 0.
+    """
+
+    token_components: tuple[TokenComponent, ...]
+    lookup_components: tuple[LookupComponent, ...] = ()
+    other_components: tuple[bool, ...] = ()
+
+
+def _count_bound(overlap: int, length: int) -> float:
+    if length == 0:
+        return 1.0
+    return overlap / length
+
+
+def _position_weighted_bound(match_positions: list[int], min_length: int, max_length: int | None) -> float:
+    """
+    Bound a position weighted component from above.
+
+    The similarity is the sum of the weights of the matches in the edit string divided by the sum of all weights. The
+    weight of position p in an edit string of length L is (L - p + 1) / L.
+
+    Parameters
+    ----------
+    match_positions : list[int]
+        for each possible match, the earliest position it can have in the edit string, in ascending order
+    min_length : int
+        the minimal length of the edit string, the length of the longer sequence
+    max_length : int | None
+        the maximal length of the edit string, the sum of the lengths of both sequences, or None if it is unknown
+
+    Returns
+    -------
+    bound : float
+        an upper bound of the component
+    """
+    if min_length == 0:
+        return 1.0
+    if not match_positions:
+        return 0.0
+
+    # Matches are strictly ordered, so each match is at least one position behind the previous one.
+    positions = []
+    previous_position = 0
+    for position in match_positions:
+        previous_position = max(position, previous_position + 1)
+        positions.append(previous_position)
+
+    best_bound = 0.0
+    length = min_length
+    while max_length is None or length <= max_length:
+        weights = sum(length - position + 1 for position in positions if position <= length)
+        bound = 2 * weights / (length * (length + 1))
+        # Once all matches fit into the edit string, the bound has a single maximum.
+        if bound <= best_bound and positions[-1] <= length:
+            break
+        best_bound = max(best_bound, bound)
+        length += 1
+    return best_bound
+
+
+@dataclass
+class _IndexedFeatures:
+    features: SimilarityFeatures
+    # For each token component, the positions of each token, starting at 1.
+    token_positions: list[dict[Hashable, list[int]]]
+
+    @staticmethod
+    def create(features: SimilarityFeatures) -> _IndexedFeatures:
+        token_positions = []
+        for component in features.token_components:
+            positions: dict[Hashable, list[int]] = {}
+            for position, token in enumerate(component.tokens, start=1):
+                positions.setdefault(token, []).append(position)
+            token_positions.append(positions)
+        return _IndexedFeatures(features, token_positions)
+
+    @property
+    def group_key(self) -> tuple[tuple[bool, ...], tuple[Hashable, ...], tuple[bool, ...]]:
+        # Elements with the same key have the same bound for all apiv1 elements they do not share indexed tokens with.
+        return (
+            tuple(component.absent for component in self.features.token_components),
+            tuple(component.category for component in self.features.lookup_components),
+            tuple(not present for present in self.features.other_components),
+        )
+
+
+@dataclass
+class CandidateIndex(Generic[API_ELEMENT]):
+    """
+    Inverted index that finds all apiv2 elements that can be similar enough to an apiv1 element.
+
+    The index maps the tokens of the apiv2 elements to the elements that contain them. Tokens that occur in too many
+    elements are not indexed, as they do not help to tell elements apart. For an apiv1 element, all apiv2 elements that
+    share an indexed token are candidates. For the other apiv2 elements the similarity is bounded from above by
+    assuming that all unindexed tokens of the apiv1 element are shared. If this bound reaches the threshold, all of
+    them are candidates as well. Afterward, the candidates are filtered by an upper bound of their similarity, so no
+    pair that can reach the threshold is lost.
+
+    Attributes
+    ----------
+    elements : list[API_ELEMENT]
+        the indexed apiv2 elements
+    max_postings : int
+        tokens that occur in more elements are not indexed
+    """
+
+    elements: list[API_ELEMENT]
+    max_postings: int
+    _features: list[_IndexedFeatures] = field(default_factory=list, init=False, repr=False)
+    _postings: list[dict[Hashable, list[int]]] = field(default_factory=list, init=False, repr=False)
+    _unindexed_tokens: list[set[Hashable]] = field(default_factory=list, init=False, repr=False)
+    _groups: dict[tuple[tuple[bool, ...], tuple[Hashable, ...], tuple[bool, ...]], list[int]] = field(
+        default_factory=dict,
+        init=False,
+        repr=False,
+    )
+
+    @staticmethod
+    def create(
+        elements: Sequence[API_ELEMENT],
+        features: Sequence[SimilarityFeatures],
+        max_postings: int | None = None,
+    ) -> CandidateIndex[API_ELEMENT]:
+        """
+        Create the index for apiv2 elements.
+
+        Parameters
+        ----------
+        elements : Sequence[API_ELEMENT]
+            the apiv2 elements
+        features : Sequence[SimilarityFeatures]
+            the features of the apiv2 elements in the same order
+        max_postings : int | None
+            tokens that occur in more elements are not indexed. By default, this is a twentieth of the elements, but at
+            least 16.
+
+        Returns
+        -------
+        index : CandidateIndex[API_ELEMENT]
+            the index
+        """
+        if max_postings is None:
+            max_postings = max(16, len(elements) // 20)
+        index = CandidateIndex(list(elements), max_postings)
+        for position, element_features in enumerate(features):
+            indexed_features = _IndexedFeatures.create(element_features)
+            index._features.append(indexed_features)
+            index._groups.setdefault(indexed_features.group_key, []).append(position)
+            if not index._postings:
+                index._postings = [{} for _ in indexed_features.token_positions]
+            for postings, token_positions in zip(index._postings, indexed_features.token_positions, strict=True):
+                for token in token_positions:
+                    postings.setdefault(token, []).append(position)
+        for postings in index._postings:
+            unindexed_tokens = {token for token, positions in postings.items() if len(positions) > max_postings}
+            for token in unindexed_tokens:
+                del postings[token]
+            index._unindexed_tokens.append(unindexed_tokens)
+        return index
+
+    def get_candidates(self, features: SimilarityFeatures, threshold: float) -> list[API_ELEMENT]:
+        """
+        Get all apiv2 elements whose similarity to an apiv1 element can reach the threshold.
+
+        Parameters
+        ----------
+        features : SimilarityFeatures
+            the features of the apiv1 element
+        threshold : float
+            the minimal similarity
+
+        Returns
+        -------
+        candidates : list[API_ELEMENT]
+            the candidates in the order of `elements`
+        """
+        return [self.elements[position] for position in self.get_candidate_positions(features, threshold)]
+
+    def get_candidate_positions(self, features: SimilarityFeatures, threshold: float) -> list[int]:
+        """
+        Get the positions of all apiv2 elements whose similarity to an apiv1 element can reach the threshold.
+
+        Parameters
+        ----------
+        features : SimilarityFeatures
+            the features of the apiv1 element
+        threshold : float
+            the minimal similarity
+
+        Returns
+        -------
+        positions : list[int]
+            the positions of the candidates in `elements` in ascending order
+        """
+        if not self.elements:
+            return []
+        indexed_features = _IndexedFeatures.create(features)
+        candidates: set[int] = set()
+        unindexed_positions = []
+        for postings, unindexed_tokens, token_positions in zip(
+            self._postings,
+            self._unindexed_tokens,
+            indexed_features.token_positions,
+            strict=True,
+        ):
+            positions_of_unindexed_tokens = []
+            for token, positions in token_positions.items():
+                if token in unindexed_tokens:
+                    positions_of_unindexed_tokens.extend(positions)
+                else:
+                    candidates.update(postings.get(token, ()))
+            unindexed_positions.append(sorted(positions_of_unindexed_tokens))
+
+        for group_key, positions in self._groups.items():
+            if (
+                self._bound_without_indexed_tokens(indexed_features, unindexed_positions, group_key)
+                >= threshold - _EPSILON
+            ):
+                candidates.update(positions)
+
+        return [
+            position
+            for position in sorted(candidates)
+            if _bound(indexed_features, self._features[position]) >= threshold - _EPSILON
+        ]
+
+    @staticmethod
+    def _bound_without_indexed_tokens(
+        indexed_features: _IndexedFeatures,
+        unindexed_positions: list[list[int]],
+        group_key: tuple[tuple[bool, ...], tuple[Hashable, ...], tuple[bool, ...]],
+    ) -> float:
+        # Only unindexed tokens can be shared. The longer sequence is at least as long as the sequence of the apiv1
+        # element, so the bound does not depend on the apiv2 element.
+        token_absences, categories, other_absences = group_key
+        total = 0.0
+        component_count = 0
+        for component, positions, other_absent in zip(
+            indexed_features.features.token_components,
+            unindexed_positions,
+            token_absences,
+            strict=True,
+        ):
+            if component.absent and other_absent:
+                continue
+            component_count += 1
+            if component.position_weighted:
+                total += _position_weighted_bound(positions, len(component.tokens), None)
+            else:
+                total += _count_bound(len(positions), len(component.tokens))
+        for lookup_component, category in zip(indexed_features.features.lookup_components, categories, strict=True):
+            component_count += 1
+            total += max(0.0, lookup_component.similarities[lookup_component.category][category])
+        for present, other_absent in zip(indexed_features.features.other_components, other_absences, strict=True):
+            if present or not other_absent:
+                component_count += 1
+                total += 1.0 if present and not other_absent else 0.0
+        return total / max(component_count, 1)
+
+
+def _bound(featuresv1: _IndexedFeatures, featuresv2: _IndexedFeatures) -> float:
+    total = 0.0
+    component_count = 0
+    for componentv1, componentv2, positionsv1, positionsv2 in zip(
+        featuresv1.features.token_components,
+        featuresv2.features.token_components,
+        featuresv1.token_positions,
+        featuresv2.token_positions,
+        strict=True,
+    ):
+        if componentv1.absent and componentv2.absent:
+            continue
+        component_count += 1
+        lengthv1 = len(componentv1.tokens)
+        lengthv2 = len(componentv2.tokens)
+        if componentv1.position_weighted:
+            # The k-th match of a token cannot be earlier than the k-th occurrence of the token in both sequences.
+            match_positions = sorted(
+                max(positionv1, positionv2)
+                for token, token_positions in positionsv1.items()
+                if token in positionsv2
+                for positionv1, positionv2 in zip(token_positions, positionsv2[token], strict=False)
+            )
+            total += _position_weighted_bound(match_positions, max(lengthv1, lengthv2), lengthv1 + lengthv2)
+        else:
+            overlap = sum(
+                min(len(token_positions), len(positionsv2[token]))
+                for token, token_positions in positionsv1.items()
+                if token in positionsv2
+            )
+            total += _count_bound(overlap, max(lengthv1, lengthv2))
+    for lookup_componentv1, lookup_componentv2 in zip(
+        featuresv1.features.lookup_components,
+        featuresv2.features.lookup_components,
+        strict=True,
+    ):
+        component_count += 1
+        total += max(0.0, lookup_componentv1.similarities[lookup_componentv1.category][lookup_componentv2.category])
+    for presentv1, presentv2 in zip(
+        featuresv1.features.other_components,
+        featuresv2.features.other_components,
+        strict=True,
+    ):
+        if presentv1 or presentv2:
+            component_count += 1
+            total += 1.0 if presentv1 and presentv2 else 0.0
+    return total / max(component_count, 1)
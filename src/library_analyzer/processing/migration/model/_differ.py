@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, TypeVar
@@ -12,20 +13,20 @@ from library_analyzer.processing.api.model import (
     AbstractType,
     Attribute,
     Class,
-    ClassDocstring,
     Function,
-    FunctionDocstring,
     Parameter,
     ParameterAssignment,
-    ParameterDocstring,
     Result,
     UnionType,
 )
 
+from ._alignment import weighted_edit_cost
+from ._candidate_index import LookupComponent, SimilarityFeatures, TokenComponent, levenshtein_tokens
 from ._get_unmapped_api_elements import _get_unmapped_api_elements
+from ._similarity_store import SimilarityStore
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterable, Sequence
 
     from ._mapping import Mapping
 
@@ -97,6 +98,34 @@ class AbstractDiffer(ABC):
             value between 0 and 1, where 1 means that the elements are equal.
         """
 
+    def compute_function_similarity_with_threshold(
+        self,
+        functionv1: Function,
+        functionv2: Function,
+        threshold: float,  # noqa: ARG002
+    ) -> float | None:
+        """
+        Compute the similarity between functions from apiv1 and apiv2 if it can reach the threshold.
+
+        Differs that can bound the similarity from above cheaply skip computing it if the bound is below the threshold.
+        By default, the similarity is always computed.
+
+        Parameters
+        ----------
+        functionv1 : Function
+            function from apiv1
+        functionv2 : Function
+            function from apiv2
+        threshold : float
+            the similarity the functions must reach
+
+        Returns
+        -------
+        similarity : float | None
+            the same value as `compute_function_similarity` or None if it cannot reach the threshold.
+        """
+        return self.compute_function_similarity(functionv1, functionv2)
+
     @abstractmethod
     def compute_parameter_similarity(self, parameterv1: Parameter, parameterv2: Parameter) -> float:
         """
@@ -170,6 +199,62 @@ class AbstractDiffer(ABC):
             additional mappings that should be included in the result of the differentiation.
         """
 
+    def get_similarity_features(
+        self,
+        api_element: api_element,  # noqa: ARG002
+        api_version: str,  # noqa: ARG002
+    ) -> SimilarityFeatures | None:
+        """
+        Compute the features of an api element that bound its similarity to other api elements from above.
+
+        The features allow to compare an element only to the elements that can be similar enough to it. By default, no
+        features are computed, so all elements are compared to each other.
+
+        Parameters
+        ----------
+        api_element : api_element
+            element from apiv1 or apiv2
+        api_version : str
+            "apiv1" or "apiv2", the api the element belongs to
+
+        Returns
+        -------
+        features : SimilarityFeatures | None
+            the features of the element or None if the similarity of the element cannot be bounded.
+        """
+        return None
+
+    def extract_features(
+        self,
+        api_elements: Iterable[api_element],  # noqa: ARG002
+        api_version: str,  # noqa: ARG002
+    ) -> None:
+        """
+        Extract the features of api elements that are compared when computing similarities, before they are compared.
+
+        Differs that compare derived features of the elements (e.g. formatted code) can compute them once per element
+        here instead of once per pair of elements. By default, nothing is extracted.
+
+        Parameters
+        ----------
+        api_elements : Iterable[api_element]
+            elements from apiv1 or apiv2
+        api_version : str
+            "apiv1" or "apiv2", the api the elements belong to
+        """
+        return
+
+    def get_similarity_store(self) -> SimilarityStore | None:
+        """
+        Get the store in which the differ persists the similarities it computes.
+
+        Returns
+        -------
+        similarity_store : SimilarityStore | None
+            the store or None if the similarities are not persisted.
+        """
+        return None
+
     def is_base_differ(self) -> bool:
         return False
 
@@ -177,11 +262,41 @@ class AbstractDiffer(ABC):
 X = TypeVar("X")
 
 
+@dataclass(frozen=True)
+class _ElementFeatures:
+    """
+    The features of a class, function, or parameter that the SimpleDiffer compares.
+
+    Strings are interned, so equal words and lines of different elements are stored once. Other api elements are stored
+    as their hashes, since Levenshtein compares them by their hashes anyway.
+    """
+
+    module_path: tuple[str, ...]
+    documentation: tuple[str, ...]
+    has_documentation: bool
+    code_lines: tuple[str, ...] = ()
+    instance_attributes: tuple[int, ...] = ()
+    methods: tuple[str, ...] = ()
+    parameters: tuple[int, ...] = ()
+    # None if the parameter has no type
+    types: tuple[int, ...] | None = None
+    # None if the similarities are not persisted
+    content_hash: str | None = None
+
+
+def _length_bound(sequencev1: Sequence[object], sequencev2: Sequence[object]) -> float:
+    return 1 - abs(len(sequencev1) - len(sequencev2)) / max(len(sequencev1), len(sequencev2), 1)
+
+
 class SimpleDiffer(AbstractDiffer):
     assigned_by_look_up_similarity: dict[ParameterAssignment, dict[ParameterAssignment, float]]
-    previous_parameter_similarity: dict[str, dict[str, float]] = {}
-    previous_function_similarity: dict[str, dict[str, float]] = {}
-    formatted_code: dict[str, dict[str, list[str]]] = {"apiv1": {}, "apiv2": {}}
+    previous_parameter_similarity: dict[str, dict[str, float]]
+    previous_function_similarity: dict[str, dict[str, float]]
+    formatted_code: dict[str, dict[str, list[str]]]
+    element_features: dict[str, dict[str, tuple[Class | Function | Parameter, _ElementFeatures]]]
+    similarity_store: SimilarityStore | None
+    # Persisted similarities of other versions are not used. Increase it whenever the similarity functions change.
+    similarity_version: int = 1
 
     def get_related_mappings(
         self,
@@ -226,9 +341,17 @@ class SimpleDiffer(AbstractDiffer):
         previous_mappings: list[Mapping],
         apiv1: API,
         apiv2: API,
+        *,
+        similarity_store: SimilarityStore | None = None,
     ) -> None:
         super().__init__(previous_base_differ, previous_mappings, apiv1, apiv2)
         self.related_mappings = _get_unmapped_api_elements(self.previous_mappings, self.apiv1, self.apiv2)
+        self.previous_parameter_similarity = {}
+        self.previous_function_similarity = {}
+        self.formatted_code = {"apiv1": {}, "apiv2": {}}
+        self.element_features = {"apiv1": {}, "apiv2": {}}
+        self.similarity_store = similarity_store
+        self._differ_kind = f"{type(self).__name__}/{self.similarity_version}"
         distance_between_implicit_and_explicit = 0.3
         distance_between_vararg_and_normal = 0.3
         distance_between_position_and_named = 0.3
@@ -334,30 +457,27 @@ class SimpleDiffer(AbstractDiffer):
             value between 0 and 1, where 1 means that the elements are equal.
         """
         normalize_similarity = 6
+        featuresv1 = self._get_element_features(classv1, "apiv1")
+        featuresv2 = self._get_element_features(classv2, "apiv2")
+        stored_similarity = self._get_stored_similarity(featuresv1, featuresv2)
+        if stored_similarity is not None:
+            return stored_similarity
 
-        code_similarity = self._compute_code_similarity(classv1, classv2)
+        code_similarity = self._compute_sequence_similarity(featuresv1.code_lines, featuresv2.code_lines)
         name_similarity = self._compute_name_similarity(classv1.name, classv2.name)
-
-        attributes_similarity = distance(classv1.instance_attributes, classv2.instance_attributes)
-        attributes_similarity = attributes_similarity / (
-            max(len(classv1.instance_attributes), len(classv2.instance_attributes), 1)
+        attributes_similarity = self._compute_sequence_similarity(
+            featuresv1.instance_attributes,
+            featuresv2.instance_attributes,
         )
-        attributes_similarity = 1 - attributes_similarity
-
-        function_similarity = distance(
-            classv1.methods,
-            classv2.methods,
-        ) / max(len(classv1.methods), len(classv2.methods), 1)
-        function_similarity = 1 - function_similarity
-
-        id_similarity = self._compute_id_similarity(classv1.id, classv2.id)
+        function_similarity = self._compute_sequence_similarity(featuresv1.methods, featuresv2.methods)
+        id_similarity = self._compute_module_path_similarity(featuresv1.module_path, featuresv2.module_path)
 
-        documentation_similarity = self._compute_documentation_similarity(classv1.docstring, classv2.docstring)
+        documentation_similarity = self._compute_documentation_similarity(featuresv1, featuresv2)
         if documentation_similarity < 0:
             documentation_similarity = 0
             normalize_similarity -= 1
 
-        return (
+        result = (
             name_similarity
             + attributes_similarity
             + function_similarity
@@ -365,11 +485,18 @@ class SimpleDiffer(AbstractDiffer):
             + id_similarity
             + documentation_similarity
         ) / normalize_similarity
+        self._store_similarity(featuresv1, featuresv2, result)
+        return result
 
     def _compute_name_similarity(self, namev1: str, namev2: str) -> float:
         name_similarity = distance(namev1, namev2) / max(len(namev1), len(namev2), 1)
         return 1 - name_similarity
 
+    @staticmethod
+    def _compute_sequence_similarity(sequencev1: Sequence[object], sequencev2: Sequence[object]) -> float:
+        diff_elements = distance(sequencev1, sequencev2) / max(len(sequencev1), len(sequencev2), 1)
+        return 1 - diff_elements
+
     def compute_attribute_similarity(
         self,
         attributev1: Attribute,
@@ -423,23 +550,107 @@ class SimpleDiffer(AbstractDiffer):
         ):
             return self.previous_function_similarity[functionv1.id][functionv2.id]
 
-        normalize_similarity = 5
+        featuresv1 = self._get_element_features(functionv1, "apiv1")
+        featuresv2 = self._get_element_features(functionv2, "apiv2")
+        stored_similarity = self._get_stored_similarity(featuresv1, featuresv2)
+        if stored_similarity is not None:
+            return stored_similarity
+
+        return self._complete_function_similarity(
+            functionv1,
+            functionv2,
+            featuresv1,
+            featuresv2,
+            name_similarity=self._compute_name_similarity(functionv1.name, functionv2.name),
+            parameter_similarity=self._compute_sequence_similarity(featuresv1.parameters, featuresv2.parameters),
+            id_similarity=self._compute_module_path_similarity(featuresv1.module_path, featuresv2.module_path),
+        )
 
-        code_similarity = self._compute_code_similarity(functionv1, functionv2)
-        name_similarity = self._compute_name_similarity(functionv1.name, functionv2.name)
+    def compute_function_similarity_with_threshold(
+        self,
+        functionv1: Function,
+        functionv2: Function,
+        threshold: float,
+    ) -> float | None:
+        """
+        Compute the similarity between functions from apiv1 and apiv2 if it can reach the threshold.
 
-        parameter_similarity = distance(
-            functionv1.parameters,
-            functionv2.parameters,
-        ) / max(len(functionv1.parameters), len(functionv2.parameters), 1)
-        parameter_similarity = 1 - parameter_similarity
+        The name and parameters are compared first. The code and documentation are bounded from above by the lengths of
+        their lines and words, since every element the longer sequence has more than the shorter one needs an edit
+        operation, and the id by 1. If the resulting bound is below the threshold, the functions are not compared
+        further. Otherwise, the module paths are compared, which is slower, and the bound is checked again. Only then,
+        the code and documentation are compared.
 
-        id_similarity = self._compute_id_similarity(functionv1.id, functionv2.id)
+        Parameters
+        ----------
+        functionv1 : Function
+            function from apiv1
+        functionv2 : Function
+            function from apiv2
+        threshold : float
+            the similarity the functions must reach
 
-        documentation_similarity = self._compute_documentation_similarity(
-            functionv1.docstring,
-            functionv2.docstring,
+        Returns
+        -------
+        similarity : float | None
+            the same value as `compute_function_similarity` or None if it cannot reach the threshold.
+        """
+        if (
+            functionv1.id in self.previous_function_similarity
+            and functionv2.id in self.previous_function_similarity[functionv1.id]
+        ):
+            return self.previous_function_similarity[functionv1.id][functionv2.id]
+
+        featuresv1 = self._get_element_features(functionv1, "apiv1")
+        featuresv2 = self._get_element_features(functionv2, "apiv2")
+        stored_similarity = self._get_stored_similarity(featuresv1, featuresv2)
+        if stored_similarity is not None:
+            return stored_similarity
+
+        name_similarity = self._compute_name_similarity(functionv1.name, functionv2.name)
+        parameter_similarity = self._compute_sequence_similarity(featuresv1.parameters, featuresv2.parameters)
+        code_bound = _length_bound(featuresv1.code_lines, featuresv2.code_lines)
+        documentation_bound = 0.0
+        normalize_similarity = 4
+        if featuresv1.has_documentation or featuresv2.has_documentation:
+            documentation_bound = _length_bound(featuresv1.documentation, featuresv2.documentation)
+            normalize_similarity = 5
+        # The bounds are summed like the similarity, so rounding cannot make them smaller than the similarity.
+        bound = (code_bound + name_similarity + parameter_similarity + 1 + documentation_bound) / normalize_similarity
+        if bound < threshold:
+            return None
+        id_similarity = self._compute_module_path_similarity(featuresv1.module_path, featuresv2.module_path)
+        bound = (
+            code_bound + name_similarity + parameter_similarity + id_similarity + documentation_bound
+        ) / normalize_similarity
+        if bound < threshold:
+            return None
+
+        return self._complete_function_similarity(
+            functionv1,
+            functionv2,
+            featuresv1,
+            featuresv2,
+            name_similarity=name_similarity,
+            parameter_similarity=parameter_similarity,
+            id_similarity=id_similarity,
         )
+
+    def _complete_function_similarity(
+        self,
+        functionv1: Function,
+        functionv2: Function,
+        featuresv1: _ElementFeatures,
+        featuresv2: _ElementFeatures,
+        *,
+        name_similarity: float,
+        parameter_similarity: float,
+        id_similarity: float,
+    ) -> float:
+        normalize_similarity = 5
+        code_similarity = self._compute_sequence_similarity(featuresv1.code_lines, featuresv2.code_lines)
+
+        documentation_similarity = self._compute_documentation_similarity(featuresv1, featuresv2)
         if documentation_similarity < 0:
             documentation_similarity = 0
             normalize_similarity -= 1
@@ -447,6 +658,7 @@ class SimpleDiffer(AbstractDiffer):
         result = (
             code_similarity + name_similarity + parameter_similarity + id_similarity + documentation_similarity
         ) / normalize_similarity
+        self._store_similarity(featuresv1, featuresv2, result)
         if functionv1.id not in self.previous_function_similarity:
             self.previous_function_similarity[functionv1.id] = {}
         self.previous_function_similarity[functionv1.id][functionv2.id] = result
@@ -454,26 +666,27 @@ class SimpleDiffer(AbstractDiffer):
 
     CODE_CONTAINING_API_ELEMENT = TypeVar("CODE_CONTAINING_API_ELEMENT", Class, Function)
 
-    def _compute_code_similarity(
-        self,
-        elementv1: CODE_CONTAINING_API_ELEMENT,
-        elementv2: CODE_CONTAINING_API_ELEMENT,
-    ) -> float:
-        if elementv1.id in self.formatted_code["apiv1"]:
-            splitv1 = self.formatted_code["apiv1"][elementv1.id]
-        else:
-            codev1 = elementv1.get_formatted_code(cut_documentation=True)
-            splitv1 = codev1.split("\n")
-            self.formatted_code["apiv1"][elementv1.id] = splitv1
-
-        if elementv2.id in self.formatted_code["apiv2"]:
-            splitv2 = self.formatted_code["apiv2"][elementv2.id]
-        else:
-            codev2 = elementv2.get_formatted_code(cut_documentation=True)
-            splitv2 = codev2.split("\n")
-            self.formatted_code["apiv2"][elementv2.id] = splitv2
-        diff_code = distance(splitv1, splitv2) / max(len(splitv1), len(splitv2), 1)
-        return 1 - diff_code
+    def _get_code_lines(self, element: CODE_CONTAINING_API_ELEMENT, api_version: str) -> list[str]:
+        if element.id in self.formatted_code[api_version]:
+            return self.formatted_code[api_version][element.id]
+        split = element.get_formatted_code(cut_documentation=True).split("\n")
+        self.formatted_code[api_version][element.id] = split
+        return split
+
+    def _get_stored_similarity(self, featuresv1: _ElementFeatures, featuresv2: _ElementFeatures) -> float | None:
+        if self.similarity_store is None or featuresv1.content_hash is None or featuresv2.content_hash is None:
+            return None
+        return self.similarity_store.get_similarity(self._differ_kind, featuresv1.content_hash, featuresv2.content_hash)
+
+    def _store_similarity(self, featuresv1: _ElementFeatures, featuresv2: _ElementFeatures, similarity: float) -> None:
+        if self.similarity_store is None or featuresv1.content_hash is None or featuresv2.content_hash is None:
+            return
+        self.similarity_store.put_similarity(
+            self._differ_kind,
+            featuresv1.content_hash,
+            featuresv2.content_hash,
+            similarity,
+        )
 
     def compute_parameter_similarity(self, parameterv1: Parameter, parameterv2: Parameter) -> float:
         """
@@ -500,8 +713,14 @@ class SimpleDiffer(AbstractDiffer):
             return self.previous_parameter_similarity[parameterv1.id][parameterv2.id]
 
         normalize_similarity = 6
+        featuresv1 = self._get_element_features(parameterv1, "apiv1")
+        featuresv2 = self._get_element_features(parameterv2, "apiv2")
+        stored_similarity = self._get_stored_similarity(featuresv1, featuresv2)
+        if stored_similarity is not None:
+            return stored_similarity
+
         parameter_name_similarity = self._compute_name_similarity(parameterv1.name, parameterv2.name)
-        parameter_type_similarity = self._compute_type_similarity(parameterv1.type, parameterv2.type)
+        parameter_type_similarity = self._compute_type_similarity(featuresv1.types, featuresv2.types)
         parameter_assignment_similarity = self._compute_assignment_similarity(
             parameterv1.assigned_by,
             parameterv2.assigned_by,
@@ -515,15 +734,12 @@ class SimpleDiffer(AbstractDiffer):
         if parameter_default_value_similarity < 0:
             parameter_default_value_similarity = 0
             normalize_similarity -= 1
-        parameter_documentation_similarity = self._compute_documentation_similarity(
-            parameterv1.docstring,
-            parameterv2.docstring,
-        )
+        parameter_documentation_similarity = self._compute_documentation_similarity(featuresv1, featuresv2)
         if parameter_documentation_similarity < 0:
             parameter_documentation_similarity = 0
             normalize_similarity -= 1
 
-        id_similarity = self._compute_id_similarity(parameterv1.id, parameterv2.id)
+        id_similarity = self._compute_module_path_similarity(featuresv1.module_path, featuresv2.module_path)
 
         result = (
             parameter_name_similarity
@@ -533,23 +749,20 @@ class SimpleDiffer(AbstractDiffer):
             + parameter_documentation_similarity
             + id_similarity
         ) / normalize_similarity
+        self._store_similarity(featuresv1, featuresv2, result)
         if parameterv1.id not in self.previous_parameter_similarity:
             self.previous_parameter_similarity[parameterv1.id] = {}
         self.previous_parameter_similarity[parameterv1.id][parameterv2.id] = result
         return result
 
-    def _compute_type_similarity(self, typev1: AbstractType | None, typev2: AbstractType | None) -> float:
-        if typev1 is None:
-            if typev2 is None:
+    def _compute_type_similarity(self, typesv1: tuple[int, ...] | None, typesv2: tuple[int, ...] | None) -> float:
+        if typesv1 is None:
+            if typesv2 is None:
                 return 1
             return 0
-        if typev2 is None:
+        if typesv2 is None:
             return 0
-
-        type_listv1 = self._create_list_from_type(typev1)
-        type_listv2 = self._create_list_from_type(typev2)
-        diff_elements = distance(type_listv1, type_listv2) / max(len(type_listv1), len(type_listv2), 1)
-        return 1 - diff_elements
+        return self._compute_sequence_similarity(typesv1, typesv2)
 
     def _create_list_from_type(self, abstract_type: AbstractType | None) -> Sequence[AbstractType | None]:
         if abstract_type is not None and isinstance(abstract_type, UnionType):
@@ -636,33 +849,15 @@ class SimpleDiffer(AbstractDiffer):
             return 0.5
         return 0.0
 
-    def _compute_documentation_similarity(
-        self,
-        documentationv1: ClassDocstring | FunctionDocstring | ParameterDocstring,
-        documentationv2: ClassDocstring | FunctionDocstring | ParameterDocstring,
-    ) -> float:
-        if len(documentationv1.description) == len(documentationv2.description) == 0:
+    def _compute_documentation_similarity(self, featuresv1: _ElementFeatures, featuresv2: _ElementFeatures) -> float:
+        if not featuresv1.has_documentation and not featuresv2.has_documentation:
             return -1.0
-        descriptionv1 = re.split("[\n ]", documentationv1.description)
-        descriptionv2 = re.split("[\n ]", documentationv2.description)
-
-        documentation_similarity = distance(descriptionv1, descriptionv2) / max(
-            len(descriptionv1),
-            len(descriptionv2),
-            1,
-        )
-        return 1 - documentation_similarity
+        return self._compute_sequence_similarity(featuresv1.documentation, featuresv2.documentation)
 
     def _compute_id_similarity(self, idv1: str, idv2: str) -> float:
-        module_pathv1 = idv1.split("/")[1].split(".")
-        additional_module_pathv1 = idv1.split("/")[2:-1]
-        if len(additional_module_pathv1) > 0:
-            module_pathv1.extend(additional_module_pathv1)
-        module_pathv2 = idv2.split("/")[1].split(".")
-        additional_module_pathv2 = idv2.split("/")[2:-1]
-        if len(additional_module_pathv2) > 0:
-            module_pathv2.extend(additional_module_pathv2)
+        return self._compute_module_path_similarity(self._get_module_path(idv1), self._get_module_path(idv2))
 
+    def _compute_module_path_similarity(self, module_pathv1: Sequence[str], module_pathv2: Sequence[str]) -> float:
         def cost_function(iteration: int, max_iteration: int) -> float:
             return (max_iteration - iteration + 1) / max_iteration
 
@@ -673,51 +868,181 @@ class SimpleDiffer(AbstractDiffer):
         )
         return 1 - (total_costs / (sum(range(1, max_iterations + 1)) / max_iterations))
 
+    @staticmethod
+    def _get_module_path(id_: str) -> list[str]:
+        module_path = id_.split("/")[1].split(".")
+        additional_module_path = id_.split("/")[2:-1]
+        if len(additional_module_path) > 0:
+            module_path.extend(additional_module_path)
+        return module_path
+
     def distance_elements_with_cost_function(
         self,
-        listv1: list[str],
-        listv2: list[str],
+        listv1: Sequence[str],
+        listv2: Sequence[str],
         cost_function: Callable[[int, int], float],
     ) -> tuple[float, int]:
-        m = len(listv1)
-        n = len(listv2)
-        if m == n and listv1 == listv2:
-            return 0, m
-        if m > n:
-            listv1, listv2 = listv2, listv1
-            m, n = n, m
-        table = [[0] * (n + 1) for _ in range(m + 1)]
-        str_table = [[""] * (n + 1) for _ in range(m + 1)]
-
-        for i in range(m + 1):
-            table[i][0] = i
-            str_table[i][0] = "-" * i
-        for j in range(n + 1):
-            table[0][j] = j
-            str_table[0][j] = "+" * j
-
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if listv1[i - 1] == listv2[j - 1]:
-                    table[i][j] = table[i - 1][j - 1]
-                    str_table[i][j] = str_table[i - 1][j - 1] + "="
-                else:
-                    table[i][j] = 1 + min(table[i - 1][j], table[i][j - 1], table[i - 1][j - 1])
-                    list_ = [table[i - 1][j], table[i][j - 1], table[i - 1][j - 1]]
-                    min_ = [i for i, j in enumerate(list_) if j == min(list_)][0]
-                    if min_ == 0:
-                        str_table[i][j] = str_table[i - 1][j] + "+"
-                    if min_ == 1:
-                        str_table[i][j] = str_table[i][j - 1] + "-"
-                    if min_ == 2:
-                        str_table[i][j] = str_table[i - 1][j - 1] + "o"
-        edit_string = str_table[-1][-1]
-        total_costs = 0.0
-        max_iteration = len(edit_string)
-        for index, char_ in enumerate(list(edit_string)):
-            if char_ != "=":
-                total_costs += cost_function(index + 1, max_iteration)
-        return total_costs, max_iteration
+        return weighted_edit_cost(listv1, listv2, cost_function)
+
+    def get_similarity_features(self, api_element: api_element, api_version: str) -> SimilarityFeatures | None:
+        """
+        Compute the features of an api element that bound its similarity to other api elements from above.
+
+        The features mirror the components of the similarity of classes, functions, and parameters. Names are compared
+        character by character, all other sequences element by element.
+
+        Parameters
+        ----------
+        api_element : api_element
+            element from apiv1 or apiv2
+        api_version : str
+            "apiv1" or "apiv2", the api the element belongs to
+
+        Returns
+        -------
+        features : SimilarityFeatures | None
+            the features of the element or None if the similarity of the element cannot be bounded.
+        """
+        if not isinstance(api_element, Class | Function | Parameter):
+            return None
+        features = self._get_element_features(api_element, api_version)
+        module_path_component = TokenComponent(levenshtein_tokens(features.module_path), position_weighted=True)
+        documentation_component = TokenComponent(
+            levenshtein_tokens(features.documentation),
+            absent=not features.has_documentation,
+        )
+        if isinstance(api_element, Class):
+            return SimilarityFeatures(
+                (
+                    TokenComponent(levenshtein_tokens(api_element.name)),
+                    TokenComponent(levenshtein_tokens(features.instance_attributes)),
+                    TokenComponent(levenshtein_tokens(features.methods)),
+                    TokenComponent(levenshtein_tokens(features.code_lines)),
+                    module_path_component,
+                    documentation_component,
+                ),
+            )
+        if isinstance(api_element, Function):
+            return SimilarityFeatures(
+                (
+                    TokenComponent(levenshtein_tokens(features.code_lines)),
+                    TokenComponent(levenshtein_tokens(api_element.name)),
+                    TokenComponent(levenshtein_tokens(features.parameters)),
+                    module_path_component,
+                    documentation_component,
+                ),
+            )
+        return SimilarityFeatures(
+            (
+                TokenComponent(levenshtein_tokens(api_element.name)),
+                TokenComponent(levenshtein_tokens(features.types if features.types is not None else [None])),
+                documentation_component,
+                module_path_component,
+            ),
+            (LookupComponent(api_element.assigned_by, self.assigned_by_look_up_similarity),),
+            # default value
+            (api_element.default_value is not None,),
+        )
+
+    def extract_features(self, api_elements: Iterable[api_element], api_version: str) -> None:
+        """
+        Extract the features of classes, functions, and parameters that are compared when computing similarities.
+
+        The code of each element is formatted and split, its documentation is split into words, and its id into the
+        module path only once. Afterward, computing the similarity of a pair of elements only compares the features.
+        Elements whose features are not extracted beforehand are extracted when they are first compared. If the
+        differ has a similarity store, the stored similarities of the apiv1 elements are loaded as well.
+
+        Parameters
+        ----------
+        api_elements : Iterable[api_element]
+            elements from apiv1 or apiv2
+        api_version : str
+            "apiv1" or "apiv2", the api the elements belong to
+        """
+        content_hashes = []
+        for element in api_elements:
+            if isinstance(element, Class | Function | Parameter):
+                content_hashes.append(self._get_element_features(element, api_version).content_hash)
+
+        if self.similarity_store is not None and api_version == "apiv1":
+            self.similarity_store.load_similarities(
+                self._differ_kind,
+                [content_hash for content_hash in content_hashes if content_hash is not None],
+            )
+
+    def reuse_features(self, differ: SimpleDiffer) -> None:
+        """
+        Reuse the features another differ extracted from its apiv2 elements for the apiv1 elements of this differ.
+
+        This is useful when migrating across several versions, since the new version of one migration is the previous
+        version of the next one. Only the features of elements that are the same objects in both APIs are reused.
+
+        Parameters
+        ----------
+        differ : SimpleDiffer
+            the differ whose apiv2 is the apiv1 of this differ
+        """
+        self.element_features["apiv1"] = dict(differ.element_features["apiv2"])
+
+    def _get_element_features(self, element: Class | Function | Parameter, api_version: str) -> _ElementFeatures:
+        # The element is stored with its features, since different elements can have the same id.
+        cached = self.element_features[api_version].get(element.id)
+        if cached is not None and cached[0] is element:
+            return cached[1]
+        features = self._extract_element_features(element, api_version)
+        self.element_features[api_version][element.id] = (element, features)
+        return features
+
+    def _extract_element_features(
+        self,
+        element: Class | Function | Parameter,
+        api_version: str,
+    ) -> _ElementFeatures:
+        content_hash = SimilarityStore.hash_element(element) if self.similarity_store is not None else None
+        module_path = tuple(sys.intern(part) for part in self._get_module_path(element.id))
+        description = element.docstring.description
+        documentation = tuple(sys.intern(word) for word in re.split("[\n ]", description))
+        if isinstance(element, Class):
+            return _ElementFeatures(
+                module_path,
+                documentation,
+                len(description) > 0,
+                code_lines=tuple(sys.intern(line) for line in self._get_code_lines(element, api_version)),
+                instance_attributes=tuple(hash(attribute) for attribute in element.instance_attributes),
+                methods=tuple(sys.intern(method) for method in element.methods),
+                content_hash=content_hash,
+            )
+        if isinstance(element, Function):
+            return _ElementFeatures(
+                module_path,
+                documentation,
+                len(description) > 0,
+                code_lines=tuple(sys.intern(line) for line in self._get_code_lines(element, api_version)),
+                parameters=tuple(hash(parameter) for parameter in element.parameters),
+                content_hash=content_hash,
+            )
+        types = None
+        if element.type is not None:
+            types = tuple(hash(type_) for type_ in self._create_list_from_type(element.type))
+        return _ElementFeatures(
+            module_path,
+            documentation,
+            len(description) > 0,
+            types=types,
+            content_hash=content_hash,
+        )
+
+    def get_similarity_store(self) -> SimilarityStore | None:
+        """
+        Get the store in which the differ persists the similarities it computes.
+
+        Returns
+        -------
+        similarity_store : SimilarityStore | None
+            the store or None if the similarities are not persisted.
+        """
+        return self.similarity_store
 
     def is_base_differ(self) -> bool:
         return True
@@ -12,6 +12,7 @@ from library_analyzer.processing.api.model import (
 from ._differ import AbstractDiffer
 from ._get_unmapped_api_elements import _get_unmapped_api_elements
 from ._mapping import Mapping
+from ._similarity_store import SimilarityStore
 
 api_element = Union[Attribute, Class, Function, Parameter, Result]
 
@@ -231,3 +232,14 @@ class InheritanceDiffer(AbstractDiffer):
             additional mappings that should be included in the result of the differentiation.
         """
         return self.previous_mappings
+
+    def get_similarity_store(self) -> SimilarityStore | None:
+        """
+        Get the store in which the base differ persists the similarities it computes.
+
+        Returns
+        -------
+        similarity_store : SimilarityStore | None
+            the store or None if the similarities are not persisted.
+        """
+        return self.differ.get_similarity_store()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._mapping import Mapping, api_element
+
+
+class MappingIndex:
+    """
+    Find the mappings that contain an apiv1 element by the id of the element.
+
+    The index is built once, so looking up the mappings of an element does not scan all mappings.
+
+    Parameters
+    ----------
+    mappings : list[Mapping]
+        the mappings
+    """
+
+    def __init__(self, mappings: list[Mapping]) -> None:
+        self.mappings = mappings
+        self._mappings_by_apiv1_id: dict[str, list[tuple[api_element, Mapping]]] = {}
+        for mapping in mappings:
+            for element in mapping.get_apiv1_elements():
+                self._mappings_by_apiv1_id.setdefault(element.id, []).append((element, mapping))
+
+    def get_mappings(self, apiv1_id: str, element_types: type | tuple[type, ...]) -> list[Mapping]:
+        """
+        Get the mappings that contain an apiv1 element with the given id and one of the given types.
+
+        Parameters
+        ----------
+        apiv1_id : str
+            the id of the apiv1 element
+        element_types : type | tuple[type, ...]
+            the types the apiv1 element may have
+
+        Returns
+        -------
+        mappings : list[Mapping]
+            the mappings in the order of the list the index was built from, each mapping only once
+        """
+        mappings: list[Mapping] = []
+        for element, mapping in self._mappings_by_apiv1_id.get(apiv1_id, []):
+            if isinstance(element, element_types) and (len(mappings) == 0 or mappings[-1] is not mapping):
+                mappings.append(mapping)
+        return mappings
+
+    def get_mapping(self, apiv1_id: str, element_types: type | tuple[type, ...]) -> Mapping | None:
+        """
+        Get the first mapping that contains an apiv1 element with the given id and one of the given types.
+
+        Parameters
+        ----------
+        apiv1_id : str
+            the id of the apiv1 element
+        element_types : type | tuple[type, ...]
+            the types the apiv1 element may have
+
+        Returns
+        -------
+        mapping : Mapping | None
+            the first mapping in the order of the list the index was built from or None if there is no such mapping
+        """
+        for element, mapping in self._mappings_by_apiv1_id.get(apiv1_id, []):
+            if isinstance(element, element_types):
+                return mapping
+        return None
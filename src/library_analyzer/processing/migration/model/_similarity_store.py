@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from library_analyzer.utils import ensure_file_exists
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+    from library_analyzer.processing.api.model import Class, Function, Parameter
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS similarities (
+    differ_kind TEXT NOT NULL,
+    hashv1 TEXT NOT NULL,
+    hashv2 TEXT NOT NULL,
+    similarity REAL NOT NULL,
+    PRIMARY KEY (differ_kind, hashv1, hashv2)
+) WITHOUT ROWID
+"""
+
+
+@dataclass
+class SimilarityStoreStatistics:
+    """
+    How often the similarities that were looked up in a SimilarityStore were found.
+
+    Attributes
+    ----------
+    similarity_hits : int
+        the number of similarities that were found
+    similarity_misses : int
+        the number of similarities that were not found
+    """
+
+    similarity_hits: int = 0
+    similarity_misses: int = 0
+
+    @property
+    def similarity_hit_rate(self) -> float:
+        lookups = self.similarity_hits + self.similarity_misses
+        return self.similarity_hits / lookups if lookups > 0 else 0.0
+
+    def add(self, other: SimilarityStoreStatistics) -> None:
+        self.similarity_hits += other.similarity_hits
+        self.similarity_misses += other.similarity_misses
+
+
+@dataclass
+class SimilarityStoreUpdates:
+    """
+    The entries and statistics a SimilarityStore collected since they were last taken, see `take_updates`.
+
+    Attributes
+    ----------
+    similarities : dict[tuple[str, str, str], float]
+        the new similarities, keyed by differ kind and the content hashes of the apiv1 and apiv2 element
+    statistics : SimilarityStoreStatistics
+        the statistics of the lookups
+    """
+
+    similarities: dict[tuple[str, str, str], float] = field(default_factory=dict)
+    statistics: SimilarityStoreStatistics = field(default_factory=SimilarityStoreStatistics)
+
+
+class SimilarityStore:
+    """
+    Store the similarities of api elements in an SQLite database on disk.
+
+    Similarities are keyed by the kind of the differ that computed them and the content hashes of both elements, so they
+    stay valid across differ passes and migration runs as long as the elements do not change. New entries are kept in
+    memory until `flush` is called. The similarities of many elements can be loaded at once with `load_similarities`,
+    instead of querying the database for each pair.
+
+    The formatted code of the elements is not stored here. `format_api_code` formats it in advance and can cache it in
+    the same database.
+
+    The store can be used in worker processes: each process opens its own connection to the database. Workers should
+    not write to the database themselves, instead the parent process takes their updates with `take_updates` and
+    applies them with `apply_updates`.
+
+    Parameters
+    ----------
+    path : Path
+        the path to the database, which is created if it does not exist
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.statistics = SimilarityStoreStatistics()
+        self._pending = SimilarityStoreUpdates(statistics=self.statistics)
+        # The loaded similarities, keyed by differ kind and the content hash of the apiv1 element
+        self._loaded: dict[tuple[str, str], dict[str, float]] = {}
+        self._connection: sqlite3.Connection | None = None
+        self._connection_pid: int | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_connection_pid"] = None
+        return state
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    @staticmethod
+    def hash_element(element: Class | Function | Parameter) -> str:
+        """
+        Hash the content of an api element.
+
+        Parameters
+        ----------
+        element : Class | Function | Parameter
+            the api element
+
+        Returns
+        -------
+        content_hash : str
+            the hash of the type and all attributes of the element
+        """
+        element_json = element.to_dict()
+        # Whether the code was formatted in advance does not change the element
+        element_json.pop("formatted_code", None)
+        content = json.dumps([type(element).__name__, element_json], sort_keys=True)
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_similarity(self, differ_kind: str, hashv1: str, hashv2: str) -> float | None:
+        """
+        Get a stored similarity.
+
+        Parameters
+        ----------
+        differ_kind : str
+            the kind of the differ that computed the similarity
+        hashv1 : str
+            the content hash of the apiv1 element
+        hashv2 : str
+            the content hash of the apiv2 element
+
+        Returns
+        -------
+        similarity : float | None
+            the similarity or None if it is not stored
+        """
+        similarity = self._pending.similarities.get((differ_kind, hashv1, hashv2))
+        loaded_similarities = self._loaded.get((differ_kind, hashv1))
+        if similarity is None and loaded_similarities is not None:
+            similarity = loaded_similarities.get(hashv2)
+        elif similarity is None:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT similarity FROM similarities WHERE differ_kind = ? AND hashv1 = ? AND hashv2 = ?",
+                    (differ_kind, hashv1, hashv2),
+                )
+                .fetchone()
+            )
+            similarity = row[0] if row is not None else None
+        if similarity is None:
+            self.statistics.similarity_misses += 1
+        else:
+            self.statistics.similarity_hits += 1
+        return similarity
+
+    def put_similarity(self, differ_kind: str, hashv1: str, hashv2: str, similarity: float) -> None:
+        self._pending.similarities[(differ_kind, hashv1, hashv2)] = similarity
+
+    def load_similarities(self, differ_kind: str, hashesv1: Iterable[str]) -> None:
+        """
+        Load all stored similarities of apiv1 elements into memory.
+
+        Afterward, looking up a similarity of one of the elements does not query the database.
+
+        Parameters
+        ----------
+        differ_kind : str
+            the kind of the differ that computed the similarities
+        hashesv1 : Iterable[str]
+            the content hashes of the apiv1 elements
+        """
+        hashesv1 = {hashv1 for hashv1 in hashesv1 if (differ_kind, hashv1) not in self._loaded}
+        if len(hashesv1) == 0:
+            return
+        for hashv1 in hashesv1:
+            self._loaded[(differ_kind, hashv1)] = {}
+
+        connection = self._get_connection()
+        connection.execute("CREATE TEMPORARY TABLE IF NOT EXISTS loaded_hashes (hashv1 TEXT NOT NULL PRIMARY KEY)")
+        connection.execute("DELETE FROM loaded_hashes")
+        connection.executemany("INSERT INTO loaded_hashes VALUES (?)", [(hashv1,) for hashv1 in hashesv1])
+        rows = connection.execute(
+            "SELECT similarities.hashv1, similarities.hashv2, similarities.similarity FROM similarities"
+            " JOIN loaded_hashes ON similarities.hashv1 = loaded_hashes.hashv1 WHERE similarities.differ_kind = ?",
+            (differ_kind,),
+        )
+        for hashv1, hashv2, similarity in rows:
+            # The hashes of the apiv2 elements appear in many rows, so they are only stored once.
+            self._loaded[(differ_kind, hashv1)][sys.intern(hashv2)] = similarity
+        connection.execute("DELETE FROM loaded_hashes")
+        # Ends the transaction the statements above started, so the database is not locked afterward.
+        connection.commit()
+
+    def take_updates(self) -> SimilarityStoreUpdates:
+        """
+        Take the entries that were not flushed and the statistics, and reset both.
+
+        Returns
+        -------
+        updates : SimilarityStoreUpdates
+            the entries and statistics
+        """
+        updates = self._pending
+        self.statistics = SimilarityStoreStatistics()
+        self._pending = SimilarityStoreUpdates(statistics=self.statistics)
+        return updates
+
+    def apply_updates(self, updates: SimilarityStoreUpdates) -> None:
+        """
+        Add the entries and statistics taken from another instance of the store, e.g. in a worker process.
+
+        Parameters
+        ----------
+        updates : SimilarityStoreUpdates
+            the entries and statistics
+        """
+        self._pending.similarities.update(updates.similarities)
+        self.statistics.add(updates.statistics)
+
+    def flush(self) -> None:
+        """Write all new entries to the database."""
+        if len(self._pending.similarities) == 0:
+            return
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO similarities VALUES (?, ?, ?, ?)",
+                [(*key, similarity) for key, similarity in self._pending.similarities.items()],
+            )
+        self._pending.similarities.clear()
+
+    def close(self) -> None:
+        """Write all new entries to the database and close the connection."""
+        self.flush()
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+        self._connection_pid = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # A connection must not be used in another process than the one that opened it.
+        if self._connection is None or self._connection_pid != os.getpid():
+            ensure_file_exists(self.path)
+            self._connection = sqlite3.connect(self.path, timeout=60)
+            self._connection.execute(_CREATE_TABLE)
+            self._connection_pid = os.getpid()
+        return self._connection
@@ -11,6 +11,7 @@ from library_analyzer.processing.api.model import (
 
 from ._differ import AbstractDiffer
 from ._mapping import Mapping, OneToOneMapping
+from ._similarity_store import SimilarityStore
 
 DEPENDENT_API_ELEMENTS = TypeVar("DEPENDENT_API_ELEMENTS", Function, Attribute, Parameter, Result)
 api_element = Attribute | Class | Function | Parameter | Result
@@ -103,6 +104,17 @@ class StrictDiffer(AbstractDiffer):
         """
         return self.unchanged_mappings
 
+    def get_similarity_store(self) -> SimilarityStore | None:
+        """
+        Get the store in which the base differ persists the similarities it computes.
+
+        Returns
+        -------
+        similarity_store : SimilarityStore | None
+            the store or None if the similarities are not persisted.
+        """
+        return self.differ.get_similarity_store()
+
     def _api_elements_are_mapped_to_each_other(
         self,
         api_elementv1: DEPENDENT_API_ELEMENTS,
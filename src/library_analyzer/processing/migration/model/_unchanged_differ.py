@@ -1,5 +1,6 @@
-from copy import deepcopy
-from typing import TypeVar
+from collections.abc import Hashable
+from dataclasses import fields
+from typing import TypeAlias, TypeVar
 
 from library_analyzer.processing.api.model import (
     API,
@@ -13,6 +14,9 @@ from library_analyzer.processing.api.model import (
 from ._differ import AbstractDiffer
 from ._mapping import Mapping, OneToOneMapping
 
+# The hash, the type and the values of all fields of a class or function that its equality compares, except the code
+_Fingerprint: TypeAlias = tuple[int, tuple[Hashable, ...]]
+
 
 class UnchangedDiffer(AbstractDiffer):
     def __init__(
@@ -23,6 +27,8 @@ class UnchangedDiffer(AbstractDiffer):
         apiv2: API,
     ) -> None:
         super().__init__(previous_base_differ, previous_mappings, apiv1, apiv2)
+        # The fingerprints of classes and functions, keyed by the id of the object
+        self.fingerprints: dict[int, tuple[Class | Function, _Fingerprint]] = {}
         self.unchanged_api_mappings: list[Mapping] = []
         for classv1 in apiv1.classes.values():
             classv2 = apiv2.classes.get(classv1.id, None)
@@ -55,12 +61,29 @@ class UnchangedDiffer(AbstractDiffer):
     API_ELEMENTS = TypeVar("API_ELEMENTS", Attribute, Class, Function, Parameter, Result)
 
     def have_same_api(self, api_elementv1: API_ELEMENTS, api_elementv2: API_ELEMENTS) -> bool:
-        if isinstance(api_elementv1, Class | Function):
-            memo = {id(api_elementv1.code): "", id(api_elementv2.code): ""}
-            api_elementv1 = deepcopy(api_elementv1, memo=memo)
-            api_elementv2 = deepcopy(api_elementv2, memo=memo)
+        if isinstance(api_elementv1, Class | Function) and isinstance(api_elementv2, Class | Function):
+            return self._get_fingerprint(api_elementv1) == self._get_fingerprint(api_elementv2)
         return api_elementv1 == api_elementv2
 
+    def _get_fingerprint(self, api_element: Class | Function) -> _Fingerprint:
+        cached = self.fingerprints.get(id(api_element))
+        if cached is not None and cached[0] is api_element:
+            return cached[1]
+        values: tuple[Hashable, ...] = (
+            type(api_element).__name__,
+            *(
+                tuple(value) if isinstance(value, list) else value
+                for value in (
+                    getattr(api_element, field.name)
+                    for field in fields(api_element)
+                    if field.compare and field.name != "code"
+                )
+            ),
+        )
+        fingerprint = hash(values), values
+        self.fingerprints[id(api_element)] = api_element, fingerprint
+        return fingerprint
+
     def compute_attribute_similarity(self, attributev1: Attribute, attributev2: Attribute) -> float:  # noqa: ARG002
         """
         Compute the similarity between attributes from apiv1 and apiv2.
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-import json
 from collections import Counter
 from typing import TYPE_CHECKING, Any
 
-from library_analyzer.utils import ensure_file_exists
+from library_analyzer.utils import (
+    LazyJsonObject,
+    read_binary_artifact,
+    read_json_file,
+    write_binary_artifact,
+    write_json_file,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -22,36 +27,22 @@ class UsageCountStore:
 
     @staticmethod
     def from_json_file(path: Path) -> UsageCountStore:
-        with path.open(encoding="utf-8") as usages_file:
-            usages_json = json.load(usages_file)
+        return UsageCountStore.from_dict(read_json_file(path))
 
-        return UsageCountStore.from_dict(usages_json)
+    @staticmethod
+    def from_binary_file(path: Path) -> UsageCountStore:
+        return UsageCountStore.from_dict(read_binary_artifact(path))
 
     @staticmethod
     def from_dict(d: dict[str, Any]) -> UsageCountStore:
         """Create an instance of this class from a dictionary."""
         result = UsageCountStore()
 
-        # Revive class counts
-        class_counts = d["class_counts"]
-        for class_id, count in class_counts.items():
-            result.add_class_usages(class_id, count)
-
-        # Revive function counts
-        function_counts = d["function_counts"]
-        for function_id, count in function_counts.items():
-            result.add_function_usages(function_id, count)
-
-        # Revive parameter counts
-        parameter_counts = d["parameter_counts"]
-        for parameter_id, count in parameter_counts.items():
-            result.add_parameter_usages(parameter_id, count)
-
-        # Revive value counts
-        value_counts = d["value_counts"]
-        for parameter_id, values in value_counts.items():
-            for value, count in values.items():
-                result.add_value_usages(parameter_id, value, count)
+        # An empty Counter copies a dictionary as a whole, which is much faster than adding each count on its own
+        result.class_usages = Counter(d["class_counts"])
+        result.function_usages = Counter(d["function_counts"])
+        result.parameter_usages = Counter(d["parameter_counts"])
+        result.value_usages = {parameter_id: Counter(values) for parameter_id, values in d["value_counts"].items()}
 
         return result
 
@@ -179,10 +170,50 @@ class UsageCountStore:
 
         return self
 
-    def to_json_file(self, path: Path) -> None:
-        ensure_file_exists(path)
-        with path.open("w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def to_json_file(self, path: Path, compact: bool = False, compress: bool = False) -> None:
+        """
+        Write this class to a JSON file, one usage count at a time.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        compact : bool
+            Whether to omit the indentation.
+        compress : bool
+            Whether to compress the file with gzip. `from_json_file` reads compressed files, too.
+        """
+        write_json_file(
+            path,
+            LazyJsonObject(
+                [
+                    ("schemaVersion", USAGES_SCHEMA_VERSION),
+                    ("class_counts", LazyJsonObject(self.class_usages.most_common())),
+                    ("function_counts", LazyJsonObject(self.function_usages.most_common())),
+                    ("parameter_counts", LazyJsonObject(self.parameter_usages.most_common())),
+                    (
+                        "value_counts",
+                        LazyJsonObject(
+                            (parameter_id, dict(values.most_common()))
+                            for parameter_id, values in self.value_usages.items()
+                        ),
+                    ),
+                ],
+            ),
+            compact,
+            compress,
+        )
+
+    def to_binary_file(self, path: Path) -> None:
+        """
+        Write this class to a binary artifact, which is smaller and faster to read than a JSON file.
+
+        Parameters
+        ----------
+        path : Path
+            The file to write to.
+        """
+        write_binary_artifact(path, self.to_dict())
 
     def to_dict(self) -> dict[str, Any]:
         """Convert this class to a dictionary, which can later be serialized as JSON."""
@@ -1,10 +1,13 @@
 """Utilities used by various parts of the program."""
 
+from ._artifacts import is_binary_artifact, read_binary_artifact, write_binary_artifact
 from ._ast_walker import ASTWalker
 from ._files import ensure_file_exists, initialize_and_read_exclude_file, list_files
+from ._json import LazyJsonArray, LazyJsonObject, read_json_file, write_json_file
 from ._load_language import load_language
 from ._names import declaration_qname_to_name, parent_id, parent_qualified_name
 from ._parsing import parse_python_code
+from ._profiling import PhaseStatistics, Profiler, profile
 from ._strings import pluralize
 
 __all__ = [
@@ -12,10 +15,20 @@ __all__ = [
     "declaration_qname_to_name",
     "ensure_file_exists",
     "initialize_and_read_exclude_file",
+    "is_binary_artifact",
+    "LazyJsonArray",
+    "LazyJsonObject",
     "list_files",
     "load_language",
     "parse_python_code",
     "parent_id",
     "parent_qualified_name",
+    "PhaseStatistics",
     "pluralize",
+    "profile",
+    "Profiler",
+    "read_binary_artifact",
+    "read_json_file",
+    "write_binary_artifact",
+    "write_json_file",
 ]
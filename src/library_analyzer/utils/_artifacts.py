@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import gc
+import json
+import struct
+import sys
+from array import array
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from ._files import ensure_file_exists
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_MAGIC_NUMBER = b"LABA"
+_FORMAT_VERSION = 1
+# Format version, length of the string table, length of the layout, length of the arrays
+_HEADER = struct.Struct("<BIIQ")
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def write_binary_artifact(path: Path, value: Any) -> None:
+    """
+    Write a JSON value to a binary artifact, which is smaller and faster to read than a JSON file.
+
+    Lists and dictionaries are stored column by column: Each string is stored once in a string table and referenced by
+    its index, and integers are stored as arrays of 64-bit integers. `read_binary_artifact` restores the exact value,
+    including the order of the keys of all dictionaries.
+
+    A binary artifact consists of
+
+    * the magic number `LABA`,
+    * a header with the format version and the lengths of the following sections,
+    * the string table as JSON array,
+    * the layout as JSON, which describes how each column is stored,
+    * the arrays of string indices and integers, little-endian.
+
+    Parameters
+    ----------
+    path: Path
+        The file to write to.
+    value: Any
+        The JSON value.
+    """
+    encoder = _Encoder()
+    layout = encoder.encode_column([value])
+    string_table = json.dumps(list(encoder.string_ids), separators=(",", ":")).encode("utf-8")
+    layout_json = json.dumps(layout, separators=(",", ":")).encode("utf-8")
+
+    ensure_file_exists(path)
+    with path.open("wb") as file:
+        file.write(_MAGIC_NUMBER)
+        file.write(_HEADER.pack(_FORMAT_VERSION, len(string_table), len(layout_json), encoder.arrays_length))
+        file.write(string_table)
+        file.write(layout_json)
+        for array_ in encoder.arrays:
+            if sys.byteorder == "big":
+                array_.byteswap()
+            array_.tofile(file)
+
+
+def read_binary_artifact(path: Path) -> Any:
+    """
+    Read a JSON value from a binary artifact written by `write_binary_artifact`.
+
+    Parameters
+    ----------
+    path: Path
+        The file to read from.
+
+    Returns
+    -------
+    value: Any
+        The JSON value.
+
+    Raises
+    ------
+    ValueError
+        If the file is no binary artifact or was written by an incompatible version.
+    """
+    with path.open("rb") as file:
+        content = file.read()
+
+    if not content.startswith(_MAGIC_NUMBER):
+        raise ValueError(f"{path} is not a binary artifact.")
+    format_version, string_table_length, layout_length, arrays_length = _HEADER.unpack_from(
+        content,
+        len(_MAGIC_NUMBER),
+    )
+    if format_version != _FORMAT_VERSION:
+        raise ValueError(f"{path} has the format version {format_version}, but only {_FORMAT_VERSION} is supported.")
+
+    start = len(_MAGIC_NUMBER) + _HEADER.size
+    strings = json.loads(content[start : start + string_table_length])
+    start += string_table_length
+    layout = json.loads(content[start : start + layout_length])
+    start += layout_length
+    arrays = memoryview(content)[start : start + arrays_length]
+
+    # The decoded lists and dictionaries cannot form cycles, so collecting garbage while creating them is wasted time
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _Decoder(strings, arrays).decode_column(layout)[0]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def is_binary_artifact(path: Path) -> bool:
+    """
+    Check whether a file is a binary artifact written by `write_binary_artifact`.
+
+    Parameters
+    ----------
+    path: Path
+        The file to check.
+
+    Returns
+    -------
+    is_binary_artifact: bool
+        Whether the file starts with the magic number of binary artifacts.
+    """
+    with path.open("rb") as file:
+        return file.read(len(_MAGIC_NUMBER)) == _MAGIC_NUMBER
+
+
+# The layout of a column is a dictionary with one of the following keys:
+#
+# * "s": strings, given by an array of indices into the string table
+# * "i": integers, given by an array of 64-bit integers
+# * "r": dictionaries with the same keys, given by their number, their keys, and the layout of a column per key
+# * "d": dictionaries with different keys, given by the number of entries of each dictionary (a column of integers),
+#        and the columns of all their keys and values
+# * "l": lists, given by the length of each list (a column of integers) and the column of all their elements
+# * "u": values of different kinds, given by the index of the column of each value (a column of integers) and a
+#        column per kind of value
+# * "j": any other JSON values, given as they are
+#
+# An array is given by its type code, the offset of its first byte, and its number of items.
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.string_ids: dict[str, int] = {}
+        self.arrays: list[array] = []
+        self.arrays_length = 0
+
+    def encode_column(self, values: list[Any]) -> dict[str, Any]:
+        if len(values) == 0:
+            return {"j": []}
+
+        kinds = [_kind(value) for value in values]
+        kind = kinds[0]
+        if any(other_kind != kind for other_kind in kinds):
+            return self._encode_union(values, kinds)
+
+        if kind == "s":
+            string_ids = self.string_ids
+            return {"s": self._add_array("I", [string_ids.setdefault(value, len(string_ids)) for value in values])}
+        if kind == "i":
+            return {"i": self._add_array("q", values)}
+        if kind == "d":
+            keys = list(values[0])
+            # A single dictionary is stored like a record if its values are of different kinds, e.g. the fields of an
+            # object, and like a mapping otherwise, e.g. the annotations by their target
+            is_record = len(values) > 1 or len({_kind(value) for value in values[0].values()}) > 1
+            if is_record and all(len(value) == len(keys) and list(value) == keys for value in values):
+                return {
+                    "r": [len(values), keys, [self.encode_column([value[key] for value in values]) for key in keys]],
+                }
+            return {
+                "d": [
+                    self.encode_column([len(value) for value in values]),
+                    self.encode_column([key for value in values for key in value]),
+                    self.encode_column([element for value in values for element in value.values()]),
+                ],
+            }
+        if kind == "l":
+            return {
+                "l": [
+                    self.encode_column([len(value) for value in values]),
+                    self.encode_column([element for value in values for element in value]),
+                ],
+            }
+        return {"j": values}
+
+    def _encode_union(self, values: list[Any], kinds: list[str]) -> dict[str, Any]:
+        values_by_kind: dict[str, list[Any]] = {}
+        for value, kind in zip(values, kinds, strict=True):
+            values_by_kind.setdefault(kind, []).append(value)
+        column_indices = {kind: index for index, kind in enumerate(values_by_kind)}
+        return {
+            "u": [
+                self.encode_column([column_indices[kind] for kind in kinds]),
+                [self.encode_column(values_of_kind) for values_of_kind in values_by_kind.values()],
+            ],
+        }
+
+    def _add_array(self, typecode: str, values: list[int]) -> list[Any]:
+        array_ = array(typecode, values)
+        offset = self.arrays_length
+        self.arrays.append(array_)
+        self.arrays_length += len(array_) * array_.itemsize
+        return [typecode, offset, len(array_)]
+
+
+def _kind(value: Any) -> str:
+    value_type = type(value)
+    if value_type is str:
+        return "s"
+    if value_type is int and _INT64_MIN <= value <= _INT64_MAX:
+        return "i"
+    if value_type is dict:
+        return "d"
+    if value_type is list:
+        return "l"
+    return "j"
+
+
+class _Decoder:
+    def __init__(self, strings: list[str], arrays: memoryview) -> None:
+        self._strings = strings
+        self._arrays = arrays
+
+    def decode_column(self, layout: dict[str, Any]) -> list[Any]:
+        kind, content = next(iter(layout.items()))
+        if kind == "s":
+            return list(map(self._strings.__getitem__, self._read_array(content)))
+        if kind == "i":
+            return self._read_array(content).tolist()
+        if kind == "r":
+            count, keys, columns = content
+            if len(keys) == 0:
+                return [{} for _ in range(count)]
+            return [
+                dict(zip(keys, row, strict=True))
+                for row in zip(*[self.decode_column(column) for column in columns], strict=True)
+            ]
+        if kind == "d":
+            lengths, keys, values = (self.decode_column(column) for column in content)
+            entries = zip(keys, values, strict=True)
+            return [dict(islice(entries, length)) for length in lengths]
+        if kind == "l":
+            lengths, elements = (self.decode_column(column) for column in content)
+            elements_iterator = iter(elements)
+            return [list(islice(elements_iterator, length)) for length in lengths]
+        if kind == "u":
+            column_indices_layout, columns = content
+            column_indices = self.decode_column(column_indices_layout)
+            iterators = [iter(self.decode_column(column)) for column in columns]
+            return list(map(next, map(iterators.__getitem__, column_indices)))
+        return content
+
+    def _read_array(self, content: list[Any]) -> array:
+        typecode, offset, length = content
+        array_ = array(typecode)
+        array_.frombytes(self._arrays[offset : offset + length * array_.itemsize])
+        if sys.byteorder == "big":
+            array_.byteswap()
+        return array_
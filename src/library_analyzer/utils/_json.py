@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, BinaryIO, TextIO
+
+from ._files import ensure_file_exists
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+_GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+_INDENT = "  "
+# Creating an encoder is expensive compared to encoding a single entry
+_INDENTED_ENCODER = json.JSONEncoder(indent=len(_INDENT))
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class LazyJsonObject:
+    """
+    A JSON object whose entries are only created while it is written by `write_json_file`.
+
+    Values can be JSON values or other lazy objects and arrays. Lazy objects and arrays cannot be nested in plain
+    dictionaries or lists, though.
+    """
+
+    entries: Iterable[tuple[str, Any]]
+
+
+@dataclass(frozen=True)
+class LazyJsonArray:
+    """A JSON array whose elements are only created while it is written by `write_json_file`."""
+
+    elements: Iterable[Any]
+
+
+def write_json_file(path: Path, value: Any, compact: bool = False, compress: bool = False) -> None:
+    """
+    Write a JSON value to a file, one entry of each lazy object or array at a time.
+
+    Unlike `json.dump`, the complete value does not have to exist in memory at once. Without the compact mode, the
+    file is the same as the one `json.dump(value, file, indent=2)` writes.
+
+    Parameters
+    ----------
+    path: Path
+        The file to write to.
+    value: Any
+        A JSON value, a LazyJsonObject or a LazyJsonArray.
+    compact: bool
+        Whether to omit the indentation and all optional whitespace.
+    compress: bool
+        Whether to compress the file with gzip. `read_json_file` recognizes compressed files by their content.
+    """
+    ensure_file_exists(path)
+    with path.open("wb") as binary_file:
+        if compress:
+            with gzip.GzipFile(fileobj=binary_file, mode="wb", compresslevel=6, mtime=0) as gzip_file:
+                _write_text(gzip_file, value, compact)
+        else:
+            _write_text(binary_file, value, compact)
+
+
+def read_json_file(path: Path) -> Any:
+    """
+    Read a JSON value from a file that is compressed with gzip or not.
+
+    Parameters
+    ----------
+    path: Path
+        The file to read from.
+
+    Returns
+    -------
+    value: Any
+        The JSON value.
+    """
+    with path.open("rb") as binary_file:
+        if binary_file.read(len(_GZIP_MAGIC_NUMBER)) == _GZIP_MAGIC_NUMBER:
+            binary_file.seek(0)
+            with gzip.open(binary_file, "rt", encoding="utf-8") as gzip_file:
+                return json.load(gzip_file)
+
+    with path.open(encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _write_text(binary_file: BinaryIO | gzip.GzipFile, value: Any, compact: bool) -> None:
+    file = io.TextIOWrapper(binary_file, encoding="utf-8")
+    _write_value(file, value, compact, 0)
+    file.flush()
+    # The binary file is closed by its owner
+    file.detach()
+
+
+def _write_value(file: TextIO, value: Any, compact: bool, level: int) -> None:
+    if isinstance(value, LazyJsonObject):
+        _write_container(
+            file,
+            "{",
+            "}",
+            ((_COMPACT_ENCODER.encode(key) + (":" if compact else ": "), element) for key, element in value.entries),
+            compact=compact,
+            level=level,
+        )
+    elif isinstance(value, LazyJsonArray):
+        _write_container(file, "[", "]", (("", element) for element in value.elements), compact=compact, level=level)
+    elif compact:
+        file.write(_COMPACT_ENCODER.encode(value))
+    else:
+        # The indentation of nested values is relative to the start of their line
+        file.write(_INDENTED_ENCODER.encode(value).replace("\n", "\n" + _INDENT * level))
+
+
+def _write_container(
+    file: TextIO,
+    opening: str,
+    closing: str,
+    prefixed_elements: Iterable[tuple[str, Any]],
+    *,
+    compact: bool,
+    level: int,
+) -> None:
+    file.write(opening)
+    is_empty = True
+    for prefix, element in prefixed_elements:
+        if not is_empty:
+            file.write(",")
+        if not compact:
+            file.write("\n" + _INDENT * (level + 1))
+        file.write(prefix)
+        _write_value(file, element, compact, level + 1)
+        is_empty = False
+    if not is_empty and not compact:
+        file.write("\n" + _INDENT * level)
+    file.write(closing)
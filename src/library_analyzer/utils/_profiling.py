@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ._files import ensure_file_exists
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from typing_extensions import Self
+
+_active_profiler: Profiler | None = None
+_no_profiling = contextlib.nullcontext()
+
+
+@dataclass
+class PhaseStatistics:
+    """
+    Statistics collected for a phase (or for a module within a phase).
+
+    Attributes
+    ----------
+    calls: int
+        How often the phase was entered.
+    wall_time: float
+        The total wall time spent in the phase in seconds.
+    peak_memory: int | None
+        The highest amount of traced memory in bytes while the phase ran, None if memory is not tracked.
+    """
+
+    calls: int = 0
+    wall_time: float = 0.0
+    peak_memory: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "wall_time": self.wall_time,
+            "peak_memory": self.peak_memory,
+        }
+
+
+@dataclass
+class _PhaseFrame:
+    start_time: float
+    peak_memory: int = 0
+
+
+@dataclass
+class Profiler:
+    """
+    Collect wall time, call counts and peak memory of the phases of an analysis.
+
+    The profiler is activated with a `with` statement. While it is active, all code wrapped in `profile` is measured.
+    If no profiler is active, `profile` does nothing.
+
+    Attributes
+    ----------
+    track_memory: bool
+        Whether to track the peak memory of each phase with tracemalloc, which slows down the analysis.
+    top_n: int
+        How many of the slowest modules are reported for each phase.
+    phases: dict[str, PhaseStatistics]
+        The statistics of each phase.
+    modules: dict[str, dict[str, PhaseStatistics]]
+        The statistics of each module within a phase. The key is the name of the phase.
+    """
+
+    track_memory: bool = True
+    top_n: int = 10
+    phases: dict[str, PhaseStatistics] = field(default_factory=dict)
+    modules: dict[str, dict[str, PhaseStatistics]] = field(default_factory=dict)
+    _stack: list[_PhaseFrame] = field(default_factory=list, init=False, repr=False)
+    _previous_profiler: Profiler | None = field(default=None, init=False, repr=False)
+    _started_tracemalloc: bool = field(default=False, init=False, repr=False)
+
+    def __enter__(self) -> Self:
+        global _active_profiler  # noqa: PLW0603
+        self._previous_profiler = _active_profiler
+        _active_profiler = self
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        global _active_profiler  # noqa: PLW0603
+        _active_profiler = self._previous_profiler
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def measure(self, phase: str, module: str | None = None) -> Iterator[None]:
+        """
+        Measure a phase.
+
+        Nested phases are measured independently, the time and memory of an inner phase also count for the outer phase.
+
+        Parameters
+        ----------
+        phase: str
+            The name of the phase.
+        module: str | None
+            The name of the module the phase runs for, if any.
+        """
+        if self.track_memory:
+            # The peak of the enclosing phase must be saved before the peak is reset for this phase.
+            if self._stack:
+                self._stack[-1].peak_memory = max(self._stack[-1].peak_memory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = _PhaseFrame(time.perf_counter())
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - frame.start_time
+            self._stack.pop()
+            peak_memory = None
+            if self.track_memory:
+                peak_memory = max(frame.peak_memory, tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1].peak_memory = max(self._stack[-1].peak_memory, peak_memory)
+
+            self._record(self.phases.setdefault(phase, PhaseStatistics()), wall_time, peak_memory)
+            if module is not None:
+                phase_modules = self.modules.setdefault(phase, {})
+                self._record(phase_modules.setdefault(module, PhaseStatistics()), wall_time, peak_memory)
+
+    @staticmethod
+    def _record(statistics: PhaseStatistics, wall_time: float, peak_memory: int | None) -> None:
+        statistics.calls += 1
+        statistics.wall_time += wall_time
+        if peak_memory is not None:
+            statistics.peak_memory = max(statistics.peak_memory or 0, peak_memory)
+
+    def slowest_modules(self, phase: str) -> list[tuple[str, PhaseStatistics]]:
+        """
+        Get the slowest modules of a phase.
+
+        Parameters
+        ----------
+        phase: str
+            The name of the phase.
+
+        Returns
+        -------
+        slowest_modules: list[tuple[str, PhaseStatistics]]
+            The names and statistics of the `top_n` slowest modules, the slowest first.
+        """
+        phase_modules = self.modules.get(phase, {})
+        return sorted(phase_modules.items(), key=lambda item: item[1].wall_time, reverse=True)[: self.top_n]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phases": {phase: statistics.to_dict() for phase, statistics in self.phases.items()},
+            "slowest_modules": {
+                phase: [
+                    {"module": module, **statistics.to_dict()} for module, statistics in self.slowest_modules(phase)
+                ]
+                for phase in self.modules
+            },
+            "modules": {
+                phase: {module: statistics.to_dict() for module, statistics in phase_modules.items()}
+                for phase, phase_modules in self.modules.items()
+            },
+        }
+
+    def to_json_file(self, path: Path) -> None:
+        ensure_file_exists(path)
+        with path.open("w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def profile(phase: str, module: str | None = None) -> contextlib.AbstractContextManager[None]:
+    """
+    Measure a phase with the active profiler.
+
+    If no profiler is active, a shared context manager that does nothing is returned.
+
+    Parameters
+    ----------
+    phase: str
+        The name of the phase.
+    module: str | None
+        The name of the module the phase runs for, if any.
+
+    Returns
+    -------
+    context_manager: contextlib.AbstractContextManager[None]
+        The context manager that measures the phase.
+    """
+    if _active_profiler is None:
+        return _no_profiling
+    return _active_profiler.measure(phase, module)
@@ -80,3 +80,43 @@ def test_cli_migration() -> None:
         check=True,
         cwd=_project_root,
     )
+
+
+def test_cli_migration_chain() -> None:
+    subprocess.run(
+        [
+            "poetry",
+            "run",
+            "analyze-library",
+            "migrate-chain",
+            "--apis",
+            "tests/data/migration/apiv1_data.json",
+            "tests/data/migration/apiv2_data.json",
+            "tests/data/migration/apiv2_data.json",
+            "-a",
+            "tests/data/migration/annotationv1.json",
+            "-o",
+            "out",
+        ],
+        check=True,
+        cwd=_project_root,
+    )
+
+
+def test_cli_migration_benchmark() -> None:
+    subprocess.run(
+        [
+            "poetry",
+            "run",
+            "analyze-library",
+            "migrate-benchmark",
+            "--classes",
+            "5",
+            "--functions",
+            "5",
+            "-o",
+            "out/migration_benchmark.json",
+        ],
+        check=True,
+        cwd=_project_root,
+    )
@@ -30,7 +30,7 @@ from library_analyzer.processing.api import Action, Condition
 
 def test_annotation_store() -> None:
     annotations = AnnotationStore()
-    annotations.removeAnnotations.append(
+    annotations.add_annotation(
         RemoveAnnotation(
             target="test/remove",
             authors=["$autogen$"],
@@ -39,7 +39,7 @@ def test_annotation_store() -> None:
             reviewResult=EnumReviewResult.UNSURE,
         ),
     )
-    annotations.valueAnnotations.append(
+    annotations.add_annotation(
         RequiredAnnotation(
             target="test/required",
             authors=["$autogen$"],
@@ -48,7 +48,7 @@ def test_annotation_store() -> None:
             reviewResult=EnumReviewResult.CORRECT,
         ),
     )
-    annotations.valueAnnotations.append(
+    annotations.add_annotation(
         OptionalAnnotation(
             target="test/optional",
             authors=["$autogen$"],
@@ -59,7 +59,7 @@ def test_annotation_store() -> None:
             defaultValue="test",
         ),
     )
-    annotations.valueAnnotations.append(
+    annotations.add_annotation(
         ConstantAnnotation(
             target="test/constant",
             authors=["$autogen$"],
@@ -70,7 +70,7 @@ def test_annotation_store() -> None:
             defaultValue="test",
         ),
     )
-    annotations.boundaryAnnotations.append(
+    annotations.add_annotation(
         BoundaryAnnotation(
             target="test/boundary",
             authors=["$autogen$"],
@@ -86,7 +86,7 @@ def test_annotation_store() -> None:
             ),
         ),
     )
-    annotations.enumAnnotations.append(
+    annotations.add_annotation(
         EnumAnnotation(
             target="test/enum",
             authors=["$autogen$"],
@@ -97,7 +97,7 @@ def test_annotation_store() -> None:
             pairs=[EnumPair("test", "test")],
         ),
     )
-    annotations.calledAfterAnnotations.append(
+    annotations.add_annotation(
         CalledAfterAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -107,7 +107,7 @@ def test_annotation_store() -> None:
             calledAfterName="functionName",
         ),
     )
-    annotations.completeAnnotations.append(
+    annotations.add_annotation(
         CompleteAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -116,7 +116,7 @@ def test_annotation_store() -> None:
             reviewResult=EnumReviewResult.NONE,
         ),
     )
-    annotations.dependencyAnnotations.append(
+    annotations.add_annotation(
         DependencyAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -129,7 +129,7 @@ def test_annotation_store() -> None:
             action=Action("this will be set to test"),
         ),
     )
-    annotations.descriptionAnnotations.append(
+    annotations.add_annotation(
         DescriptionAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -139,7 +139,7 @@ def test_annotation_store() -> None:
             newDescription="description",
         ),
     )
-    annotations.groupAnnotations.append(
+    annotations.add_annotation(
         GroupAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -150,7 +150,7 @@ def test_annotation_store() -> None:
             parameters=["a", "b", "c"],
         ),
     )
-    annotations.moveAnnotations.append(
+    annotations.add_annotation(
         MoveAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -160,7 +160,7 @@ def test_annotation_store() -> None:
             destination="moved.package",
         ),
     )
-    annotations.pureAnnotations.append(
+    annotations.add_annotation(
         PureAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -169,7 +169,7 @@ def test_annotation_store() -> None:
             reviewResult=EnumReviewResult.NONE,
         ),
     )
-    annotations.renameAnnotations.append(
+    annotations.add_annotation(
         RenameAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -179,7 +179,7 @@ def test_annotation_store() -> None:
             newName="testName",
         ),
     )
-    annotations.todoAnnotations.append(
+    annotations.add_annotation(
         TodoAnnotation(
             target="test/test",
             authors=["$autogen$"],
@@ -189,7 +189,7 @@ def test_annotation_store() -> None:
             newTodo="TODO replace me",
         ),
     )
-    annotations.expertAnnotations.append(
+    annotations.add_annotation(
         ExpertAnnotation(
             target="test/expert",
             authors=["$autogen$"],
@@ -750,3 +750,77 @@ def test_annotation_store() -> None:
 def test_conversion_between_json_and_annotation(annotation: AbstractAnnotation, d: dict) -> None:
     assert annotation.to_dict() == d
     assert type(annotation).from_dict(d) == annotation
+
+
+def test_annotation_store_indexes_added_annotations() -> None:
+    constant_annotation = ConstantAnnotation(
+        target="test/constant",
+        authors=["$autogen$"],
+        reviewers=[],
+        comment="Autogenerated",
+        reviewResult=EnumReviewResult.NONE,
+        defaultValueType=ValueAnnotation.DefaultValueType.NUMBER,
+        defaultValue=1.0,
+    )
+    required_annotation = RequiredAnnotation(
+        target="test/constant",
+        authors=["$autogen$"],
+        reviewers=[],
+        comment="Autogenerated",
+        reviewResult=EnumReviewResult.NONE,
+    )
+    todo_annotation = TodoAnnotation(
+        target="test/constant",
+        authors=["$autogen$"],
+        reviewers=[],
+        comment="Autogenerated",
+        reviewResult=EnumReviewResult.NONE,
+        newTodo="TODO",
+    )
+    annotations = AnnotationStore()
+    constant_targets = annotations.get_value_annotation_targets(ValueAnnotation.Variant.CONSTANT)
+    annotations.add_annotation(constant_annotation)
+    annotations.add_annotation(required_annotation)
+    annotations.add_annotation(todo_annotation)
+
+    assert constant_targets == {"test/constant"}
+    assert annotations.get_value_annotation_targets(ValueAnnotation.Variant.REQUIRED) == {"test/constant"}
+    assert annotations.get_value_annotation_targets(ValueAnnotation.Variant.OPTIONAL) == set()
+    assert annotations.get_targets(TodoAnnotation) == {"test/constant"}
+    assert annotations.get_targets(RemoveAnnotation) == set()
+    assert annotations.get_annotations_for_target(ValueAnnotation, "test/constant") == [
+        constant_annotation,
+        required_annotation,
+    ]
+    assert annotations.get_annotations_for_target(RequiredAnnotation, "test/constant") == [required_annotation]
+    assert annotations.get_annotations_for_target(TodoAnnotation, "test/other") == []
+
+    annotations.remove_annotations([constant_annotation, todo_annotation])
+
+    assert annotations.valueAnnotations == [required_annotation]
+    assert annotations.todoAnnotations == []
+    assert constant_targets == set()
+    assert annotations.get_targets(TodoAnnotation) == set()
+    assert annotations.get_annotations_for_target(ValueAnnotation, "test/constant") == [required_annotation]
+
+
+def test_annotation_store_indexes_replaced_lists() -> None:
+    remove_annotation = RemoveAnnotation(
+        target="test/remove",
+        authors=["$autogen$"],
+        reviewers=[],
+        comment="Autogenerated",
+        reviewResult=EnumReviewResult.NONE,
+    )
+    annotations = AnnotationStore(removeAnnotations=[remove_annotation])
+
+    assert annotations.get_targets(RemoveAnnotation) == {"test/remove"}
+
+    with pytest.raises(AttributeError):
+        annotations.removeAnnotations.append(remove_annotation)  # type: ignore[attr-defined]
+
+    annotations.removeAnnotations = []
+
+    assert annotations.get_targets(RemoveAnnotation) == set()
+    assert annotations == AnnotationStore()
+    assert AnnotationStore.from_dict(annotations.to_dict()) == annotations
@@ -11,11 +11,13 @@ from library_analyzer.processing.usages.model import UsageCountStore
     "subfolder",
     ["boundaryAnnotations", "enumAnnotations", "removeAnnotations", "valueAnnotations", "dependencyAnnotations"],
 )
+@pytest.mark.parametrize("processes", [1, 2])
 def test_generate_annotations(
     subfolder: str,
+    processes: int,
 ) -> None:
     usages, api, expected_annotations = read_test_data(subfolder)
-    annotations = generate_annotations(api, usages)
+    annotations = generate_annotations(api, usages, processes)
 
     assert annotations.to_dict()[subfolder] == expected_annotations
 
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+from scipy.stats import binom
+
+from library_analyzer.processing.annotations._generate_value_annotations import _binomial_test_p_values
+
+
+def test_binomial_test_p_values() -> None:
+    most_common_value_counts = np.array([3, 8, 18, 20, 100, 51])
+    second_most_common_value_counts = np.array([1, 2, 2, 9, 95, 49])
+
+    p_values = _binomial_test_p_values(most_common_value_counts, second_most_common_value_counts)
+
+    for most_common_value_count, second_most_common_value_count, p_value in zip(
+        most_common_value_counts,
+        second_most_common_value_counts,
+        p_values,
+        strict=True,
+    ):
+        total = most_common_value_count + second_most_common_value_count
+        expected_p_value = 2 * sum(binom.pmf(i, total, 0.5) for i in range(most_common_value_count, total + 1))
+        assert p_value == pytest.approx(expected_p_value, rel=1e-9)
+
+
+def test_binomial_test_p_values_with_swapped_counts() -> None:
+    p_values = _binomial_test_p_values(np.array([2, 18]), np.array([18, 2]))
+
+    assert p_values[0] == p_values[1]
+
+
+def test_binomial_test_p_values_without_parameters() -> None:
+    p_values = _binomial_test_p_values(np.array([], dtype=np.int64), np.array([], dtype=np.int64))
+
+    assert len(p_values) == 0
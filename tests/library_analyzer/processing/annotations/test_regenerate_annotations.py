@@ -0,0 +1,90 @@
+import json
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from library_analyzer.processing.annotations import generate_annotations, regenerate_annotations
+from library_analyzer.processing.api.model import API
+from library_analyzer.processing.usages.model import UsageCountStore
+
+
+@pytest.mark.parametrize("subfolder", ["enumAnnotations", "removeAnnotations", "valueAnnotations"])
+@pytest.mark.parametrize("previous_usages_changed", [True, False])
+def test_regenerate_annotations(subfolder: str, previous_usages_changed: bool) -> None:
+    api_json, usages_json = read_test_data(subfolder)
+    changed_usages_json = change_usages(usages_json)
+    if previous_usages_changed:
+        previous_usages_json = changed_usages_json
+    else:
+        previous_usages_json, usages_json = usages_json, changed_usages_json
+
+    previous_annotations = generate_annotations(
+        API.from_dict(api_json),
+        UsageCountStore.from_dict(previous_usages_json),
+    )
+    annotations = regenerate_annotations(
+        API.from_dict(api_json),
+        UsageCountStore.from_dict(usages_json),
+        UsageCountStore.from_dict(previous_usages_json),
+        previous_annotations,
+    )
+
+    expected_annotations = generate_annotations(API.from_dict(api_json), UsageCountStore.from_dict(usages_json))
+    # The order of the annotations in the file has to be the same, too
+    assert json.dumps(annotations.to_dict()) == json.dumps(expected_annotations.to_dict())
+
+
+@pytest.mark.parametrize("subfolder", ["enumAnnotations", "valueAnnotations"])
+def test_regenerate_annotations_with_changed_api(subfolder: str) -> None:
+    api_json, usages_json = read_test_data(subfolder)
+    previous_api_json = deepcopy(api_json)
+    for function_json in previous_api_json["functions"]:
+        for parameter_json in function_json["parameters"]:
+            parameter_json["default_value"] = None
+            parameter_json["docstring"] = {}
+
+    previous_annotations = generate_annotations(
+        API.from_dict(previous_api_json),
+        UsageCountStore.from_dict(usages_json),
+    )
+    annotations = regenerate_annotations(
+        API.from_dict(api_json),
+        UsageCountStore.from_dict(usages_json),
+        UsageCountStore.from_dict(usages_json),
+        previous_annotations,
+        API.from_dict(previous_api_json),
+    )
+
+    expected_annotations = generate_annotations(API.from_dict(api_json), UsageCountStore.from_dict(usages_json))
+    assert json.dumps(annotations.to_dict()) == json.dumps(expected_annotations.to_dict())
+
+
+def change_usages(usages_json: dict) -> dict:
+    """Remove some usages, add others, and reorder the values of some parameters."""
+    changed_usages_json = deepcopy(usages_json)
+    for key in ["class_counts", "function_counts", "parameter_counts"]:
+        for index, element_id in enumerate(changed_usages_json[key]):
+            if index % 3 == 0:
+                changed_usages_json[key][element_id] = 0
+            elif index % 3 == 1:
+                changed_usages_json[key][element_id] += 2
+    for index, (parameter_id, value_counts) in enumerate(changed_usages_json["value_counts"].items()):
+        if index % 2 == 0:
+            changed_usages_json["value_counts"][parameter_id] = dict(reversed(value_counts.items()))
+        elif len(value_counts) > 0:
+            first_value = next(iter(value_counts))
+            value_counts[first_value] += 1
+    return changed_usages_json
+
+
+def read_test_data(subfolder: str) -> tuple[dict, dict]:
+    data_path = Path(__file__).parent / ".." / ".." / ".." / "data" / subfolder
+
+    with (data_path / "api_data.json").open(encoding="utf-8") as api_file:
+        api_json = json.load(api_file)
+
+    with (data_path / "usage_data.json").open(encoding="utf-8") as usages_file:
+        usages_json = json.load(usages_file)
+
+    return api_json, usages_json
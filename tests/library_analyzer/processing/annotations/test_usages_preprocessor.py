@@ -0,0 +1,41 @@
+import json
+from pathlib import Path
+
+from library_analyzer.processing.annotations import generate_annotations
+from library_analyzer.processing.annotations._usages_preprocessor import _preprocess_usages
+from library_analyzer.processing.api.model import API
+from library_analyzer.processing.usages.model import UsageCountStore
+from library_analyzer.utils import parent_id
+
+_data_path = Path(__file__).parent / ".." / ".." / ".." / "data" / "valueAnnotations"
+
+
+def test_preprocess_usages() -> None:
+    api = API.from_json_file(_data_path / "api_data.json")
+    usages = UsageCountStore.from_json_file(_data_path / "usage_data.json")
+    parameter_id = "test/test/some_global_function/optional_parameter_that_should_be_required"
+
+    preprocessed_usages = _preprocess_usages(usages, api)
+
+    default_value = api.get_default_value(parameter_id)
+    assert default_value is not None
+    n_implicit_usages = usages.n_function_usages(parent_id(parameter_id)) - usages.n_parameter_usages(parameter_id)
+    assert n_implicit_usages > 0
+    assert preprocessed_usages.n_value_usages(parameter_id, default_value) == (
+        usages.n_value_usages(parameter_id, default_value) + n_implicit_usages
+    )
+
+
+def test_preprocess_usages_does_not_change_the_usages() -> None:
+    api = API.from_json_file(_data_path / "api_data.json")
+    usages = UsageCountStore.from_json_file(_data_path / "usage_data.json")
+    usages_dict = usages.to_dict()
+
+    first_preprocessed_usages = _preprocess_usages(usages, api)
+    second_preprocessed_usages = _preprocess_usages(usages, api)
+
+    assert usages.to_dict() == usages_dict
+    assert first_preprocessed_usages == second_preprocessed_usages
+    assert json.dumps(generate_annotations(api, usages).to_dict()) == json.dumps(
+        generate_annotations(api, usages).to_dict(),
+    )
@@ -1,7 +1,11 @@
+import gc
+import tracemalloc
 from dataclasses import dataclass
+from pathlib import Path
 
 import pytest
 from library_analyzer.processing.api.purity_analysis import (
+    get_purity_results,
     infer_purity,
 )
 from library_analyzer.processing.api.purity_analysis.model import (
@@ -19,7 +23,9 @@ from library_analyzer.processing.api.purity_analysis.model import (
     NonLocalVariableWrite,
     ParameterAccess,
     Pure,
+    PurityCache,
     PurityResult,
+    RecentPurityResults,
     StringLiteral,
     UnknownCall,
     UnknownClassInit,
@@ -1945,3 +1951,130 @@ def test_infer_purity_open(code: str, expected: dict[str, SimpleImpure]) -> None
     }
 
     assert transformed_purity_results == expected
+
+
+def test_get_purity_results_incremental(tmp_path: Path) -> None:
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "a.py").write_text(
+        """
+from pkg.b import helper
+
+def uses_helper(x):
+    return helper(x)
+
+def independent():
+    return 1
+""",
+    )
+    (package / "b.py").write_text(
+        """
+def helper(x):
+    return x * 2
+""",
+    )
+    (package / "c.py").write_text(
+        """
+from pkg.a import uses_helper
+
+def top(x):
+    return uses_helper(x)
+""",
+    )
+
+    cache = PurityCache()
+    assert get_purity_results(package, cache).to_dict() == get_purity_results(package).to_dict()
+    assert get_purity_results(package, cache).to_dict() == get_purity_results(package).to_dict()
+
+    (package / "b.py").write_text(
+        """
+def helper(x):
+    print(x)
+    return x * 2
+""",
+    )
+    incremental_result = get_purity_results(package, cache).to_dict()
+    assert incremental_result == get_purity_results(package).to_dict()
+    assert incremental_result["pkg.c"]["pkg.c.top.4.0"]["purity"] == "Impure"
+    assert incremental_result["pkg.a"]["pkg.a.independent.7.0"]["purity"] == "Pure"
+
+    (package / "c.py").unlink()
+    assert get_purity_results(package, cache).to_dict() == get_purity_results(package).to_dict()
+
+
+def test_get_purity_results_independent_and_flat(tmp_path: Path) -> None:
+    package_a = tmp_path / "independent_a"
+    package_a.mkdir()
+    (package_a / "a.py").write_text(
+        """
+def read_file(path):
+    with open(path) as f:
+        return f.read()
+""",
+    )
+    package_b = tmp_path / "independent_b"
+    package_b.mkdir()
+    (package_b / "b.py").write_text(
+        """
+def add(x, y):
+    return x + y
+""",
+    )
+
+    results_a = get_purity_results(package_a)
+    results_b = get_purity_results(package_b)
+    assert list(results_a.to_dict()) == ["independent_a.a"]
+    assert list(results_b.to_dict()) == ["independent_b.b"]
+
+    def analyze(iterations: int) -> None:
+        for _ in range(iterations):
+            get_purity_results(package_a)
+            get_purity_results(package_b)
+
+    tracemalloc.start()
+    try:
+        analyze(10)
+        gc.collect()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        analyze(90)
+        gc.collect()
+        memory_after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert memory_after - memory_before < 1024 * 1024
+
+
+def test_get_purity_results_recent_results(tmp_path: Path) -> None:
+    packages = []
+    for name in ("recent_a", "recent_b", "recent_c"):
+        package = tmp_path / name
+        package.mkdir()
+        (package / "module.py").write_text("def f():\n    pass\n")
+        packages.append(package)
+
+    recent_results = RecentPurityResults(max_size=2)
+    results_a = get_purity_results(packages[0], recent_results=recent_results)
+    expected_a = results_a.to_dict()
+    results_a.clear()
+    recent_results_a = get_purity_results(packages[0], recent_results=recent_results)
+    assert recent_results_a.to_dict() == expected_a
+    assert get_purity_results(packages[0], recent_results=recent_results) is not recent_results_a
+    assert len(recent_results) == 1
+
+    # A cache is always updated by an analysis
+    cache = PurityCache()
+    get_purity_results(packages[0], cache, recent_results=recent_results)
+    assert "recent_a.module" in cache.modules
+
+    get_purity_results(packages[1], recent_results=recent_results)
+    get_purity_results(packages[2], recent_results=recent_results)
+    assert len(recent_results) == 2
+
+    (packages[0] / "module.py").write_text("def f():\n    print()\n")
+    changed_results = get_purity_results(packages[0], recent_results=recent_results)
+    assert changed_results.to_dict()["recent_a.module"]["recent_a.module.f.1.0"]["purity"] == "Impure"
+
+    with pytest.raises(ValueError, match="maximal size"):
+        RecentPurityResults(max_size=0)
@@ -5,10 +5,13 @@ from dataclasses import dataclass, field
 import astroid
 import pytest
 from library_analyzer.processing.api.purity_analysis import (
+    get_module_data,
     resolve_references,
 )
+from library_analyzer.processing.api.purity_analysis._resolve_references import ReferenceResolver
 from library_analyzer.processing.api.purity_analysis.model import (
     ClassVariable,
+    FunctionIndex,
     InstanceVariable,
     MemberAccess,
     MemberAccessTarget,
@@ -3212,3 +3215,50 @@ def test_resolve_references_reasons(code: str, expected: dict[str, SimpleReasons
     # assert function_references == expected
 
     assert transformed_function_references == expected
+
+
+def test_function_index_matches_compare_parameters() -> None:
+    code = """
+def f():
+    pass
+
+def f(a):
+    pass
+
+def f(a, b=1):
+    pass
+
+def f(a, *args):
+    pass
+
+def f(a, *, key):
+    pass
+
+def f(a, b, **kwargs):
+    pass
+
+class A:
+    def f(self, c):
+        pass
+
+def g():
+    f()
+    f(1)
+    f(1, 2)
+    f(1, 2, 3)
+    f(a=1)
+    f(1, b=2)
+    f(1, c=2)
+    f(1, key=2)
+    f(1, 2, key=3, other=4)
+    f(*[1], **{})
+"""
+    module_data = get_module_data(code)
+    function_index = FunctionIndex.from_functions(module_data.functions)
+    calls = [expression.value for expression in astroid.parse(code).body[-1].body]
+
+    for call in calls:
+        expected = [
+            function for function in module_data.functions["f"] if ReferenceResolver.compare_parameters(function, call)
+        ]
+        assert function_index.get_called_functions("f", call) == expected
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from library_analyzer.processing.api import format_api_code
+from library_analyzer.processing.api.model import (
+    API,
+    Class,
+    ClassDocstring,
+    Function,
+    FunctionDocstring,
+    format_code,
+)
+
+_CLASS_CODE = 'class A:\n    """Documentation."""\n    def f(self, x): return x\n'
+_FUNCTION_CODE = 'def g(  a,b ):\n    """Documentation."""\n    return a+b\n'
+
+
+def _create_api(version: str) -> API:
+    api = API("test", "test", version)
+    api.add_class(
+        Class(
+            id="test/test/A",
+            qname="test.A",
+            decorators=[],
+            superclasses=[],
+            is_public=True,
+            reexported_by=[],
+            docstring=ClassDocstring(),
+            code=_CLASS_CODE,
+            instance_attributes=[],
+        ),
+    )
+    for name in ["g", "h"]:
+        api.add_function(
+            Function(
+                id=f"test/test/{name}",
+                qname=f"test.{name}",
+                decorators=[],
+                parameters=[],
+                results=[],
+                is_public=True,
+                reexported_by=[],
+                docstring=FunctionDocstring(),
+                code=_FUNCTION_CODE,
+            ),
+        )
+    return api
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_format_api_code(processes: int) -> None:
+    apiv1 = _create_api("1.0.0")
+    apiv2 = _create_api("2.0.0")
+    expected_apiv1 = _create_api("1.0.0")
+
+    assert format_api_code([apiv1, apiv2], processes=processes) == 2
+
+    for api in [apiv1, apiv2]:
+        assert api.classes["test/test/A"].formatted_code == format_code(_CLASS_CODE)
+        for function in api.functions.values():
+            assert function.formatted_code == format_code(_FUNCTION_CODE)
+    for element, expected_element in [
+        (apiv1.classes["test/test/A"], expected_apiv1.classes["test/test/A"]),
+        (apiv1.functions["test/test/g"], expected_apiv1.functions["test/test/g"]),
+    ]:
+        assert element == expected_element
+        assert element.get_formatted_code(cut_documentation=True) == expected_element.get_formatted_code(
+            cut_documentation=True,
+        )
+
+
+def test_format_api_code_stores_formatted_code_in_json() -> None:
+    api = _create_api("1.0.0")
+    format_api_code([api])
+
+    api_from_json = API.from_dict(api.to_dict())
+
+    assert api_from_json.classes["test/test/A"].formatted_code == format_code(_CLASS_CODE)
+    assert api_from_json.functions["test/test/g"].formatted_code == format_code(_FUNCTION_CODE)
+    assert format_api_code([api_from_json]) == 0
+    assert "formatted_code" not in _create_api("1.0.0").to_dict()["functions"][0]
+
+
+def test_format_api_code_with_cache(tmp_path: Path) -> None:
+    cache_file_path = tmp_path / "cache.sqlite"
+
+    assert format_api_code([_create_api("1.0.0")], cache_file_path=cache_file_path) == 2
+
+    api = _create_api("1.0.0")
+    assert format_api_code([api], cache_file_path=cache_file_path) == 0
+    assert api.functions["test/test/h"].formatted_code == format_code(_FUNCTION_CODE)
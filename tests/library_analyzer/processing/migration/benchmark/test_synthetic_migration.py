@@ -0,0 +1,87 @@
+import re
+from dataclasses import fields
+
+import pytest
+
+from library_analyzer.processing.api.model import format_code
+from library_analyzer.processing.migration.benchmark import SyntheticAPIConfig, generate_synthetic_migration
+
+
+def test_generate_synthetic_migration() -> None:
+    config = SyntheticAPIConfig(
+        modules=3,
+        classes=10,
+        methods_per_class=2,
+        functions=10,
+        parameters_per_function=2,
+        annotation_rate=1.0,
+    )
+    apiv1, annotationsv1, apiv2 = generate_synthetic_migration(config)
+
+    assert apiv1.class_count() == 10
+    assert apiv1.function_count() == 10 * 2 + 10
+    assert apiv1.parameter_count() == 10 * 2 * 3 + 10 * 2
+    assert apiv2.class_count() <= 10
+    assert sum(len(module.classes) for module in apiv1.modules.values()) == 10
+    for class_ in apiv1.classes.values():
+        assert all(method_id in apiv1.functions for method_id in class_.methods)
+    for function in [*apiv1.functions.values(), *apiv2.functions.values()]:
+        format_code(function.code)
+
+    annotation_targets = {
+        annotation.target
+        for field in fields(annotationsv1)
+        if field.init
+        for annotation in getattr(annotationsv1, field.name)
+    }
+    elementsv1 = {*apiv1.classes, *apiv1.functions, *apiv1.parameters()}
+    assert annotation_targets <= elementsv1
+    assert len(annotation_targets) == len(elementsv1) - 10 * 2
+
+
+def test_generate_synthetic_migration_is_deterministic() -> None:
+    apiv1, annotationsv1, apiv2 = generate_synthetic_migration(SyntheticAPIConfig(classes=5, functions=5, seed=1))
+    other_apiv1, other_annotationsv1, other_apiv2 = generate_synthetic_migration(
+        SyntheticAPIConfig(classes=5, functions=5, seed=1),
+    )
+
+    assert apiv1.to_dict() == other_apiv1.to_dict()
+    assert apiv2.to_dict() == other_apiv2.to_dict()
+    assert annotationsv1.to_dict() == other_annotationsv1.to_dict()
+
+
+def test_generate_synthetic_migration_without_changes() -> None:
+    apiv1, _, apiv2 = generate_synthetic_migration(
+        SyntheticAPIConfig(classes=5, functions=5, rename_rate=0, move_rate=0, delete_rate=0),
+    )
+
+    assert apiv1.classes == apiv2.classes
+    assert apiv1.functions == apiv2.functions
+
+
+def test_generate_synthetic_migration_with_all_elements_renamed() -> None:
+    apiv1, _, apiv2 = generate_synthetic_migration(
+        SyntheticAPIConfig(classes=5, functions=5, rename_rate=1, move_rate=0, delete_rate=0),
+    )
+
+    assert apiv2.class_count() == 5
+    assert apiv2.function_count() == apiv1.function_count()
+    assert set(apiv1.classes).isdisjoint(apiv2.classes)
+    assert set(apiv1.functions).isdisjoint(apiv2.functions)
+
+
+@pytest.mark.parametrize(
+    ("config", "message"),
+    [
+        ({"classes": -1}, "classes must not be negative."),
+        ({"modules": 0}, "An API with classes or functions needs at least one module."),
+        ({"rename_rate": 1.5}, "rename_rate must be between 0 and 1."),
+        (
+            {"rename_rate": 0.5, "move_rate": 0.5, "delete_rate": 0.5},
+            "The rates of renamed, moved, and deleted elements must not sum up to more than 1.",
+        ),
+    ],
+)
+def test_synthetic_api_config_rejects_invalid_values(config: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=rf"^{re.escape(message)}$"):
+        SyntheticAPIConfig(**config)
@@ -0,0 +1,83 @@
+import random
+from collections.abc import Callable
+
+import pytest
+
+from library_analyzer.processing.migration.model import weighted_edit_cost
+
+
+def cost_function(iteration: int, max_iteration: int) -> float:
+    return (max_iteration - iteration + 1) / max_iteration
+
+
+# The implementation of SimpleDiffer.distance_elements_with_cost_function that builds the full table of edit strings
+def _reference_weighted_edit_cost(
+    listv1: list[str],
+    listv2: list[str],
+    cost_function: Callable[[int, int], float],
+) -> tuple[float, int]:
+    m = len(listv1)
+    n = len(listv2)
+    if m == n and listv1 == listv2:
+        return 0, m
+    if m > n:
+        listv1, listv2 = listv2, listv1
+        m, n = n, m
+    table = [[0] * (n + 1) for _ in range(m + 1)]
+    str_table = [[""] * (n + 1) for _ in range(m + 1)]
+
+    for i in range(m + 1):
+        table[i][0] = i
+        str_table[i][0] = "-" * i
+    for j in range(n + 1):
+        table[0][j] = j
+        str_table[0][j] = "+" * j
+
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if listv1[i - 1] == listv2[j - 1]:
+                table[i][j] = table[i - 1][j - 1]
+                str_table[i][j] = str_table[i - 1][j - 1] + "="
+            else:
+                table[i][j] = 1 + min(table[i - 1][j], table[i][j - 1], table[i - 1][j - 1])
+                list_ = [table[i - 1][j], table[i][j - 1], table[i - 1][j - 1]]
+                min_ = next(i for i, j in enumerate(list_) if j == min(list_))
+                if min_ == 0:
+                    str_table[i][j] = str_table[i - 1][j] + "+"
+                if min_ == 1:
+                    str_table[i][j] = str_table[i][j - 1] + "-"
+                if min_ == 2:
+                    str_table[i][j] = str_table[i - 1][j - 1] + "o"
+    edit_string = str_table[-1][-1]
+    total_costs = 0.0
+    max_iteration = len(edit_string)
+    for index, char_ in enumerate(list(edit_string)):
+        if char_ != "=":
+            total_costs += cost_function(index + 1, max_iteration)
+    return total_costs, max_iteration
+
+
+def _random_sequence(rng: random.Random, alphabet: str) -> list[str]:
+    return [rng.choice(alphabet) for _ in range(rng.randint(0, 9))]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_weighted_edit_cost_equals_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    # Small alphabets lead to many alignments with the same number of operations, so the tie-breaking is tested too.
+    for alphabet in ["ab", "abc", "abcdefgh"]:
+        for _ in range(100):
+            sequencev1 = _random_sequence(rng, alphabet)
+            sequencev2 = _random_sequence(rng, alphabet)
+            assert weighted_edit_cost(sequencev1, sequencev2, cost_function) == _reference_weighted_edit_cost(
+                sequencev1,
+                sequencev2,
+                cost_function,
+            )
+
+
+def test_weighted_edit_cost_of_module_paths() -> None:
+    assert weighted_edit_cost(["a", "b", "c"], ["x", "b", "c"], cost_function) == (1, 3)
+    assert weighted_edit_cost(("a", "b", "c"), ("a", "b", "z"), cost_function) == (1 / 3, 3)
+    assert weighted_edit_cost(["a", "b"], ["a", "b"], cost_function) == (0, 2)
+    assert weighted_edit_cost([], ["a"], cost_function) == (1, 1)
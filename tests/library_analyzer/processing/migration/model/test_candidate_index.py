@@ -0,0 +1,106 @@
+import pytest
+
+from library_analyzer.processing.migration.model import (
+    APIMapping,
+    CandidateIndex,
+    LookupComponent,
+    SimilarityFeatures,
+    SimpleDiffer,
+    TokenComponent,
+    levenshtein_tokens,
+)
+
+from .test_mapping import load_migration_apis, to_comparable
+
+
+# With max_postings=0, no token is indexed, so only the bound without shared tokens decides which elements are
+# candidates. With a large max_postings, all tokens are indexed.
+@pytest.mark.parametrize("max_postings", [0, None, 1000])
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.61, 0.8, 1.0])
+def test_candidate_index_recall(threshold: float, max_postings: int | None) -> None:
+    apiv1, apiv2 = load_migration_apis()
+    differ = SimpleDiffer(None, [], apiv1, apiv2)
+    for elementsv1, elementsv2, compute_similarity in [
+        (list(apiv1.classes.values()), list(apiv2.classes.values()), differ.compute_class_similarity),
+        (list(apiv1.functions.values()), list(apiv2.functions.values()), differ.compute_function_similarity),
+        (list(apiv1.parameters().values()), list(apiv2.parameters().values()), differ.compute_parameter_similarity),
+    ]:
+        featuresv2 = []
+        for elementv2 in elementsv2:
+            features = differ.get_similarity_features(elementv2, "apiv2")
+            assert features is not None
+            featuresv2.append(features)
+        candidate_index = CandidateIndex.create(elementsv2, featuresv2, max_postings)
+
+        for elementv1 in elementsv1:
+            featuresv1 = differ.get_similarity_features(elementv1, "apiv1")
+            assert featuresv1 is not None
+            candidates = candidate_index.get_candidates(featuresv1, threshold)
+            for elementv2 in elementsv2:
+                if compute_similarity(elementv1, elementv2) >= threshold:
+                    assert elementv2 in candidates
+
+
+def test_candidate_index_keeps_order_and_prunes() -> None:
+    features = [
+        SimilarityFeatures((TokenComponent(levenshtein_tokens("fit")),)),
+        SimilarityFeatures((TokenComponent(levenshtein_tokens("score")),)),
+        SimilarityFeatures((TokenComponent(levenshtein_tokens("fit_transform")),)),
+    ]
+    candidate_index = CandidateIndex.create(["fit", "score", "fit_transform"], features)
+
+    assert candidate_index.get_candidates(features[0], 0.0) == ["fit", "score", "fit_transform"]
+    assert candidate_index.get_candidates(features[0], 0.2) == ["fit", "fit_transform"]
+    assert candidate_index.get_candidates(features[0], 1.0) == ["fit"]
+
+
+def test_candidate_index_bounds_other_components() -> None:
+    similarities = {"a": {"a": 1.0, "b": 0.5}, "b": {"a": 0.5, "b": 1.0}}
+    featuresv1 = SimilarityFeatures(
+        (TokenComponent(levenshtein_tokens(["x"])),),
+        (LookupComponent("a", similarities),),
+        (True,),
+    )
+    featuresv2 = [
+        SimilarityFeatures(
+            (TokenComponent(levenshtein_tokens(["y"])),),
+            (LookupComponent("a", similarities),),
+            (True,),
+        ),
+        SimilarityFeatures(
+            (TokenComponent(levenshtein_tokens(["y"])),),
+            (LookupComponent("b", similarities),),
+            (True,),
+        ),
+        SimilarityFeatures(
+            (TokenComponent(levenshtein_tokens(["y"])),),
+            (LookupComponent("a", similarities),),
+            (False,),
+        ),
+    ]
+    candidate_index = CandidateIndex.create(["a", "b", "missing"], featuresv2)
+
+    assert candidate_index.get_candidates(featuresv1, 0.5) == ["a", "b"]
+    assert candidate_index.get_candidates(featuresv1, 0.6) == ["a"]
+
+
+def test_map_api_with_candidate_index_equals_exhaustive_mode() -> None:
+    apiv1, apiv2 = load_migration_apis()
+    exhaustive_mappings = APIMapping(
+        apiv1,
+        apiv2,
+        SimpleDiffer(None, [], apiv1, apiv2),
+        threshold_of_similarity_for_creation_of_mappings=0.61,
+        threshold_of_similarity_between_mappings=0.23,
+        exhaustive=True,
+    ).map_api()
+    mappings = APIMapping(
+        apiv1,
+        apiv2,
+        SimpleDiffer(None, [], apiv1, apiv2),
+        threshold_of_similarity_for_creation_of_mappings=0.61,
+        threshold_of_similarity_between_mappings=0.23,
+    ).map_api()
+
+    assert len(exhaustive_mappings) > 0
+    assert to_comparable(mappings) == to_comparable(exhaustive_mappings)
@@ -1,4 +1,5 @@
 from inspect import cleandoc
+from pathlib import Path
 
 import pytest
 from library_analyzer.processing.api.model import (
@@ -267,3 +268,111 @@ def test_weighted_levenshtein_distance() -> None:
     assert max_iteration == 3
 
     assert differ._compute_id_similarity("api/test.test.text/a", "api/tests.tests.texts/b") < 0.1e-10
+
+
+def test_simple_differ_extracted_features_equal_features_extracted_on_demand() -> None:
+    data_path = Path(__file__).parent / ".." / ".." / ".." / ".." / "data" / "migration"
+    apiv1 = API.from_json_file(data_path / "apiv1_data.json")
+    apiv2 = API.from_json_file(data_path / "apiv2_data.json")
+    elementsv1 = [*apiv1.classes.values(), *apiv1.functions.values(), *apiv1.parameters().values()]
+    elementsv2 = [*apiv2.classes.values(), *apiv2.functions.values(), *apiv2.parameters().values()]
+
+    similarities = []
+    for extract_features in [True, False]:
+        differ = SimpleDiffer(None, [], apiv1, apiv2)
+        if extract_features:
+            differ.extract_features(elementsv1, "apiv1")
+            differ.extract_features(elementsv2, "apiv2")
+            assert len(differ.element_features["apiv1"]) == len(elementsv1)
+            assert len(differ.element_features["apiv2"]) == len(elementsv2)
+        similarities.append(
+            [
+                [differ.compute_class_similarity(classv1, classv2) for classv2 in apiv2.classes.values()]
+                for classv1 in apiv1.classes.values()
+            ]
+            + [
+                [differ.compute_function_similarity(functionv1, functionv2) for functionv2 in apiv2.functions.values()]
+                for functionv1 in apiv1.functions.values()
+            ]
+            + [
+                [
+                    differ.compute_parameter_similarity(parameterv1, parameterv2)
+                    for parameterv2 in apiv2.parameters().values()
+                ]
+                for parameterv1 in apiv1.parameters().values()
+            ],
+        )
+
+    assert similarities[0] == similarities[1]
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.61, 0.9])
+def test_simple_differ_prunes_only_function_similarities_below_threshold(threshold: float) -> None:
+    data_path = Path(__file__).parent / ".." / ".." / ".." / ".." / "data" / "migration"
+    apiv1 = API.from_json_file(data_path / "apiv1_data.json")
+    apiv2 = API.from_json_file(data_path / "apiv2_data.json")
+    exact_differ = SimpleDiffer(None, [], apiv1, apiv2)
+    differ = SimpleDiffer(None, [], apiv1, apiv2)
+
+    pruned_pairs = 0
+    for functionv1 in apiv1.functions.values():
+        for functionv2 in apiv2.functions.values():
+            similarity = exact_differ.compute_function_similarity(functionv1, functionv2)
+            bounded_similarity = differ.compute_function_similarity_with_threshold(functionv1, functionv2, threshold)
+            if bounded_similarity is None:
+                assert similarity < threshold
+                pruned_pairs += 1
+            else:
+                assert bounded_similarity == similarity
+
+    assert (pruned_pairs > 0) == (threshold >= 0.61)
+
+
+def test_simple_differ_reuses_features_of_previous_migration() -> None:
+    data_path = Path(__file__).parent / ".." / ".." / ".." / ".." / "data" / "migration"
+    apiv1 = API.from_json_file(data_path / "apiv1_data.json")
+    apiv2 = API.from_json_file(data_path / "apiv2_data.json")
+    apiv3 = API.from_json_file(data_path / "apiv1_data.json")
+    elementsv2 = [*apiv2.classes.values(), *apiv2.functions.values(), *apiv2.parameters().values()]
+    previous_differ = SimpleDiffer(None, [], apiv1, apiv2)
+    previous_differ.extract_features(elementsv2, "apiv2")
+
+    differ = SimpleDiffer(None, [], apiv2, apiv3)
+    differ.reuse_features(previous_differ)
+    new_differ = SimpleDiffer(None, [], apiv2, apiv3)
+
+    for functionv2 in apiv2.functions.values():
+        assert differ.element_features["apiv1"][functionv2.id][1] is (
+            previous_differ.element_features["apiv2"][functionv2.id][1]
+        )
+        for functionv3 in apiv3.functions.values():
+            assert differ.compute_function_similarity(functionv2, functionv3) == new_differ.compute_function_similarity(
+                functionv2,
+                functionv3,
+            )
+
+
+def test_simple_differ_does_not_reuse_features_of_other_elements_with_same_id() -> None:
+    differ = SimpleDiffer(None, [], API("", "", ""), API("", "", ""))
+    parameter_a = Parameter(
+        id_="test/test.Test/test_method/test_parameter",
+        name="test_parameter",
+        qname="test.Test.test_method.test_parameter",
+        default_value=None,
+        assigned_by=ParameterAssignment.POSITION_OR_NAME,
+        is_public=True,
+        docstring=ParameterDocstring("int", "", "an integer"),
+    )
+    parameter_b = Parameter(
+        id_="test/test.Test/test_method/test_parameter",
+        name="test_parameter",
+        qname="test.Test.test_method.test_parameter",
+        default_value=None,
+        assigned_by=ParameterAssignment.POSITION_OR_NAME,
+        is_public=True,
+        docstring=ParameterDocstring("str", "", "a string"),
+    )
+    differ.extract_features([parameter_a], "apiv1")
+
+    assert differ._get_element_features(parameter_a, "apiv1").documentation == ("an", "integer")
+    assert differ._get_element_features(parameter_b, "apiv1").documentation == ("a", "string")
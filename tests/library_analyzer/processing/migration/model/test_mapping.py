@@ -1,10 +1,15 @@
+import json
 from inspect import cleandoc
+from pathlib import Path
+
+import pytest
 
 from library_analyzer.processing.api.model import API, Class, ClassDocstring
 from library_analyzer.processing.migration.model import (
     APIMapping,
     ManyToManyMapping,
     ManyToOneMapping,
+    Mapping,
     OneToManyMapping,
     OneToOneMapping,
     SimpleDiffer,
@@ -157,6 +162,82 @@ def test_too_different_mapping() -> None:
     assert len(mappings) == 0
 
 
+def test_map_api_in_processes_equals_single_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    apiv1, apiv2 = load_migration_apis()
+
+    def map_api(processes: int) -> list[tuple[float, list[str], list[str], str]]:
+        return to_comparable(
+            APIMapping(apiv1, apiv2, SimpleDiffer(None, [], apiv1, apiv2), processes=processes).map_api(),
+        )
+
+    # The test APIs are small, so processes are only used if the minimal number of pairs is lowered.
+    monkeypatch.setattr("library_analyzer.processing.migration.model._api_mapping._MIN_PAIRS_FOR_PROCESSES", 0)
+    mappings_in_processes = map_api(processes=2)
+    mappings_in_single_process = map_api(processes=1)
+
+    assert len(mappings_in_single_process) > 0
+    assert mappings_in_processes == mappings_in_single_process
+
+
+def test_optimal_assignment_keeps_near_ties() -> None:
+    apiv1, apiv2, class_1, class_2, class_3 = create_apis()
+    differ = SimpleDiffer(None, [], apiv1, apiv2)
+
+    mappings = APIMapping(apiv1, apiv2, differ, optimal_assignment=True).map_api()
+    assert len(mappings) == 1
+    assert isinstance(mappings[0], OneToManyMapping)
+    assert mappings[0].get_apiv1_elements() == [class_1]
+    assert sorted(element.id for element in mappings[0].get_apiv2_elements()) == [class_2.id, class_3.id]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_optimal_assignment_maximizes_total_similarity(reverse: bool) -> None:
+    def create_class(name: str) -> Class:
+        return Class(
+            id=f"test/test.{name}",
+            qname=name,
+            decorators=[],
+            superclasses=[],
+            is_public=True,
+            reexported_by=[],
+            docstring=ClassDocstring(""),
+            code="",
+            instance_attributes=[],
+        )
+
+    class_a, class_b, class_x, class_y = create_class("A"), create_class("B"), create_class("X"), create_class("Y")
+    similarities = {("A", "X"): 0.9, ("A", "Y"): 0.85, ("B", "X"): 0.95}
+    apiv1_elements, apiv2_elements = [class_a, class_b], [class_x, class_y]
+    if reverse:
+        apiv1_elements.reverse()
+        apiv2_elements.reverse()
+    similarity_rows = [
+        [
+            (position, similarities[(elementv1.name, elementv2.name)])
+            for position, elementv2 in enumerate(apiv2_elements)
+            if (elementv1.name, elementv2.name) in similarities
+        ]
+        for elementv1 in apiv1_elements
+    ]
+    api_mapping = APIMapping(
+        API("test", "test", "1.0"),
+        API("test", "test", "2.0"),
+        SimpleDiffer(None, [], API("test", "test", "1.0"), API("test", "test", "2.0")),
+        threshold_of_similarity_between_mappings=0.23,
+        optimal_assignment=True,
+    )
+
+    # Greedily, A would be mapped to X and Y and then merged with the mapping of B, since it also contains X.
+    mappings = api_mapping._get_mappings_by_assignment(apiv1_elements, apiv2_elements, similarity_rows)
+    assert [
+        (type(mapping), mapping.get_apiv1_elements(), mapping.get_apiv2_elements(), mapping.similarity)
+        for mapping in mappings
+    ] == [
+        (OneToOneMapping, [class_a], [class_y], 0.85),
+        (OneToOneMapping, [class_b], [class_x], 0.95),
+    ]
+
+
 def create_apis() -> tuple[API, API, Class, Class, Class]:
     class_1 = Class(
         id="test/test.Test",
@@ -197,3 +278,24 @@ def create_apis() -> tuple[API, API, Class, Class, Class]:
     apiv2.add_class(class_2)
     apiv2.add_class(class_3)
     return apiv1, apiv2, class_1, class_2, class_3
+
+
+def load_migration_apis() -> tuple[API, API]:
+    data_path = Path(__file__).parent / ".." / ".." / ".." / ".." / "data" / "migration"
+    with (data_path / "apiv1_data.json").open(encoding="utf-8") as apiv1_file:
+        apiv1 = API.from_dict(json.load(apiv1_file))
+    with (data_path / "apiv2_data.json").open(encoding="utf-8") as apiv2_file:
+        apiv2 = API.from_dict(json.load(apiv2_file))
+    return apiv1, apiv2
+
+
+def to_comparable(mappings: list[Mapping]) -> list[tuple[float, list[str], list[str], str]]:
+    return [
+        (
+            mapping.similarity,
+            [str(element.id) for element in mapping.get_apiv1_elements()],
+            [str(element.id) for element in mapping.get_apiv2_elements()],
+            type(mapping).__name__,
+        )
+        for mapping in mappings
+    ]
@@ -0,0 +1,63 @@
+from library_analyzer.processing.api.model import (
+    Attribute,
+    Function,
+    FunctionDocstring,
+    Parameter,
+    ParameterAssignment,
+    ParameterDocstring,
+)
+from library_analyzer.processing.migration.model import (
+    ManyToOneMapping,
+    MappingIndex,
+    OneToManyMapping,
+    OneToOneMapping,
+)
+
+
+def _create_function(function_id: str) -> Function:
+    return Function(
+        id=function_id,
+        qname=function_id.replace("/", "."),
+        decorators=[],
+        parameters=[],
+        results=[],
+        is_public=True,
+        reexported_by=[],
+        docstring=FunctionDocstring(),
+        code="",
+    )
+
+
+def _create_parameter(parameter_id: str) -> Parameter:
+    return Parameter(
+        id_=parameter_id,
+        name=parameter_id.rsplit("/", maxsplit=1)[-1],
+        qname=parameter_id.replace("/", "."),
+        default_value=None,
+        assigned_by=ParameterAssignment.POSITION_OR_NAME,
+        is_public=True,
+        docstring=ParameterDocstring(),
+    )
+
+
+def test_mapping_index() -> None:
+    functionv1 = _create_function("test/test/A/f")
+    attributev1 = Attribute("test/test/A/f", "f", None, "test/test/A")
+    parameterv1_a = _create_parameter("test/test/A/f/a")
+    parameterv1_b = _create_parameter("test/test/A/f/b")
+    functionv2 = _create_function("test/test/A/g")
+    parameterv2 = _create_parameter("test/test/A/g/a")
+
+    attribute_mapping = OneToOneMapping(1.0, attributev1, attributev1)
+    function_mapping = OneToOneMapping(0.9, functionv1, functionv2)
+    merged_parameter_mapping = ManyToOneMapping(0.8, [parameterv1_a, parameterv1_b], parameterv2)
+    parameter_mapping = OneToManyMapping(0.7, parameterv1_a, [parameterv2, parameterv2])
+    mapping_index = MappingIndex([attribute_mapping, function_mapping, merged_parameter_mapping, parameter_mapping])
+
+    assert mapping_index.get_mapping("test/test/A/f", Attribute) is attribute_mapping
+    assert mapping_index.get_mapping("test/test/A/f", (Function, Parameter)) is function_mapping
+    assert mapping_index.get_mapping("test/test/A/f/b", Parameter) is merged_parameter_mapping
+    assert mapping_index.get_mapping("test/test/A/f/b", Function) is None
+    assert mapping_index.get_mapping("test/test/A/g", Function) is None
+    assert mapping_index.get_mappings("test/test/A/f/a", Parameter) == [merged_parameter_mapping, parameter_mapping]
+    assert mapping_index.get_mappings("test/test/A/f/c", Parameter) == []
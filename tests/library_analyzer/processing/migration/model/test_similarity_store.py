@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from library_analyzer.processing.migration.model import (
+    APIMapping,
+    Mapping,
+    SimilarityStore,
+    SimpleDiffer,
+)
+
+from .test_mapping import load_migration_apis, to_comparable
+
+
+def test_similarity_store_persists_entries(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "similarities.sqlite"
+    with SimilarityStore(path) as similarity_store:
+        assert similarity_store.get_similarity("SimpleDiffer/1", "a", "b") is None
+        similarity_store.put_similarity("SimpleDiffer/1", "a", "b", 0.75)
+        assert similarity_store.get_similarity("SimpleDiffer/1", "a", "b") == 0.75
+
+    with SimilarityStore(path) as similarity_store:
+        assert similarity_store.get_similarity("SimpleDiffer/1", "a", "b") == 0.75
+        assert similarity_store.get_similarity("SimpleDiffer/1", "b", "a") is None
+        assert similarity_store.get_similarity("SimpleDiffer/2", "a", "b") is None
+        assert similarity_store.statistics.similarity_hits == 1
+        assert similarity_store.statistics.similarity_misses == 2
+
+
+def test_similarity_store_applies_updates_of_other_stores(tmp_path: Path) -> None:
+    path = tmp_path / "similarities.sqlite"
+    similarity_store = SimilarityStore(path)
+    worker_similarity_store = SimilarityStore(path)
+    worker_similarity_store.get_similarity("SimpleDiffer/1", "a", "b")
+    worker_similarity_store.put_similarity("SimpleDiffer/1", "a", "b", 0.5)
+
+    similarity_store.apply_updates(worker_similarity_store.take_updates())
+    similarity_store.close()
+
+    assert worker_similarity_store.statistics.similarity_misses == 0
+    assert similarity_store.statistics.similarity_misses == 1
+    with SimilarityStore(path) as reopened_similarity_store:
+        assert reopened_similarity_store.get_similarity("SimpleDiffer/1", "a", "b") == 0.5
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_map_api_reuses_stored_similarities(tmp_path: Path, processes: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("library_analyzer.processing.migration.model._api_mapping._MIN_PAIRS_FOR_PROCESSES", 0)
+    apiv1, apiv2 = load_migration_apis()
+    path = tmp_path / "similarities.sqlite"
+
+    def map_api(similarity_store: SimilarityStore | None) -> list[Mapping]:
+        differ = SimpleDiffer(None, [], apiv1, apiv2, similarity_store=similarity_store)
+        return APIMapping(apiv1, apiv2, differ, 0.61, 0.23, processes=processes).map_api()
+
+    expected_mappings = map_api(None)
+    with SimilarityStore(path) as similarity_store:
+        first_mappings = map_api(similarity_store)
+    assert similarity_store.statistics.similarity_hits == 0
+    assert similarity_store.statistics.similarity_misses > 0
+
+    with SimilarityStore(path) as similarity_store:
+        second_mappings = map_api(similarity_store)
+    assert similarity_store.statistics.similarity_misses == 0
+
+    assert len(expected_mappings) > 0
+    assert to_comparable(first_mappings) == to_comparable(expected_mappings)
+    assert to_comparable(second_mappings) == to_comparable(expected_mappings)
@@ -1,4 +1,5 @@
 from copy import deepcopy
+from dataclasses import replace
 from inspect import cleandoc
 
 from library_analyzer.processing.api.model import (
@@ -156,3 +157,37 @@ def test_similarity() -> None:
     assert unchanged_differ.compute_class_similarity(class_a, class_a) == 1
     assert unchanged_differ.compute_function_similarity(function_a, function_a) == 1
     assert unchanged_differ.compute_parameter_similarity(parameter_a, parameter_a) == 1
+
+
+def test_have_same_api_ignores_only_code() -> None:
+    functionv1 = Function(
+        id="test/test/f",
+        qname="test.f",
+        decorators=[],
+        parameters=[],
+        results=[],
+        is_public=True,
+        reexported_by=[],
+        docstring=FunctionDocstring("Description"),
+        code="def f():\n    pass\n",
+    )
+    functionv2 = Function(
+        id="test/test/f",
+        qname="test.f",
+        decorators=[],
+        parameters=[],
+        results=[],
+        is_public=True,
+        reexported_by=[],
+        docstring=FunctionDocstring("Description"),
+        code="def f():\n    return None\n",
+        formatted_code="def f():\n    return None\n",
+    )
+    decorated_functionv2 = replace(functionv2, decorators=["staticmethod"])
+    apiv1 = API("test", "test", "1.0")
+    apiv2 = API("test", "test", "2.0")
+    unchanged_differ = UnchangedDiffer(None, [], apiv1, apiv2)
+
+    assert unchanged_differ.have_same_api(functionv1, functionv2)
+    assert not unchanged_differ.have_same_api(functionv1, decorated_functionv2)
+    assert unchanged_differ.have_same_api(functionv1, deepcopy(functionv1))
@@ -0,0 +1,74 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from library_analyzer.processing.annotations import generate_annotations
+from library_analyzer.processing.annotations.model import AnnotationStore
+from library_analyzer.processing.api.model import API
+from library_analyzer.processing.usages.model import UsageCountStore
+from library_analyzer.utils import is_binary_artifact, read_binary_artifact, write_binary_artifact
+
+_data_path = Path(__file__).parent / ".." / ".." / "data"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {},
+        [],
+        "string",
+        {"b": 1, "a": [1, 2, 3], "c": {"z": "ä", "y": "\u0000"}},
+        [{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"b": "z", "a": 3}],
+        [{}, {}],
+        [[], [1], ["a", None, True, 1.5, 2**70], [[{"a": []}]]],
+        {"mixed": [1, "1", None, False, -(2**63), 2**63, {"a": 1}, [1]]},
+        {"ids": {"a/b": {"x": 1}, "a/c": {}, "a/d": {"x": 2, "y": 3}}},
+    ],
+    ids=[
+        "empty dictionary",
+        "empty list",
+        "string",
+        "nested dictionaries",
+        "records",
+        "empty records",
+        "nested lists",
+        "mixed values",
+        "mappings",
+    ],
+)
+def test_read_binary_artifact(tmp_path: Path, value: Any) -> None:
+    path = tmp_path / "artifact.bin"
+
+    write_binary_artifact(path, value)
+
+    assert is_binary_artifact(path)
+    # The order of the keys has to be the same, too
+    assert json.dumps(read_binary_artifact(path)) == json.dumps(value)
+
+
+def test_read_binary_artifact_with_json_file(tmp_path: Path) -> None:
+    path = tmp_path / "artifact.json"
+    path.write_text("{}", encoding="utf-8")
+
+    assert not is_binary_artifact(path)
+    with pytest.raises(ValueError, match="is not a binary artifact"):
+        read_binary_artifact(path)
+
+
+@pytest.mark.parametrize("subfolder", ["enumAnnotations", "valueAnnotations"])
+def test_binary_file(tmp_path: Path, subfolder: str) -> None:
+    api = API.from_json_file(_data_path / subfolder / "api_data.json")
+    usages = UsageCountStore.from_json_file(_data_path / subfolder / "usage_data.json")
+    annotations = generate_annotations(api, usages)
+
+    api.to_binary_file(tmp_path / "api.bin")
+    usages.to_binary_file(tmp_path / "usages.bin")
+    annotations.to_binary_file(tmp_path / "annotations.bin")
+
+    assert json.dumps(API.from_binary_file(tmp_path / "api.bin").to_dict()) == json.dumps(api.to_dict())
+    assert UsageCountStore.from_binary_file(tmp_path / "usages.bin") == usages
+    assert json.dumps(AnnotationStore.from_binary_file(tmp_path / "annotations.bin").to_dict()) == json.dumps(
+        annotations.to_dict(),
+    )
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from library_analyzer.processing.annotations.model import AnnotationStore, EnumReviewResult, RemoveAnnotation
+from library_analyzer.utils import LazyJsonArray, LazyJsonObject, read_json_file, write_json_file
+
+_value = {
+    "string": 'ä\n"quoted"',
+    "empty_object": {},
+    "empty_array": [],
+    "nested": {"numbers": [1, 2.5, None, True], "object": {"key": "value"}},
+}
+
+
+def _lazy_value() -> LazyJsonObject:
+    return LazyJsonObject(
+        [
+            ("string", _value["string"]),
+            ("empty_object", LazyJsonObject([])),
+            ("empty_array", LazyJsonArray(iter([]))),
+            (
+                "nested",
+                LazyJsonObject(
+                    (key, LazyJsonArray(iter(value)) if isinstance(value, list) else value)
+                    for key, value in _value["nested"].items()
+                ),
+            ),
+        ],
+    )
+
+
+def test_write_json_file_is_like_json_dump(tmp_path: Path) -> None:
+    path = tmp_path / "value.json"
+
+    write_json_file(path, _lazy_value())
+
+    assert path.read_text(encoding="utf-8") == json.dumps(_value, indent=2)
+
+
+def test_write_json_file_compact(tmp_path: Path) -> None:
+    path = tmp_path / "value.json"
+
+    write_json_file(path, _lazy_value(), compact=True)
+
+    assert path.read_text(encoding="utf-8") == json.dumps(_value, separators=(",", ":"))
+
+
+@pytest.mark.parametrize("compact", [True, False])
+def test_read_json_file_with_compression(tmp_path: Path, compact: bool) -> None:
+    path = tmp_path / "value.json.gz"
+
+    write_json_file(path, _lazy_value(), compact=compact, compress=True)
+
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert read_json_file(path) == _value
+
+
+def test_annotation_store_to_json_file_keeps_last_annotation_of_target(tmp_path: Path) -> None:
+    annotations = AnnotationStore()
+    for target, comment in [("a", "first"), ("b", "other"), ("a", "last")]:
+        annotations.add_annotation(
+            RemoveAnnotation(
+                target=target,
+                authors=[],
+                reviewers=[],
+                comment=comment,
+                reviewResult=EnumReviewResult.NONE,
+            ),
+        )
+    path = tmp_path / "annotations.json.gz"
+
+    annotations.to_json_file(path, compress=True)
+
+    assert read_json_file(path) == annotations.to_dict()
+    assert AnnotationStore.from_json_file(path).to_dict() == annotations.to_dict()
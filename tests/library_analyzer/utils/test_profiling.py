@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from library_analyzer.processing.api.purity_analysis import get_purity_results
+from library_analyzer.utils import Profiler, profile
+
+
+def test_profile_without_active_profiler() -> None:
+    with profile("phase", "module"):
+        pass
+
+    profiler = Profiler()
+    with profiler, profile("phase"):
+        pass
+    with profile("phase"):
+        pass
+
+    assert profiler.phases["phase"].calls == 1
+
+
+def test_profiler_nested_phases() -> None:
+    with Profiler(top_n=1) as profiler:
+        with profile("outer"):
+            with profile("inner", "small"):
+                _ = [0] * 1000
+            with profile("inner", "large"):
+                _ = [0] * 100000
+        with profile("outer"):
+            pass
+
+    assert profiler.phases["outer"].calls == 2
+    assert profiler.phases["inner"].calls == 2
+    assert profiler.phases["outer"].wall_time >= profiler.phases["inner"].wall_time
+    assert profiler.phases["outer"].peak_memory >= profiler.modules["inner"]["large"].peak_memory
+    assert profiler.modules["inner"]["large"].peak_memory > profiler.modules["inner"]["small"].peak_memory
+    assert len(profiler.slowest_modules("inner")) == 1
+
+
+def test_profiler_without_memory_tracking() -> None:
+    with Profiler(track_memory=False) as profiler, profile("phase"):
+        pass
+
+    assert profiler.phases["phase"].peak_memory is None
+
+
+def test_profiler_purity_analysis(tmp_path: Path) -> None:
+    package = tmp_path / "profiled"
+    package.mkdir()
+    (package / "a.py").write_text("def f():\n    return 1\n")
+    (package / "b.py").write_text("import math\n\ndef g(x):\n    return math.floor(x)\n")
+
+    with Profiler() as profiler:
+        get_purity_results(package)
+    profile_file = tmp_path / "profile.json"
+    profiler.to_json_file(profile_file)
+
+    profile_dict = json.loads(profile_file.read_text())
+    assert {"get_module_data", "resolve_references", "build_call_graph", "handle_cycles", "analyze_purity"} <= set(
+        profile_dict["phases"],
+    )
+    assert set(profile_dict["modules"]["get_module_data"]) >= {"profiled.a", "profiled.b"}
+    assert profile_dict["slowest_modules"]["get_module_data"][0]["calls"] >= 1
@@ -201,9 +201,8 @@ def test_migrate_all_annotations() -> None:
 
     unsure_migrated_annotations = migration.unsure_migrated_annotation_store.to_dict()
     assert len(unsure_migrated_annotations["todoAnnotations"]) == 3
-    migration.migrated_annotation_store.todoAnnotations.extend(
-        migration.unsure_migrated_annotation_store.todoAnnotations,
-    )
+    for todo_annotation in migration.unsure_migrated_annotation_store.todoAnnotations:
+        migration.migrated_annotation_store.add_annotation(todo_annotation)
     unsure_migrated_annotations["todoAnnotations"] = []
 
     for value in unsure_migrated_annotations.values():
@@ -381,6 +380,27 @@ def test_handle_duplicates() -> None:
     }
 
 
+def test_handle_duplicates_in_both_annotation_stores() -> None:
+    kept_annotation = TodoAnnotation("test/test/f", [""], [""], "", EnumReviewResult.NONE, "todo")
+    conflicting_annotation = TodoAnnotation("test/test/f", [""], [""], "", EnumReviewResult.UNSURE, "other")
+    other_annotation = TodoAnnotation("test/test/g", [""], [""], "", EnumReviewResult.NONE, "todo")
+    migration = Migration(AnnotationStore(), [])
+    migration.migrated_annotation_store.todoAnnotations = [kept_annotation, other_annotation]
+    migration.unsure_migrated_annotation_store.todoAnnotations = [
+        conflicting_annotation,
+        deepcopy(conflicting_annotation),
+        deepcopy(kept_annotation),
+    ]
+
+    migration._handle_duplicates()
+
+    assert migration.migrated_annotation_store.todoAnnotations == [kept_annotation, other_annotation]
+    assert migration.unsure_migrated_annotation_store.todoAnnotations == []
+    assert kept_annotation.comment == "Conflicting attribute found during migration: {'newTodo': 'other'}"
+    assert kept_annotation.reviewResult == EnumReviewResult.UNSURE
+    assert other_annotation.reviewResult == EnumReviewResult.NONE
+
+
 def test_was_moved() -> None:
     move_annotation = MoveAnnotation(
         target="test/test.move.test_was_moved.test/test",